@@ -0,0 +1,222 @@
+"""
+Pre-serialized challenge catalog responses.
+
+The catalog only changes on deploy, so the list and detail payloads for
+every language are encoded once (plus a gzip copy) with a strong ETag, and
+served as raw bytes with ``If-None-Match``/304 support.  Shared by the v1
+and v2 challenge endpoints.
+
+Lists are rendered at import from the bundle index; a detail payload is
+rendered the first time it is requested and kept in a bounded LRU cache
+(``CATALOG_DETAIL_CACHE_SIZE``), so startup never loads the challenge
+bodies.  The same applies to the bundles that carry every challenge of a
+language (optionally one chapter) in a single response.
+"""
+import functools
+import gzip
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from challenges import CHALLENGES
+
+
+LANGUAGES = ("en", "es")
+
+CATALOG_CACHE_CONTROL = os.environ.get(
+    "CATALOG_CACHE_CONTROL",
+    "public, max-age=3600, stale-while-revalidate=86400",
+)
+CATALOG_GZIP = os.environ.get("CATALOG_GZIP", "true").strip().lower() in {
+    "1", "true", "yes", "on",
+}
+# Smaller bodies aren't worth the Content-Encoding overhead.
+GZIP_MIN_BYTES = 1024
+CATALOG_DETAIL_CACHE_SIZE = int(os.environ.get("CATALOG_DETAIL_CACHE_SIZE", "256"))
+
+NOT_FOUND_BODY = b'{"error":"Challenge not found"}'
+CHAPTER_NOT_FOUND_BODY = b'{"error":"Chapter not found"}'
+
+
+def _localized_title(challenge, lang: str) -> str:
+    if lang == "es" and getattr(challenge, "title_es", None):
+        return challenge.title_es
+    return challenge.title
+
+
+def _localized_description(challenge, lang: str) -> str:
+    if lang == "es" and getattr(challenge, "description_es", None):
+        return challenge.description_es
+    return challenge.description
+
+
+def _localized_starter_code(challenge, lang: str) -> str:
+    if lang == "es" and getattr(challenge, "starter_code_es", None):
+        return challenge.starter_code_es
+    return challenge.starter_code or ""
+
+
+def challenge_list_payload(lang: str) -> dict:
+    return {
+        "challenges": [
+            {"id": c.id, "title": _localized_title(c, lang)}
+            for c in CHALLENGES.summaries()
+        ]
+    }
+
+
+def challenge_detail_payload(challenge, lang: str) -> dict:
+    return {
+        "id": challenge.id,
+        "title": _localized_title(challenge, lang),
+        "description": _localized_description(challenge, lang),
+        "starter_code": _localized_starter_code(challenge, lang),
+        "test_count": len(challenge.tests),
+    }
+
+
+def _localized_chapter_title(chapter: dict, lang: str) -> str:
+    if lang == "es" and chapter.get("title_es"):
+        return chapter["title_es"]
+    return chapter["title"]
+
+
+def challenge_bundle_payload(lang: str, chapter_id: Optional[str] = None) -> dict:
+    """Every challenge's detail payload, grouped by chapter, in one object."""
+    chapters = [
+        chapter for chapter in CHALLENGES.chapters
+        if chapter_id is None or chapter["id"] == chapter_id
+    ]
+    payload = {"lang": lang, "chapters": [], "challenges": []}
+    for chapter in chapters:
+        challenges = CHALLENGES.chapter(chapter["id"])
+        payload["chapters"].append({
+            "id": chapter["id"],
+            "title": _localized_chapter_title(chapter, lang),
+            "challenges": list(challenges),
+        })
+        payload["challenges"].extend(
+            challenge_detail_payload(challenge, lang)
+            for challenge in challenges.values()
+        )
+    return payload
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding value allows gzip; ``q=0`` refuses it."""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name in ("gzip", "x-gzip"):
+            return quality > 0
+        if name == "*":
+            wildcard = quality > 0
+    return wildcard
+
+
+class RenderedPayload:
+    """Encoded JSON body, its optional gzip copy and their ETags."""
+
+    __slots__ = ("body", "gzipped", "etag", "gzip_etag")
+
+    def __init__(self, payload: dict):
+        self.body = json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":"),
+        ).encode("utf-8")
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzipped: Optional[bytes] = None
+        self.gzip_etag = f'"{digest}-gzip"'
+        if CATALOG_GZIP and len(self.body) >= GZIP_MIN_BYTES:
+            self.gzipped = gzip.compress(self.body, compresslevel=9, mtime=0)
+
+    def matches(self, if_none_match: str) -> bool:
+        """Weak comparison, as RFC 9110 requires for If-None-Match."""
+        tags = {
+            tag.strip().removeprefix("W/")
+            for tag in if_none_match.split(",")
+        }
+        return "*" in tags or self.etag in tags or self.gzip_etag in tags
+
+    def response(self, request: Request) -> Response:
+        use_gzip = self.gzipped is not None and accepts_gzip(
+            request.headers.get("accept-encoding", "")
+        )
+        headers = {
+            "ETag": self.gzip_etag if use_gzip else self.etag,
+            "Cache-Control": CATALOG_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+            return Response(
+                self.gzipped, media_type="application/json", headers=headers,
+            )
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+def _normalize_lang(lang: str) -> str:
+    return "es" if lang == "es" else "en"
+
+
+_LISTS: Dict[str, RenderedPayload] = {
+    lang: RenderedPayload(challenge_list_payload(lang)) for lang in LANGUAGES
+}
+
+
+@functools.lru_cache(maxsize=CATALOG_DETAIL_CACHE_SIZE)
+def _detail(challenge_id: str, lang: str) -> RenderedPayload:
+    return RenderedPayload(
+        challenge_detail_payload(CHALLENGES[challenge_id], lang)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _bundle(lang: str, chapter_id: Optional[str]) -> RenderedPayload:
+    # Bounded by LANGUAGES x (chapters + 1); chapter ids are checked first.
+    return RenderedPayload(challenge_bundle_payload(lang, chapter_id))
+
+
+def list_response(request: Request, lang: str) -> Response:
+    return _LISTS[_normalize_lang(lang)].response(request)
+
+
+def detail_response(request: Request, challenge_id: str, lang: str) -> Response:
+    if challenge_id not in CHALLENGES:
+        return Response(
+            NOT_FOUND_BODY,
+            media_type="application/json",
+            headers={"Cache-Control": "no-cache"},
+        )
+    return _detail(challenge_id, _normalize_lang(lang)).response(request)
+
+
+def bundle_response(
+    request: Request, lang: str, chapter_id: Optional[str] = None,
+) -> Response:
+    if chapter_id is not None and not any(
+        chapter["id"] == chapter_id for chapter in CHALLENGES.chapters
+    ):
+        return Response(
+            CHAPTER_NOT_FOUND_BODY,
+            media_type="application/json",
+            headers={"Cache-Control": "no-cache"},
+        )
+    return _bundle(_normalize_lang(lang), chapter_id).response(request)
@@ -3,31 +3,61 @@ Playground API: GHCi sessions and challenges under /api/playground.
 """
 import atexit
 import asyncio
-import fcntl
+import functools
 import logging
 import os
+import re
 import resource
-import select
+import secrets
+import shlex
+import textwrap
 import time
 from subprocess import Popen, PIPE, STDOUT
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
+import metrics
+from api import catalog
+from api.responses import FastJSONResponse
 from auth import require_current_user
+from structured_logging import log_payload
 from challenges import CHALLENGES
 from schemas.playground import TestResult, SubmitRequest, EvalRequest
 
 
 # --- Router ---
-router = APIRouter(prefix="/api/playground")
+router = APIRouter(
+    prefix="/api/playground", default_response_class=FastJSONResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 # Store sessions: session_id -> process info
 sessions: Dict[str, Dict] = {}
 
-GHCI_PROMPT = "ghci> "
+# Command used to launch GHCi. Point it at tests/fake_ghci.py (e.g.
+# "python3 tests/fake_ghci.py") to run the backend without GHC installed.
+GHCI_EXECUTABLE = os.environ.get("GHCI_EXECUTABLE", "ghci")
+# Output (stdout and stderr together) one command may produce before its
+# GHCi process is killed; keeps a runaway `[1..]` from filling memory.
+GHCI_MAX_OUTPUT_BYTES = int(
+    os.environ.get("GHCI_MAX_OUTPUT_BYTES", str(1024 * 1024))
+)
+
+GHCI_READ_TIMEOUTS = metrics.Counter(
+    "haskellito_ghci_read_timeouts",
+    "GHCi commands that timed out before the prompt came back.",
+)
+GHCI_OUTPUT_LIMIT_KILLS = metrics.Counter(
+    "haskellito_ghci_output_limit_kills",
+    "GHCi processes killed for exceeding GHCI_MAX_OUTPUT_BYTES.",
+)
+V1_LIVE_SESSIONS = metrics.Gauge(
+    "haskellito_v1_live_sessions",
+    "GHCi processes currently held by v1 playground sessions.",
+    callback=lambda: [((), len(sessions))],
+)
 
 # Dangerous GHCi commands that could escape the sandbox
 DANGEROUS_COMMANDS = [
@@ -53,149 +83,437 @@ def set_resource_limits():
     resource.setrlimit(resource.RLIMIT_CPU, (60, 60))
 
 
+def _dangerous_alternative(cmd: str) -> str:
+    pattern = f"({re.escape(cmd)})"
+    if cmd != cmd.rstrip():
+        # Trailing whitespace on a line never counts, so ':l ' only
+        # matches when something follows the space.
+        pattern += r"(?=[^\n]*\S)"
+    return pattern
+
+
+# One pass over the whole text: a line is dangerous when, after leading
+# whitespace, it starts with any entry of DANGEROUS_COMMANDS.  Alternatives
+# keep the list's order, so the reported command is the one a line-by-line
+# check would find first.
+_DANGEROUS_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    + "|".join(_dangerous_alternative(cmd) for cmd in DANGEROUS_COMMANDS)
+    + ")",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Verdicts for recently seen commands.  History is replayed on every v2
+# eval, so the same short lines are checked over and over; the cache is keyed
+# by the command text (through its hash), and texts longer than
+# DANGEROUS_VERDICT_MAX_CHARS are always scanned so large submissions are
+# not kept alive by it.
+DANGEROUS_VERDICT_CACHE_SIZE = int(
+    os.environ.get("DANGEROUS_VERDICT_CACHE_SIZE", "2048")
+)
+DANGEROUS_VERDICT_MAX_CHARS = int(
+    os.environ.get("DANGEROUS_VERDICT_MAX_CHARS", "4096")
+)
+
+
+def _scan_dangerous(code: str) -> tuple[bool, str]:
+    if ":" not in code:
+        return False, ""
+    match = _DANGEROUS_RE.search(code)
+    if match is None:
+        return False, ""
+    return True, DANGEROUS_COMMANDS[match.lastindex - 1]
+
+
+_cached_verdict = functools.lru_cache(maxsize=DANGEROUS_VERDICT_CACHE_SIZE)(
+    _scan_dangerous
+)
+
+
 def is_dangerous_command(code: str) -> tuple[bool, str]:
     """Check if the code contains dangerous GHCi commands. Returns (is_dangerous, matched_command)."""
-    for line in code.split('\n'):
-        line_stripped = line.strip().lower()
-        for cmd in DANGEROUS_COMMANDS:
-            if line_stripped.startswith(cmd.lower()):
-                return True, cmd
-            if cmd == ':r' and (line_stripped == ':r' or line_stripped.startswith(':r ')):
-                return True, cmd
-    return False, ""
-
-
-def drain_pipe(pipe) -> str:
-    """Drain any pending data from a pipe without blocking."""
-    if pipe is None:
-        return ""
-    drained = []
-    fd = pipe.fileno()
-    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-    try:
+    if len(code) <= DANGEROUS_VERDICT_MAX_CHARS:
+        return _cached_verdict(code)
+    return _scan_dangerous(code)
+
+
+class GhciResponse:
+    """One command's output, split by the stream it arrived on."""
+
+    __slots__ = ("stdout", "stderr")
+
+    def __init__(self, stdout: str, stderr: str = ""):
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def text(self) -> str:
+        """Both streams, results first, as one string for display."""
+        if not self.stderr:
+            return self.stdout
+        if not self.stdout:
+            return self.stderr
+        return f"{self.stdout}\n{self.stderr}"
+
+
+class GhciChannel:
+    """
+    Framed commands and responses over one GHCi process's pipes.
+
+    Every command is sent together with a ``:set prompt`` to a new prompt
+    carrying a fresh random nonce, so the prompt that ends each response is
+    unique and cannot be predicted by user code.  GHCi prints the old prompt
+    after the command and the new one after the ``:set``; the response is
+    what comes before that pair.  A response that does not end that way, or
+    never ends (a timeout, or user code reading stdin and swallowing the
+    ``:set`` line), leaves the framing unknown: the process is killed and
+    the channel refuses further commands, so it must be replaced.
+
+    When the process has its own stderr pipe, both pipes are watched by the
+    event loop and read as data arrives, so neither can fill up and stall
+    GHCi.  GHCi writes a command's diagnostics before printing the prompt,
+    so everything on stderr when the prompt shows up belongs to that
+    response.
+
+    The pipes are only watched while ``receive()`` waits, and a response
+    may hold at most ``max_output_bytes``: past that the process is killed
+    and the channel refuses further commands.
+    """
+
+    READ_BYTES = 65536
+
+    def __init__(self, process: Popen, max_output_bytes: Optional[int] = None):
+        self.process = process
+        self.max_output_bytes = (
+            GHCI_MAX_OUTPUT_BYTES if max_output_bytes is None
+            else max_output_bytes
+        )
+        self._failure: Optional[str] = None
+        self._previous_prompt = b""
+        self._prompt = b""
+        self._stdout = bytearray()
+        self._stderr = bytearray()
+        self._stdout_fd = process.stdout.fileno()
+        self._stderr_fd = process.stderr.fileno() if process.stderr else None
+        self._open_fds = {self._stdout_fd}
+        if self._stderr_fd is not None:
+            self._open_fds.add(self._stderr_fd)
+        for fd in self._open_fds:
+            os.set_blocking(fd, False)
+        self._loop: "asyncio.AbstractEventLoop | None" = None
+        self._waiter: "asyncio.Future[None] | None" = None
+
+    def send(self, command: str = "") -> None:
+        """Write ``command`` (one or more lines) and frame its response."""
+        if self._failure is not None:
+            raise Exception(self._failure)
+        if command and not command.endswith("\n"):
+            command += "\n"
+        prompt = f"[haskellito:{secrets.token_hex(8)}] "
+        self._previous_prompt, self._prompt = self._prompt, prompt.encode()
+        self.process.stdin.write(f'{command}:set prompt "{prompt}"\n')
+        self.process.stdin.flush()
+
+    async def start(self, timeout: float) -> GhciResponse:
+        """Switch a freshly started GHCi to framed prompts; return its banner."""
+        try:
+            self.send()
+        except BrokenPipeError:
+            pass  # GHCi already exited; receive() reports what it printed.
+        return await self.receive(timeout)
+
+    async def receive(self, timeout: float = 10.0) -> GhciResponse:
+        """Read the response to the last command sent."""
+        loop = asyncio.get_running_loop()
+        self._watch(loop)
+        deadline = loop.time() + timeout
+        searched = 0
         while True:
-            ready, _, _ = select.select([fd], [], [], 0)
-            if not ready:
+            if self._failure is not None:
+                raise Exception(self._failure)
+            end = self._stdout.find(self._prompt, searched)
+            if end >= 0:
                 break
-            chunk = os.read(fd, 4096)
+            if self._stdout_fd not in self._open_fds:
+                raise Exception(self._eof_message())
+            searched = max(len(self._stdout) - len(self._prompt) + 1, 0)
+            if loop.time() >= deadline:
+                GHCI_READ_TIMEOUTS.inc()
+                self._fail(f"GHCi read timed out after {timeout}s")
+                raise Exception(self._failure)
+            self._waiter = loop.create_future()
+            timer = loop.call_at(deadline, self._wake)
+            try:
+                await self._waiter
+            finally:
+                timer.cancel()
+                self._waiter = None
+
+        frame = bytes(self._stdout[:end])
+        del self._stdout[:end + len(self._prompt)]
+        previous = self._previous_prompt
+        if previous:
+            if not frame.endswith(previous):
+                self._fail("GHCi response was not framed by its prompt")
+                raise Exception(self._failure)
+            frame = frame[:-len(previous)]
+        stderr = self._take_stderr()
+        if self._failure is not None:
+            raise Exception(self._failure)
+        return GhciResponse(frame.decode(errors="replace").strip(), stderr)
+
+    def close(self) -> None:
+        """Stop watching the pipes; call before dropping the process."""
+        if self._loop is not None and not self._loop.is_closed():
+            for fd in self._open_fds:
+                self._loop.remove_reader(fd)
+        self._loop = None
+
+    def _watch(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is loop:
+            return
+        self.close()
+        self._loop = loop
+        for fd in self._open_fds:
+            loop.add_reader(fd, self._on_readable, fd)
+
+    def _on_readable(self, fd: int) -> None:
+        self._read_available(fd)
+        if fd == self._stdout_fd:
+            self._wake()
+
+    def _read_available(self, fd: int) -> None:
+        buffer = self._stdout if fd == self._stdout_fd else self._stderr
+        while True:
+            try:
+                chunk = os.read(fd, self.READ_BYTES)
+            except BlockingIOError:
+                return
+            except OSError:
+                chunk = b""
             if not chunk:
-                break
-            drained.append(chunk.decode(errors="replace"))
-    except (BlockingIOError, IOError):
-        pass
-    finally:
-        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
-    return ''.join(drained)
-
-
-async def read_until_prompt(process: Popen, timeout: float = 10.0) -> str:
-    """Read from process stdout until we see the GHCi prompt."""
-    start_time = time.time()
-    buffer = ""
-    while True:
-        elapsed = time.time() - start_time
-        if elapsed >= timeout:
-            logger.warning(f"read_until_prompt timed out after {timeout}s")
-            raise Exception(f"read_until_prompt timed out after {timeout}s")
-        wait_time = min(timeout - elapsed, 0.1)
-        fd = process.stdout.fileno()
-        ready, _, _ = await asyncio.to_thread(
-            select.select,
-            [fd],
-            [],
-            [],
-            wait_time,
-        )
-        if not ready:
-            continue
-
-        chunk = os.read(fd, 4096)
-        if not chunk:
-            return_code = process.poll()
-            message = "EOF reached while reading from GHCi before prompt"
-            if return_code is not None:
-                message += f" (returncode={return_code})"
-            if buffer.strip():
-                message += f"; output: {buffer.strip()}"
-            logger.warning(message)
-            raise Exception(message)
-
-        buffer += chunk.decode(errors="replace")
-        if buffer.endswith(GHCI_PROMPT):
-            result = buffer[:-len(GHCI_PROMPT)].strip()
-            logger.info(f"Got output before prompt: {result}")
-            return result
-    return buffer.strip()
-
-
-async def read_output(process: Popen, timeout: float = 10.0) -> str:
-    """Read GHCi output after sending a command until prompt appears."""
-    return await read_until_prompt(process, timeout=timeout)
-
-
-def strip_ghci_continuation_prompts(output: str) -> str:
+                self._open_fds.discard(fd)
+                if self._loop is not None and not self._loop.is_closed():
+                    self._loop.remove_reader(fd)
+                return
+            buffer += chunk
+            if len(self._stdout) + len(self._stderr) > self.max_output_bytes:
+                GHCI_OUTPUT_LIMIT_KILLS.inc()
+                self._fail(
+                    f"GHCi output exceeded {self.max_output_bytes} bytes"
+                )
+                return
+            if len(chunk) < self.READ_BYTES:
+                return
+
+    def _fail(self, message: str) -> None:
+        """Stop reading, kill the process and refuse further commands."""
+        logger.warning("%s; killing pid %s", message, self.process.pid)
+        self._failure = message
+        self.close()
+        self._open_fds.clear()
+        self._stdout.clear()
+        self._stderr.clear()
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _take_stderr(self) -> str:
+        if self._stderr_fd in self._open_fds:
+            self._read_available(self._stderr_fd)
+        if not self._stderr:
+            return ""
+        text = self._stderr.decode(errors="replace").strip()
+        self._stderr.clear()
+        return text
+
+    def _eof_message(self) -> str:
+        return_code = self.process.poll()
+        message = "EOF reached while reading from GHCi before prompt"
+        if return_code is not None:
+            message += f" (returncode={return_code})"
+        output = GhciResponse(
+            self._stdout.decode(errors="replace").strip(), self._take_stderr(),
+        ).text
+        if output:
+            message += f"; output: {output}"
+        logger.warning(message)
+        return message
+
+
+# Continuation prompts GHCi echoes for each line of a :{ ... :} block.
+_KNOWN_CONTINUATION_PROMPTS_RE = re.compile(
+    r"Prelude Empty\| |ghci\| |Prelude\| "
+)
+
+
+def _continuation_prompt_re(space: str) -> "re.Pattern[str]":
+    # Generic "ModuleName| " prompts: a run of words ending in "|".  The
+    # second alternative keeps everything up to the next prompt: whole runs
+    # that do not end in "|" and the separators after them.  The scan never
+    # restarts inside a run (a plain r"\b[\w.]+(?:\s+[\w.]+)*\|\s*" is
+    # quadratic in its length) and there is one match per prompt, not per
+    # word.
+    words = rf"\b[\w.]++(?:{space}+[\w.]++)*+"
+    return re.compile(rf"{words}\|{space}*|((?:{words}(?!\|)[^\w.]*+)++)")
+
+
+_CONTINUATION_PROMPT_RE = _continuation_prompt_re(r"\s")
+_LINE_CONTINUATION_PROMPT_RE = _continuation_prompt_re(r"[^\S\n]")
+
+
+def strip_ghci_continuation_prompts(
+    output: str, preserve_newlines: bool = False,
+) -> str:
     """
     Remove GHCi continuation prompts from multiline output.
     When using :{ ... :} blocks, GHCi echoes prompts like 'Prelude Empty| '
     for each line. We strip these so the user sees only the actual output.
+
+    All whitespace is collapsed to single spaces unless preserve_newlines is
+    set, in which case lines (and their indentation) are kept, trailing
+    spaces and surrounding blank lines are dropped, and a prompt never
+    swallows text from the previous line.
     """
-    import re
-    # Remove known continuation prompts (literal strings)
-    for prompt in ("Prelude Empty| ", "ghci| ", "Prelude| "):
-        output = output.replace(prompt, "")
-    # Also match generic "ModuleName| " pattern for other loaded modules
-    output = re.sub(r'\b[\w.]+(?:\s+[\w.]+)*\|\s*', '', output)
-    return ' '.join(output.split()).strip()
+    if "|" in output:
+        output = _KNOWN_CONTINUATION_PROMPTS_RE.sub("", output)
+        prompts = (
+            _LINE_CONTINUATION_PROMPT_RE if preserve_newlines
+            else _CONTINUATION_PROMPT_RE
+        )
+        output = prompts.sub(r"\1", output)
+    if preserve_newlines:
+        return "\n".join(line.rstrip() for line in output.splitlines()).strip("\n")
+    return " ".join(output.split())
+
+
+# "<file>:<line>:<col>[-<col>]: error: [GHC-88464] ..." or, for spans over
+# several lines, "<file>:(<line>,<col>)-(<line>,<col>): warning: ...".
+_DIAGNOSTIC_HEADER_RE = re.compile(
+    r"^(?P<file>[^\s:][^:\n]*):"
+    r"(?:(?P<line>\d+):(?P<column>\d+)(?:-\d+)?"
+    r"|\((?P<span_line>\d+),(?P<span_column>\d+)\)-\(\d+,\d+\)): "
+    r"(?P<severity>error|warning):(?P<rest>[^\n]*)$",
+    re.MULTILINE,
+)
+_DIAGNOSTIC_TAG_RE = re.compile(r"\s*\[([^\]\n]*)\]")
+
+
+def _diagnostic(
+    severity: str, message: str, file: Optional[str] = None,
+    line: Optional[int] = None, column: Optional[int] = None,
+    code: Optional[str] = None,
+) -> Dict[str, Any]:
+    return {
+        "severity": severity,
+        "file": file,
+        "line": line,
+        "column": column,
+        "code": code,
+        "message": message,
+    }
 
 
-def _localized_title(challenge, lang: str) -> str:
-    if lang == "es" and getattr(challenge, "title_es", None):
-        return challenge.title_es
-    return challenge.title
+def parse_ghc_diagnostics(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Split GHCi's stderr into structured diagnostics.
+
+    Each "file:line:col: error|warning:" block becomes one entry; its code is
+    the first bracketed tag ("GHC-88464", or a warning flag on older GHCs).
+    Anything else on stderr (a runtime "*** Exception: ...") is reported as
+    an error without a location.
+    """
+    diagnostics: List[Dict[str, Any]] = []
+    if not stderr.strip():
+        return diagnostics
+    headers = list(_DIAGNOSTIC_HEADER_RE.finditer(stderr))
+    leading = stderr[:headers[0].start()] if headers else stderr
+    if leading.strip():
+        diagnostics.append(_diagnostic("error", leading.strip()))
+    for i, header in enumerate(headers):
+        body_end = headers[i + 1].start() if i + 1 < len(headers) else len(stderr)
+        rest = header["rest"]
+        code = None
+        tag = _DIAGNOSTIC_TAG_RE.match(rest)
+        while tag:
+            code = code or tag.group(1)
+            rest = rest[tag.end():]
+            tag = _DIAGNOSTIC_TAG_RE.match(rest)
+        # The body is indented; an unindented line after it is something else.
+        body = stderr[header.end():body_end]
+        unindented = re.search(r"^\S", body, re.MULTILINE)
+        trailing = ""
+        if unindented:
+            body, trailing = body[:unindented.start()], body[unindented.start():]
+        message = "\n".join(
+            part for part in (rest.strip(), textwrap.dedent(body).strip()) if part
+        )
+        diagnostics.append(_diagnostic(
+            header["severity"],
+            message,
+            file=header["file"],
+            line=int(header["line"] or header["span_line"]),
+            column=int(header["column"] or header["span_column"]),
+            code=code,
+        ))
+        if trailing.strip():
+            diagnostics.append(_diagnostic("error", trailing.strip()))
+    return diagnostics
 
 
-def _localized_description(challenge, lang: str) -> str:
-    if lang == "es" and getattr(challenge, "description_es", None):
-        return challenge.description_es
-    return challenge.description
+def has_errors(diagnostics: List[Dict[str, Any]]) -> bool:
+    return any(d["severity"] == "error" for d in diagnostics)
 
 
-def _localized_starter_code(challenge, lang: str) -> str:
-    if lang == "es" and getattr(challenge, "starter_code_es", None):
-        return challenge.starter_code_es
-    return challenge.starter_code or ""
+def _ghci_command(*extra_args: str) -> List[str]:
+    """Build the GHCi command line, honouring GHCI_EXECUTABLE."""
+    return [
+        "timeout", "3600",
+        *shlex.split(GHCI_EXECUTABLE),
+        "-XSafe", "+RTS", "-M64m", "-RTS",
+        *extra_args,
+    ]
 
 
 def _start_ghci_process() -> Popen:
     """Start a fresh GHCi process with resource limits. Caller must kill it when done."""
     process = Popen(
-        ["timeout", "3600", "ghci", "-XSafe", "+RTS", "-M64m", "-RTS",  "-ghci-script", "ghci.ghci"],
+        _ghci_command("-ghci-script", "ghci.ghci"),
         stdin=PIPE,
         stdout=PIPE,
-        stderr=STDOUT,
+        stderr=PIPE,
         text=True,
         bufsize=1,
         preexec_fn=set_resource_limits,
     )
-    process.stdin.write(f':set prompt "{GHCI_PROMPT}"\n')
-    process.stdin.flush()
     return process
 
 
 def cleanup_playground_sessions():
     """Clean up all GHCi processes (sessions). Call on shutdown."""
-    logger.info(f"Cleaning up {len(sessions)} playground sessions...")
+    logger.info("Cleaning up %d playground sessions...", len(sessions))
     for session_id, info in list(sessions.items()):
         try:
             info["process"].kill()
             info["process"].wait(timeout=5)
-            logger.info(f"Cleaned up session {session_id}")
+            logger.info("Cleaned up session %s", session_id)
         except Exception as e:
-            logger.error(f"Error cleaning up session {session_id}: {e}")
+            logger.error("Error cleaning up session %s: %s", session_id, e)
     sessions.clear()
 
 
+def _forget_session(session_id: str):
+    """Drop a session whose process is gone or being killed."""
+    info = sessions.pop(session_id)
+    info["channel"].close()
+
+
 atexit.register(cleanup_playground_sessions)
 
 
@@ -204,7 +522,7 @@ atexit.register(cleanup_playground_sessions)
 async def start_session():
     session_id = str(uuid4())
     process = Popen(
-        ["timeout", "3600", "ghci", "-XSafe", "+RTS", "-M64m", "-RTS"],
+        _ghci_command(),
         stdin=PIPE,
         stdout=PIPE,
         stderr=STDOUT,
@@ -212,10 +530,11 @@ async def start_session():
         bufsize=1,
         preexec_fn=set_resource_limits,
     )
-    sessions[session_id] = {"process": process, "last_used": time.time()}
-    process.stdin.write(f':set prompt "{GHCI_PROMPT}"\n')
-    process.stdin.flush()
-    await read_until_prompt(process)
+    channel = GhciChannel(process)
+    sessions[session_id] = {
+        "process": process, "channel": channel, "last_used": time.time(),
+    }
+    await channel.start(timeout=10)
     return {"session_id": session_id}
 
 
@@ -224,39 +543,40 @@ async def start_session():
     dependencies=[Depends(require_current_user)],
 )
 async def evaluate_code(session_id: str, request: EvalRequest):
+    return FastJSONResponse(await _evaluate_code(session_id, request))
+
+
+async def _evaluate_code(session_id: str, request: EvalRequest) -> Dict[str, Any]:
     if session_id not in sessions:
         return {"error": "Session not found"}
     is_dangerous, matched_cmd = is_dangerous_command(request.code)
     if is_dangerous:
-        logger.warning(f"Blocked dangerous command '{matched_cmd}' in session {session_id}")
+        logger.warning("Blocked dangerous command %r in session %s", matched_cmd, session_id)
         return {"error": f"Command '{matched_cmd}' is not allowed for security reasons"}
     process = sessions[session_id]["process"]
     if process.poll() is not None:
-        del sessions[session_id]
+        _forget_session(session_id)
         return {"error": "GHCi process timed out. Please restart the session."}
+    channel = sessions[session_id]["channel"]
     code = request.formatted()
     try:
-        process.stdout.flush()
-        drained = drain_pipe(process.stdout)
-        if drained:
-            logging.info(f"Drained output before command: {drained}")
-        logging.info(f"Writing code to GHCi: {code}")
-        process.stdin.write(code)
-        process.stdin.flush()
+        log_payload(logger, "Writing code to GHCi", code=code)
+        channel.send(code)
     except Exception as e:
         return {"error": f"Failed to write to GHCi: {str(e)}"}
     try:
-        output = await read_output(process, timeout=10)
+        response = await channel.receive(timeout=10)
         if process.poll() is not None:
-            del sessions[session_id]
+            _forget_session(session_id)
             return {"error": "GHCi process terminated unexpectedly"}
         sessions[session_id]["last_used"] = time.time()
-        return {"output": output}
+        return {"output": response.text}
     except Exception as e:
-        logging.error(f"Error reading output: {e}")
-        if process.poll():
-            process.kill()
-            del sessions[session_id]
+        logger.error("Error reading output: %s", e)
+        # A runaway or unanswered command leaves the process unusable (and
+        # still producing output): drop the session whatever poll() says.
+        process.kill()
+        _forget_session(session_id)
         return {"error": f"GHCi process terminated unexpectedly: {str(e)}"}
 
 
@@ -269,36 +589,26 @@ async def close_session(session_id: str):
         return {"error": "Session not found"}
     process = sessions[session_id]["process"]
     process.kill()
-    del sessions[session_id]
+    _forget_session(session_id)
     return {"status": "Session closed"}
 
 
 # --- Challenge endpoints ---
 @router.get("/challenges")
-async def list_challenges(lang: str = Query("en", description="Language code (en, es)")):
-    return {
-        "challenges": [
-            {"id": c.id, "title": _localized_title(c, lang)}
-            for c in CHALLENGES.values()
-        ]
-    }
+async def list_challenges(
+    request: Request,
+    lang: str = Query("en", description="Language code (en, es)"),
+):
+    return catalog.list_response(request, lang)
 
 
 @router.get("/challenges/{challenge_id}")
 async def get_challenge(
+    request: Request,
     challenge_id: str,
     lang: str = Query("en", description="Language code (en, es)"),
 ):
-    if challenge_id not in CHALLENGES:
-        return {"error": "Challenge not found"}
-    challenge = CHALLENGES[challenge_id]
-    return {
-        "id": challenge.id,
-        "title": _localized_title(challenge, lang),
-        "description": _localized_description(challenge, lang),
-        "starter_code": _localized_starter_code(challenge, lang),
-        "test_count": len(challenge.tests),
-    }
+    return catalog.detail_response(request, challenge_id, lang)
 
 
 @router.post(
@@ -306,17 +616,23 @@ async def get_challenge(
     dependencies=[Depends(require_current_user)],
 )
 async def submit_challenge(challenge_id: str, request: SubmitRequest):
+    return FastJSONResponse(await _submit_challenge(challenge_id, request))
+
+
+async def _submit_challenge(challenge_id: str, request: SubmitRequest) -> Dict[str, Any]:
     if challenge_id not in CHALLENGES:
         return {"error": "Challenge not found"}
     is_dangerous, matched_cmd = is_dangerous_command(request.code)
     if is_dangerous:
-        logger.warning(f"Blocked dangerous command '{matched_cmd}' in challenge submission")
+        logger.warning("Blocked dangerous command %r in challenge submission", matched_cmd)
         return {"error": f"Command '{matched_cmd}' is not allowed for security reasons"}
     challenge = CHALLENGES[challenge_id]
     process = _start_ghci_process()
+    channel = GhciChannel(process)
     try:
-        await read_until_prompt(process, timeout=10)
+        await channel.start(timeout=10)
     except Exception as e:
+        channel.close()
         try:
             process.kill()
             process.wait(timeout=5)
@@ -324,55 +640,45 @@ async def submit_challenge(challenge_id: str, request: SubmitRequest):
             pass
         return {"error": f"Failed to start GHCi: {str(e)}", "results": []}
     try:
-        results: List[TestResult] = []
+        results: List[Dict[str, Any]] = []
         code_request = EvalRequest(code=request.code)
         formatted_code = code_request.formatted()
-        logger.info(f"Loading code: {repr(formatted_code)}")
-        drain_pipe(process.stdout)
-        process.stdin.write(formatted_code)
-        process.stdin.flush()
-        load_output = await read_output(process, timeout=10)
-        logger.info(f"Load output: {repr(load_output)}")
-        if "error" in load_output.lower() or "not in scope" in load_output.lower():
-            return {"error": f"Failed to load your code:\n{load_output}", "results": []}
-        await asyncio.sleep(0.2)
+        log_payload(logger, "Loading code", code=formatted_code)
+        channel.send(formatted_code)
+        load = await channel.receive(timeout=10)
+        log_payload(logger, "Load output", output=load.text)
+        if has_errors(parse_ghc_diagnostics(load.stderr)):
+            return {"error": f"Failed to load your code:\n{load.text}", "results": []}
         for i, test in enumerate(challenge.tests):
             try:
-                logger.info(f"Running test {i+1}: {test.code}")
-                process.stdout.flush()
-                stale = drain_pipe(process.stdout)
-                if stale:
-                    logger.info(f"Drained stale output before test {i+1}: {repr(stale)}")
-                process.stdin.write(test.code + "\n")
-                process.stdin.flush()
-                await asyncio.sleep(0.05)
-                output = await read_output(process, timeout=5)
-                actual = output.strip()
-                logger.info(f"Test {i+1} output: {repr(actual)}, expected: {repr(test.expected)}")
+                channel.send(test.code + "\n")
+                actual = (await channel.receive(timeout=5)).text
+                log_payload(
+                    logger, "Test %d output", i + 1,
+                    code=test.code, output=actual, expected=test.expected,
+                )
                 passed = actual == test.expected
                 results.append(
-                    TestResult(passed=passed, test_code=test.code, expected=test.expected, actual=actual)
+                    TestResult.payload(passed, test.code, test.expected, actual)
                 )
             except Exception as e:
-                logger.error(f"Test {i+1} error: {e}")
+                logger.error("Test %d error: %s", i + 1, e)
                 results.append(
-                    TestResult(
-                        passed=False,
-                        test_code=test.code,
-                        expected=test.expected,
-                        actual=f"Error: {str(e)}",
+                    TestResult.payload(
+                        False, test.code, test.expected, f"Error: {str(e)}",
                     )
                 )
-        passed_count = sum(1 for r in results if r.passed)
+        passed_count = sum(1 for r in results if r["passed"])
         return {
-            "results": [r.model_dump() for r in results],
+            "results": results,
             "passed": passed_count,
             "total": len(results),
             "all_passed": passed_count == len(results),
         }
     finally:
+        channel.close()
         try:
             process.kill()
             process.wait(timeout=5)
         except Exception as e:
-            logger.warning(f"Error closing GHCi process: {e}")
+            logger.warning("Error closing GHCi process: %s", e)
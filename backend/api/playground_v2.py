@@ -10,30 +10,38 @@ import asyncio
 import atexit
 import logging
 import os
-from typing import List, Optional
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 from subprocess import Popen
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
+from api import catalog
+from api.responses import FastJSONResponse
 from api.playground import (
+    GhciChannel,
+    GhciResponse,
     _start_ghci_process,
-    _localized_description,
-    _localized_starter_code,
-    _localized_title,
-    read_until_prompt,
-    read_output,
-    drain_pipe,
+    has_errors,
     is_dangerous_command,
+    parse_ghc_diagnostics,
     strip_ghci_continuation_prompts,
 )
+import metrics
+import tracing
 from auth import require_current_user
+from structured_logging import log_payload
 from challenges import CHALLENGES
 from schemas.playground import EvalRequestV2, SubmitRequest, TestResult
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/v2/playground")
+router = APIRouter(
+    prefix="/api/v2/playground", default_response_class=FastJSONResponse,
+)
 
 NUM_GHCI_SESSIONS = int(os.environ.get("NUM_GHCI_SESSIONS", "3"))
 ACQUIRE_TIMEOUT = float(os.environ.get("WORKER_ACQUIRE_TIMEOUT", "30"))
@@ -48,6 +56,126 @@ EMPTY_MODULE_PATH = os.path.join(
 )
 
 
+ACQUIRE_WAIT_SECONDS = metrics.Histogram(
+    "haskellito_worker_acquire_wait_seconds",
+    "Time spent waiting for a free GHCi worker.",
+)
+RESET_SECONDS = metrics.Histogram(
+    "haskellito_ghci_reset_seconds",
+    "Time spent resetting GHCi state with :load Empty.hs.",
+)
+HISTORY_REPLAY_SECONDS = metrics.Histogram(
+    "haskellito_history_replay_seconds",
+    "Time spent replaying a request's command history.",
+)
+EVAL_SECONDS = metrics.Histogram(
+    "haskellito_eval_seconds",
+    "Time spent evaluating the new command, after reset and replay.",
+)
+SUBMISSION_SECONDS = metrics.Histogram(
+    "haskellito_submission_seconds",
+    "Time spent loading a challenge submission and running its tests.",
+)
+PROCESS_RESTARTS = metrics.Counter(
+    "haskellito_ghci_process_restarts",
+    "GHCi worker processes restarted, by reason.",
+    labelnames=("reason",),
+)
+HISTORY_REPLAY_ERRORS = metrics.Counter(
+    "haskellito_history_replay_errors",
+    "Requests rejected because their history failed to replay.",
+)
+BUSY_REJECTIONS = metrics.Counter(
+    "haskellito_server_busy_rejections",
+    "Requests answered with 'Server busy' after the acquire timeout.",
+    labelnames=("endpoint",),
+)
+
+
+# Per-request phase durations (seconds), reported via Server-Timing.
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_timings", default=None,
+)
+# Structured GHC diagnostics for the current request's eval or submission.
+_request_diagnostics: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "request_diagnostics", default=None,
+)
+
+
+def _report_diagnostics(diagnostics: List[Dict[str, Any]]):
+    collected = _request_diagnostics.get()
+    if collected is not None:
+        collected.extend(diagnostics)
+
+
+@contextmanager
+def _phase(
+    name: str,
+    histogram: Optional[metrics.Histogram] = None,
+    attributes: Optional[Dict[str, Any]] = None,
+    timing: str = "",
+):
+    """
+    Trace one pipeline phase.
+
+    The duration also goes into ``histogram`` and, under the ``timing``
+    name, into the current request's Server-Timing breakdown.
+    """
+    start = time.perf_counter()
+    try:
+        with tracing.span(name, attributes) as span:
+            yield span
+    finally:
+        elapsed = time.perf_counter() - start
+        if histogram is not None:
+            histogram.observe(elapsed)
+        timings = _request_timings.get()
+        if timing and timings is not None:
+            timings[timing] = timings.get(timing, 0.0) + elapsed
+
+
+def _serialize(payload: Dict[str, Any]) -> FastJSONResponse:
+    """Encode the response body inside its own span."""
+    with tracing.span("response.serialize") as span:
+        response = FastJSONResponse(payload)
+        span.set_attribute("response.bytes", len(response.body))
+    return response
+
+
+def _server_timing(timings: Dict[str, float]) -> str:
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.3f}"
+        for name, seconds in timings.items()
+    )
+
+
+async def _timed(body, include_timings: bool) -> FastJSONResponse:
+    """
+    Run an endpoint body, collecting its phase timings.
+
+    Timings are always sent as a Server-Timing header and, when asked for
+    with ``?timings=true``, as a ``timings`` object (milliseconds) in the
+    body.
+    """
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    start = time.perf_counter()
+    try:
+        payload = await body
+    finally:
+        _request_timings.reset(token)
+    timings["total"] = time.perf_counter() - start
+
+    if include_timings:
+        payload["timings"] = {
+            name: round(seconds * 1000, 3)
+            for name, seconds in timings.items()
+        }
+    response = _serialize(payload)
+    response.headers["Server-Timing"] = _server_timing(timings)
+    return response
+
+
 class HistoryReplayError(Exception):
     """Raised when replaying a command from the history fails."""
 
@@ -64,6 +192,7 @@ class Worker:
     def __init__(self, worker_id: int):
         self.worker_id = worker_id
         self.process: Optional[Popen] = None
+        self.channel: Optional[GhciChannel] = None
 
     def _is_alive(self) -> bool:
         return (
@@ -72,6 +201,8 @@ class Worker:
         )
 
     def _kill_process(self):
+        if self.channel is not None:
+            self.channel.close()
         if self.process is not None:
             try:
                 self.process.kill()
@@ -79,32 +210,36 @@ class Worker:
             except Exception:
                 pass
             self.process = None
+            self.channel = None
 
     async def _start_fresh(self):
         """Kill any existing process and start a new GHCi."""
         self._kill_process()
-        self.process = _start_ghci_process()
-        try:
-            await read_until_prompt(
-                self.process,
-                timeout=GHCI_STARTUP_TIMEOUT,
-            )
-        except Exception:
-            self._kill_process()
-            raise
+        with _phase(
+            "ghci.start",
+            attributes={"worker.id": self.worker_id},
+            timing="start",
+        ):
+            self.process = _start_ghci_process()
+            self.channel = GhciChannel(self.process)
+            try:
+                await self.channel.start(timeout=GHCI_STARTUP_TIMEOUT)
+            except Exception:
+                self._kill_process()
+                raise
         logger.info(
-            f"Worker {self.worker_id}: started fresh "
-            f"GHCi (pid={self.process.pid})"
+            "Worker %d: started fresh GHCi (pid=%s)",
+            self.worker_id, self.process.pid,
         )
 
+    async def _run(self, command: str, timeout: float) -> GhciResponse:
+        """Send one command and return its framed response."""
+        self.channel.send(command)
+        return await self.channel.receive(timeout=timeout)
+
     async def _reset_state(self):
         """Reset GHCi scope by loading the empty module."""
-        drain_pipe(self.process.stdout)
-        self.process.stdin.write(
-            f':load {EMPTY_MODULE_PATH}\n'
-        )
-        self.process.stdin.flush()
-        await read_output(self.process, timeout=5)
+        await self._run(f':load {EMPTY_MODULE_PATH}\n', timeout=5)
 
     async def _replay_commands(self, commands: List[str]):
         """Replay a list of commands, raising on failure."""
@@ -118,14 +253,17 @@ class Worker:
 
             fmt = EvalRequestV2.format_command(cmd)
             try:
-                drain_pipe(self.process.stdout)
-                self.process.stdin.write(fmt)
-                self.process.stdin.flush()
-                await read_output(
-                    self.process,
-                    timeout=HISTORY_CMD_TIMEOUT,
-                )
+                with _phase(
+                    "ghci.replay_command",
+                    attributes={
+                        "worker.id": self.worker_id,
+                        "history.index": i,
+                        "command.bytes": len(fmt),
+                    },
+                ):
+                    await self._run(fmt, timeout=HISTORY_CMD_TIMEOUT)
             except Exception as e:
+                self._kill_process()
                 raise HistoryReplayError(
                     f"History replay failed at "
                     f"command {i + 1}: {e}"
@@ -137,6 +275,24 @@ class Worker:
                     f"command {i + 1}"
                 )
 
+    async def _prepare(self):
+        """Make sure the process is alive and its GHCi scope is empty."""
+        if not self._is_alive():
+            PROCESS_RESTARTS.inc(reason="dead")
+            await self._start_fresh()
+
+        try:
+            with _phase(
+                "ghci.reset",
+                RESET_SECONDS,
+                {"worker.id": self.worker_id},
+                timing="reset",
+            ):
+                await self._reset_state()
+        except Exception:
+            PROCESS_RESTARTS.inc(reason="reset_failed")
+            await self._start_fresh()
+
     async def execute(
         self, history: List[str], code: str,
     ) -> str:
@@ -146,20 +302,22 @@ class Worker:
         3) Replay history.
         4) Execute code and return its output.
         """
-        if not self._is_alive():
-            await self._start_fresh()
-
-        try:
-            await self._reset_state()
-        except Exception:
-            await self._start_fresh()
+        await self._prepare()
 
         if history:
-            logger.info(
-                f"Worker {self.worker_id}: "
-                f"replaying {len(history)} cmds"
+            logger.debug(
+                "Worker %d: replaying %d cmds", self.worker_id, len(history),
             )
-            await self._replay_commands(history)
+            with _phase(
+                "ghci.replay",
+                HISTORY_REPLAY_SECONDS,
+                {
+                    "worker.id": self.worker_id,
+                    "history.length": len(history),
+                },
+                timing="replay",
+            ):
+                await self._replay_commands(history)
 
         is_dangerous, matched = is_dangerous_command(code)
         if is_dangerous:
@@ -170,12 +328,13 @@ class Worker:
 
         fmt = EvalRequestV2.format_command(code)
         try:
-            drain_pipe(self.process.stdout)
-            self.process.stdin.write(fmt)
-            self.process.stdin.flush()
-            output = await read_output(
-                self.process, timeout=EVAL_CMD_TIMEOUT,
-            )
+            with _phase(
+                "ghci.eval",
+                EVAL_SECONDS,
+                {"worker.id": self.worker_id},
+                timing="eval",
+            ):
+                response = await self._run(fmt, timeout=EVAL_CMD_TIMEOUT)
         except Exception as e:
             self._kill_process()
             raise Exception(
@@ -189,31 +348,41 @@ class Worker:
                 "GHCi process terminated unexpectedly"
             )
 
-        return strip_ghci_continuation_prompts(output)
+        with _phase("output.postprocess") as span:
+            cleaned = strip_ghci_continuation_prompts(response.text)
+            _report_diagnostics(parse_ghc_diagnostics(response.stderr))
+            span.set_attribute("output.bytes", len(cleaned))
+        log_payload(
+            logger, "Worker %d: eval output", self.worker_id,
+            code=code, output=cleaned,
+        )
+        return cleaned
 
-    async def submit_challenge(self, challenge, code: str) -> List[TestResult]:
+    async def submit_challenge(self, challenge, code: str) -> List[Dict[str, Any]]:
         """
         Reset worker state, load submitted code, and run challenge tests.
 
         Challenge submissions are independent requests, so no command
         history is replayed.
         """
-        if not self._is_alive():
-            await self._start_fresh()
-
-        try:
-            await self._reset_state()
-        except Exception:
-            await self._start_fresh()
+        await self._prepare()
+        with _phase(
+            "ghci.submission",
+            SUBMISSION_SECONDS,
+            {
+                "worker.id": self.worker_id,
+                "challenge.id": challenge.id,
+                "tests.count": len(challenge.tests),
+            },
+            timing="eval",
+        ):
+            return await self._run_submission(challenge, code)
 
+    async def _run_submission(self, challenge, code: str) -> List[Dict[str, Any]]:
+        """Load the submitted code and run every challenge test."""
         formatted_code = EvalRequestV2.format_command(code)
         try:
-            drain_pipe(self.process.stdout)
-            self.process.stdin.write(formatted_code)
-            self.process.stdin.flush()
-            load_output = await read_output(
-                self.process, timeout=EVAL_CMD_TIMEOUT,
-            )
+            load = await self._run(formatted_code, timeout=EVAL_CMD_TIMEOUT)
         except Exception as e:
             self._kill_process()
             raise Exception(
@@ -227,43 +396,40 @@ class Worker:
                 "GHCi process terminated unexpectedly"
             )
 
-        cleaned_load_output = strip_ghci_continuation_prompts(load_output)
-        if (
-            "error" in cleaned_load_output.lower()
-            or "not in scope" in cleaned_load_output.lower()
-        ):
+        log_payload(
+            logger, "Worker %d: load output", self.worker_id,
+            code=formatted_code, output=load.text,
+        )
+
+        # Errors arrive on stderr; the output itself is never searched, so a
+        # result or warning that mentions "error" is not a failed load.
+        diagnostics = parse_ghc_diagnostics(load.stderr)
+        if has_errors(diagnostics):
+            _report_diagnostics(diagnostics)
             raise ValueError(
-                f"Failed to load your code:\n{cleaned_load_output}"
+                "Failed to load your code:\n"
+                f"{strip_ghci_continuation_prompts(load.text)}"
             )
 
-        results: List[TestResult] = []
+        results: List[Dict[str, Any]] = []
         for i, test in enumerate(challenge.tests):
             try:
-                drain_pipe(self.process.stdout)
-                self.process.stdin.write(test.code + "\n")
-                self.process.stdin.flush()
-                output = await read_output(
-                    self.process, timeout=HISTORY_CMD_TIMEOUT,
+                response = await self._run(
+                    test.code + "\n", timeout=HISTORY_CMD_TIMEOUT,
                 )
-                actual = strip_ghci_continuation_prompts(output).strip()
+                actual = strip_ghci_continuation_prompts(response.text)
                 passed = actual == test.expected
                 results.append(
-                    TestResult(
-                        passed=passed,
-                        test_code=test.code,
-                        expected=test.expected,
-                        actual=actual,
+                    TestResult.payload(
+                        passed, test.code, test.expected, actual,
                     )
                 )
             except Exception as e:
-                logger.error(f"Test {i + 1} error: {e}")
+                logger.error("Test %d error: %s", i + 1, e)
                 self._kill_process()
                 results.append(
-                    TestResult(
-                        passed=False,
-                        test_code=test.code,
-                        expected=test.expected,
-                        actual=f"Error: {str(e)}",
+                    TestResult.payload(
+                        False, test.code, test.expected, f"Error: {str(e)}",
                     )
                 )
                 break
@@ -289,9 +455,7 @@ class WorkerPool:
 
     async def start(self):
         """Create workers and start their GHCi processes."""
-        logger.info(
-            f"Starting worker pool with {self.size} workers"
-        )
+        logger.info("Starting worker pool with %d workers", self.size)
         for i in range(self.size):
             w = Worker(worker_id=i)
             await w._start_fresh()
@@ -300,9 +464,14 @@ class WorkerPool:
         logger.info("Worker pool ready")
 
     async def acquire(self, timeout: float = ACQUIRE_TIMEOUT):
-        return await asyncio.wait_for(
-            self._queue.get(), timeout=timeout,
-        )
+        with ACQUIRE_WAIT_SECONDS.time():
+            return await asyncio.wait_for(
+                self._queue.get(), timeout=timeout,
+            )
+
+    @property
+    def idle_count(self) -> int:
+        return self._queue.qsize()
 
     async def release(self, worker: Worker):
         """Return the worker to the pool immediately."""
@@ -311,8 +480,7 @@ class WorkerPool:
     def shutdown(self):
         """Kill every worker's GHCi process."""
         logger.info(
-            "Shutting down worker pool "
-            f"({len(self._workers)} workers)"
+            "Shutting down worker pool (%d workers)", len(self._workers),
         )
         for w in self._workers:
             w._kill_process()
@@ -330,6 +498,40 @@ async def get_pool() -> WorkerPool:
     return pool
 
 
+def _worker_state_samples():
+    if pool is None:
+        return []
+    idle = pool.idle_count
+    return [(("idle",), idle), (("busy",), pool.size - idle)]
+
+
+def _worker_rss_samples():
+    if pool is None:
+        return []
+    samples = []
+    for w in pool._workers:
+        if not w._is_alive():
+            continue
+        rss = metrics.process_tree_rss_bytes(w.process.pid)
+        if rss is not None:
+            samples.append(((str(w.worker_id),), rss))
+    return samples
+
+
+WORKERS = metrics.Gauge(
+    "haskellito_workers",
+    "GHCi workers in the v2 pool, by state.",
+    labelnames=("state",),
+    callback=_worker_state_samples,
+)
+WORKER_RSS_BYTES = metrics.Gauge(
+    "haskellito_worker_rss_bytes",
+    "Resident memory of each worker's GHCi process tree.",
+    labelnames=("worker",),
+    callback=_worker_rss_samples,
+)
+
+
 def cleanup_v2_workers():
     """Kill all v2 worker processes. Call on shutdown."""
     if pool is not None:
@@ -352,24 +554,48 @@ async def start_session_v2():
     "/sessions/{session_id}/eval",
     dependencies=[Depends(require_current_user)],
 )
-async def evaluate_v2(session_id: str, request: EvalRequestV2):
+async def evaluate_v2(
+    session_id: str,
+    request: EvalRequestV2,
+    include_timings: bool = Query(False, alias="timings"),
+):
+    with tracing.span(
+        "evaluate_v2",
+        {"history.length": len(request.history)},
+    ):
+        return await _timed(
+            _evaluate(session_id, request),
+            include_timings,
+        )
+
+
+async def _evaluate(session_id: str, request: EvalRequestV2) -> Dict[str, Any]:
     wp = await get_pool()
 
     try:
-        worker = await wp.acquire(timeout=ACQUIRE_TIMEOUT)
+        with _phase("pool.acquire", timing="queue"):
+            worker = await wp.acquire(timeout=ACQUIRE_TIMEOUT)
     except asyncio.TimeoutError:
+        BUSY_REJECTIONS.inc(endpoint="eval")
         return {"error": "Server busy, please try again later"}
 
+    diagnostics: List[Dict[str, Any]] = []
+    token = _request_diagnostics.set(diagnostics)
     try:
         output = await worker.execute(request.history, request.code)
-        return {"output": output}
+        payload: Dict[str, Any] = {"output": output}
+        if diagnostics:
+            payload["diagnostics"] = diagnostics
+        return payload
     except HistoryReplayError as e:
-        logger.warning(f"History replay error for session {session_id}: {e}")
+        HISTORY_REPLAY_ERRORS.inc()
+        logger.warning("History replay error for session %s: %s", session_id, e)
         return {"error": str(e), "history_failed": True}
     except Exception as e:
-        logger.error(f"Eval error for session {session_id}: {e}")
+        logger.error("Eval error for session %s: %s", session_id, e)
         return {"error": str(e)}
     finally:
+        _request_diagnostics.reset(token)
         await wp.release(worker)
 
 
@@ -384,31 +610,31 @@ async def close_session_v2(session_id: str):
 
 @router.get("/challenges")
 async def list_challenges_v2(
+    request: Request,
+    lang: str = Query("en", description="Language code (en, es)"),
+):
+    return catalog.list_response(request, lang)
+
+
+@router.get("/challenges/bundle")
+async def get_challenge_bundle_v2(
+    request: Request,
     lang: str = Query("en", description="Language code (en, es)"),
+    chapter: Optional[str] = Query(
+        None, description="Only this chapter's challenges (see `chapters`)",
+    ),
 ):
-    return {
-        "challenges": [
-            {"id": c.id, "title": _localized_title(c, lang)}
-            for c in CHALLENGES.values()
-        ]
-    }
+    """All challenge details for a language in one cacheable response."""
+    return catalog.bundle_response(request, lang, chapter)
 
 
 @router.get("/challenges/{challenge_id}")
 async def get_challenge_v2(
+    request: Request,
     challenge_id: str,
     lang: str = Query("en", description="Language code (en, es)"),
 ):
-    if challenge_id not in CHALLENGES:
-        return {"error": "Challenge not found"}
-    challenge = CHALLENGES[challenge_id]
-    return {
-        "id": challenge.id,
-        "title": _localized_title(challenge, lang),
-        "description": _localized_description(challenge, lang),
-        "starter_code": _localized_starter_code(challenge, lang),
-        "test_count": len(challenge.tests),
-    }
+    return catalog.detail_response(request, challenge_id, lang)
 
 
 @router.post(
@@ -418,15 +644,27 @@ async def get_challenge_v2(
 async def submit_challenge_v2(
     challenge_id: str,
     request: SubmitRequest,
+    include_timings: bool = Query(False, alias="timings"),
 ):
+    with tracing.span(
+        "submit_challenge_v2",
+        {"challenge.id": challenge_id},
+    ):
+        return await _timed(
+            _submit(challenge_id, request),
+            include_timings,
+        )
+
+
+async def _submit(challenge_id: str, request: SubmitRequest) -> Dict[str, Any]:
     if challenge_id not in CHALLENGES:
         return {"error": "Challenge not found"}
 
     is_dangerous, matched_cmd = is_dangerous_command(request.code)
     if is_dangerous:
         logger.warning(
-            "Blocked dangerous command "
-            f"'{matched_cmd}' in challenge submission"
+            "Blocked dangerous command %r in challenge submission",
+            matched_cmd,
         )
         return {
             "error": (
@@ -437,26 +675,34 @@ async def submit_challenge_v2(
 
     wp = await get_pool()
     try:
-        worker = await wp.acquire(timeout=ACQUIRE_TIMEOUT)
+        with _phase("pool.acquire", timing="queue"):
+            worker = await wp.acquire(timeout=ACQUIRE_TIMEOUT)
     except asyncio.TimeoutError:
+        BUSY_REJECTIONS.inc(endpoint="submit")
         return {"error": "Server busy, please try again later"}
 
+    diagnostics: List[Dict[str, Any]] = []
+    token = _request_diagnostics.set(diagnostics)
     try:
         results = await worker.submit_challenge(
             CHALLENGES[challenge_id],
             request.code,
         )
-        passed_count = sum(1 for r in results if r.passed)
+        passed_count = sum(1 for r in results if r["passed"])
         return {
-            "results": [r.model_dump() for r in results],
+            "results": results,
             "passed": passed_count,
             "total": len(results),
             "all_passed": passed_count == len(results),
         }
     except ValueError as e:
-        return {"error": str(e), "results": []}
+        payload = {"error": str(e), "results": []}
+        if diagnostics:
+            payload["diagnostics"] = diagnostics
+        return payload
     except Exception as e:
-        logger.error(f"Challenge submit error: {e}")
+        logger.error("Challenge submit error: %s", e)
         return {"error": str(e), "results": []}
     finally:
+        _request_diagnostics.reset(token)
         await wp.release(worker)
@@ -0,0 +1,37 @@
+"""
+JSON response class shared by the playground routers.
+
+Endpoints build their payloads from plain dicts, lists, strings, numbers
+and booleans, so returning a ``FastJSONResponse`` directly skips FastAPI's
+``jsonable_encoder`` walk over the body. Encoding uses ``orjson`` when it is
+installed and falls back to the same compact ``json.dumps`` that
+``JSONResponse`` uses.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` encoded with ``dumps``; the payload must already be JSON-ready."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
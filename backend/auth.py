@@ -1,13 +1,56 @@
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from functools import lru_cache
+import threading
+import time
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+import metrics
+import tracing
+
+logger = logging.getLogger(__name__)
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Verified tokens are remembered until their exp minus the skew, so a
+# token about to expire is checked (and rejected) by PyJWT itself.
+AUTH_TOKEN_CACHE_SIZE = int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "1024"))
+AUTH_TOKEN_CACHE_SKEW_SECONDS = int(
+    os.environ.get("AUTH_TOKEN_CACHE_SKEW_SECONDS", "30")
+)
+
+# The JWKS is loaded before serving and replaced in the background; request
+# handling only ever reads it from memory.  An unknown kid triggers an early
+# refresh, but never more often than AUTH_JWKS_MIN_REFRESH_SECONDS once
+# some keys are loaded.
+AUTH_JWKS_REFRESH_SECONDS = float(os.environ.get("AUTH_JWKS_REFRESH_SECONDS", "3600"))
+AUTH_JWKS_MIN_REFRESH_SECONDS = float(
+    os.environ.get("AUTH_JWKS_MIN_REFRESH_SECONDS", "60")
+)
+AUTH_JWKS_TIMEOUT_SECONDS = float(os.environ.get("AUTH_JWKS_TIMEOUT_SECONDS", "5"))
+
+# When > 0, uncached signature checks run on this many threads (cryptography
+# releases the GIL while verifying), at most AUTH_VERIFY_CONCURRENCY at once.
+# A check takes ~90 us, less than the thread handoff costs on a small box, so
+# by default they run inline.
+AUTH_VERIFY_WORKERS = int(os.environ.get("AUTH_VERIFY_WORKERS", "0"))
+AUTH_VERIFY_CONCURRENCY = int(os.environ.get("AUTH_VERIFY_CONCURRENCY", "8"))
+
+TOKEN_CACHE_LOOKUPS = metrics.Counter(
+    "haskellito_auth_token_cache_lookups",
+    "Verified-token cache lookups, by result.",
+    labelnames=("result",),
+)
+
 
 class AuthConfigurationError(RuntimeError):
     """Raised when Cognito auth is enabled but not correctly configured."""
@@ -17,6 +60,118 @@ class InvalidAuthToken(ValueError):
     """Raised when a bearer token doesn't validate as a Cognito access token."""
 
 
+class UnknownSigningKey(InvalidAuthToken):
+    """Raised when a token's kid isn't in the JWKS currently in memory."""
+
+
+class SigningKeysUnavailable(RuntimeError):
+    """Raised when no JWKS could be loaded, so no token can be checked."""
+
+
+class _VerifiedTokens:
+    """LRU of token digest -> claims for tokens that already verified.
+
+    Entries are used until the token's ``exp`` minus the skew, and all of
+    them are dropped when the JWKS key set is seen to change, so a token
+    signed with a retired key is verified again (and rejected).
+    """
+
+    def __init__(self, maxsize: int, skew_seconds: int):
+        self.maxsize = maxsize
+        self.skew_seconds = skew_seconds
+        self._entries: "OrderedDict[bytes, tuple[float, dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._key_ids: frozenset[str] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: bytes) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if time.time() >= entry[0]:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return entry[1]
+
+    def put(self, digest: bytes, claims: dict[str, Any]) -> None:
+        exp = claims.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, (int, float)):
+            return
+        valid_until = exp - self.skew_seconds
+        if valid_until <= time.time():
+            return
+        with self._lock:
+            self._entries[digest] = (valid_until, claims)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def key_set_seen(self, key_ids: frozenset[str]) -> None:
+        """Drop every entry if the key set differs from the last one seen."""
+        with self._lock:
+            if self._key_ids is not None and key_ids != self._key_ids:
+                self._entries.clear()
+            self._key_ids = key_ids
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_ids = None
+
+
+_verified_tokens = _VerifiedTokens(
+    AUTH_TOKEN_CACHE_SIZE, AUTH_TOKEN_CACHE_SKEW_SECONDS
+)
+
+
+class _JWKSStore:
+    """Signing keys by issuer and kid, replaced as a whole on every load."""
+
+    def __init__(self):
+        self._keys: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.last_attempt = float("-inf")
+        self.refreshing: "asyncio.Future[bool] | None" = None
+
+    def signing_key(self, issuer: str, kid: str | None) -> Any:
+        return self._keys.get(issuer, {}).get(kid)
+
+    def has_keys(self, issuer: str) -> bool:
+        return bool(self._keys.get(issuer))
+
+    def install(self, issuer: str, jwks: dict[str, Any], source: str) -> None:
+        jwt = _jwt_tools()
+        keys = {
+            key.key_id: key
+            for key in jwt.PyJWKSet.from_dict(jwks).keys
+            if key.key_id
+        }
+        with self._lock:
+            self._keys[issuer] = keys
+        _verified_tokens.key_set_seen(frozenset(keys))
+        logger.info("Loaded %d JWKS signing keys from %s", len(keys), source)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+        self.last_attempt = float("-inf")
+        self.refreshing = None
+
+
+_jwks = _JWKSStore()
+_refresh_task: "asyncio.Task[None] | None" = None
+
+
+def _token_digest(issuer: str, client_id: str, token: str) -> bytes:
+    return hashlib.sha256(f"{issuer}\0{client_id}\0{token}".encode()).digest()
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
     value = os.environ.get(name)
     if value is None:
@@ -34,6 +189,10 @@ def cognito_auth_enabled() -> bool:
     )
 
 
+def _jwks_file() -> str:
+    return os.environ.get("COGNITO_JWKS_FILE", "").strip()
+
+
 def _user_pool_id() -> str:
     return os.environ.get("COGNITO_USER_POOL_ID", "").strip()
 
@@ -65,34 +224,152 @@ def cognito_issuer() -> str:
     return f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}"
 
 
-@lru_cache(maxsize=4)
-def _jwks_client(issuer: str) -> Any:
-    _, pyjwk_client = _jwt_tools()
-    return pyjwk_client(f"{issuer}/.well-known/jwks.json")
-
-
-def _jwt_tools() -> tuple[Any, Any]:
+def _jwt_tools() -> Any:
     try:
         import jwt
-        from jwt import PyJWKClient
     except ImportError as exc:
         raise AuthConfigurationError(
             "Cognito auth requires PyJWT. Install backend requirements."
         ) from exc
-    return jwt, PyJWKClient
+    return jwt
 
 
-def verify_cognito_access_token(token: str) -> dict[str, Any]:
+def _fetch_jwks(issuer: str) -> dict[str, Any]:
+    url = f"{issuer}/.well-known/jwks.json"
+    with urllib.request.urlopen(url, timeout=AUTH_JWKS_TIMEOUT_SECONDS) as response:
+        return json.load(response)
+
+
+def load_jwks(issuer: str) -> bool:
+    """Fetch the JWKS now.  On failure the keys in memory are kept."""
+    jwt = _jwt_tools()
+    _jwks.last_attempt = time.monotonic()
+    try:
+        _jwks.install(issuer, _fetch_jwks(issuer), issuer)
+    except (OSError, ValueError, jwt.PyJWTError) as exc:
+        logger.warning("Could not load JWKS from %s: %s", issuer, exc)
+        return False
+    return True
+
+
+def prefetch_jwks() -> bool:
+    """Load signing keys before the first request.
+
+    ``COGNITO_JWKS_FILE`` (a saved copy of the pool's ``jwks.json``) is used
+    when set, so air-gapped tests and Lambda cold starts skip the network;
+    otherwise the JWKS is fetched.  Failures are logged, never raised.
+    """
+    if not cognito_auth_enabled():
+        return False
+    try:
+        issuer = cognito_issuer()
+        jwt = _jwt_tools()
+    except AuthConfigurationError as exc:
+        logger.warning("Skipping JWKS prefetch: %s", exc)
+        return False
+
+    path = _jwks_file()
+    if path:
+        try:
+            _jwks.install(issuer, json.loads(Path(path).read_text("utf-8")), path)
+            return True
+        except (OSError, ValueError, jwt.PyJWTError) as exc:
+            logger.warning("Could not load JWKS file %s: %s", path, exc)
+    return load_jwks(issuer)
+
+
+async def refresh_jwks() -> bool:
+    """Reload the JWKS in a worker thread without blocking the event loop.
+
+    Concurrent callers share one fetch.  Once keys are loaded, returns False
+    without fetching when the previous attempt was less than
+    AUTH_JWKS_MIN_REFRESH_SECONDS ago; while there are none (a failed
+    prefetch), every call may fetch, as the keys can't get any staler.
+    """
+    if _jwks.refreshing is not None:
+        return await asyncio.shield(_jwks.refreshing)
+    issuer = cognito_issuer()
+    recent = time.monotonic() - _jwks.last_attempt < AUTH_JWKS_MIN_REFRESH_SECONDS
+    if recent and _jwks.has_keys(issuer):
+        return False
+
+    _jwks.last_attempt = time.monotonic()
+    task = asyncio.ensure_future(asyncio.to_thread(load_jwks, issuer))
+    _jwks.refreshing = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        if _jwks.refreshing is task:
+            _jwks.refreshing = None
+
+
+async def _refresh_jwks_periodically() -> None:
+    # Anything a refresh raises (http.client.IncompleteRead, a bad
+    # configuration) is logged and retried; letting it escape would end
+    # the task and the keys would never be refreshed again.
+    try:
+        refreshed = _jwks.has_keys(cognito_issuer())
+    except Exception:
+        logger.exception("Could not check the loaded JWKS")
+        refreshed = False
+    while True:
+        await asyncio.sleep(
+            AUTH_JWKS_REFRESH_SECONDS if refreshed else AUTH_JWKS_MIN_REFRESH_SECONDS
+        )
+        try:
+            refreshed = await refresh_jwks()
+        except Exception:
+            logger.exception("Periodic JWKS refresh failed")
+            refreshed = False
+
+
+async def start_jwks_refresh() -> None:
+    """Load the JWKS before serving and keep it fresh in the background."""
+    global _refresh_task
+    if not cognito_auth_enabled():
+        return
+    await asyncio.to_thread(prefetch_jwks)
+    if AUTH_JWKS_REFRESH_SECONDS > 0 and _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_jwks_periodically())
+
+
+async def stop_jwks_refresh() -> None:
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+
+
+def _verification_context(token: str) -> tuple[str, str, bytes]:
     client_id = _app_client_id()
     if not client_id:
         raise AuthConfigurationError(
             "Cognito auth requires COGNITO_APP_CLIENT_ID."
         )
-
     issuer = cognito_issuer()
-    jwt, _ = _jwt_tools()
+    return issuer, client_id, _token_digest(issuer, client_id, token)
+
+
+def _cached_claims(digest: bytes) -> dict[str, Any] | None:
+    cached = _verified_tokens.get(digest)
+    TOKEN_CACHE_LOOKUPS.inc(result="miss" if cached is None else "hit")
+    return None if cached is None else dict(cached)
+
+
+def _verify_signature(
+    token: str, issuer: str, client_id: str, digest: bytes,
+) -> dict[str, Any]:
+    """The uncached RS256 check; safe to run in a worker thread."""
+    jwt = _jwt_tools()
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except jwt.PyJWTError as exc:
+        raise InvalidAuthToken("Invalid authentication token.") from exc
+    signing_key = _jwks.signing_key(issuer, kid)
+    if signing_key is None:
+        raise UnknownSigningKey("Invalid authentication token.")
+
     try:
-        signing_key = _jwks_client(issuer).get_signing_key_from_jwt(token)
         claims = jwt.decode(
             token,
             signing_key.key,
@@ -109,7 +386,60 @@ def verify_cognito_access_token(token: str) -> dict[str, Any]:
     except jwt.PyJWTError as exc:
         raise InvalidAuthToken("Invalid authentication token.") from exc
 
-    return claims
+    _verified_tokens.put(digest, claims)
+    return dict(claims)
+
+
+def verify_cognito_access_token(token: str) -> dict[str, Any]:
+    issuer, client_id, digest = _verification_context(token)
+    cached = _cached_claims(digest)
+    if cached is not None:
+        return cached
+    return _verify_signature(token, issuer, client_id, digest)
+
+
+_verify_executor: ThreadPoolExecutor | None = None
+_verify_executor_lock = threading.Lock()
+_verify_slots: "tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None" = None
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _verify_executor
+    with _verify_executor_lock:
+        if _verify_executor is None:
+            _verify_executor = ThreadPoolExecutor(
+                max_workers=AUTH_VERIFY_WORKERS,
+                thread_name_prefix="auth-verify",
+            )
+        return _verify_executor
+
+
+def _slots() -> asyncio.Semaphore:
+    global _verify_slots
+    loop = asyncio.get_running_loop()
+    if _verify_slots is None or _verify_slots[0] is not loop:
+        _verify_slots = (loop, asyncio.Semaphore(AUTH_VERIFY_CONCURRENCY))
+    return _verify_slots[1]
+
+
+async def verify_access_token(token: str) -> dict[str, Any]:
+    """verify_cognito_access_token, optionally off the event loop.
+
+    Cached tokens are answered inline, and so are signature checks unless
+    AUTH_VERIFY_WORKERS is set.  Then they run on a small thread pool, at
+    most AUTH_VERIFY_CONCURRENCY at a time; later callers wait their turn on
+    the loop instead of piling up in the executor.
+    """
+    issuer, client_id, digest = _verification_context(token)
+    cached = _cached_claims(digest)
+    if cached is not None:
+        return cached
+    if AUTH_VERIFY_WORKERS <= 0:
+        return _verify_signature(token, issuer, client_id, digest)
+    async with _slots():
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor(), _verify_signature, token, issuer, client_id, digest,
+        )
 
 
 async def require_current_user(
@@ -126,12 +456,28 @@ async def require_current_user(
         )
 
     try:
-        return verify_cognito_access_token(credentials.credentials)
+        with tracing.span("auth.verify"):
+            try:
+                return await verify_access_token(credentials.credentials)
+            except UnknownSigningKey:
+                # Rotated keys or no JWKS loaded yet: refresh off the event
+                # loop (rate limited), then give the token one more try.
+                await refresh_jwks()
+                if not _jwks.has_keys(cognito_issuer()):
+                    raise SigningKeysUnavailable("No JWKS signing keys loaded.")
+                return await verify_access_token(credentials.credentials)
     except AuthConfigurationError as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(exc),
         ) from exc
+    except SigningKeysUnavailable as exc:
+        # Not the token's fault: a 401 would make the frontend log users out.
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is temporarily unavailable.",
+            headers={"Retry-After": "5"},
+        ) from exc
     except InvalidAuthToken as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
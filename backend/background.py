@@ -0,0 +1,46 @@
+"""
+Background thread that hands queued items to a handler in batches.
+
+Used by span export (``tracing``) and the request recorder so the event
+loop only ever enqueues; file and network I/O happen on the thread.
+"""
+import queue
+import threading
+from typing import Any, List, Optional
+
+
+class BatchingThread:
+    """Daemon thread draining a queue; subclasses implement ``handle``."""
+
+    def __init__(self, name: str):
+        self._queue: "queue.SimpleQueue[Optional[Any]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: Any):
+        self._queue.put(item)
+
+    def shutdown(self):
+        """Handle everything submitted so far, then stop the thread."""
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def handle(self, batch: List[Any]):
+        raise NotImplementedError
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self.handle(batch)
@@ -1,15 +1,15 @@
-"""Challenges package: models and challenge data."""
+"""Challenges package: models and the lazily loaded challenge bundle."""
 
-from .data import CHALLENGES as _base_challenges, Challenge, TestCase
-from .c1 import CHAPTER_1_CHALLENGES as _ch1_challenges
-from .c2 import CHAPTER_2_CHALLENGES as _ch2_challenges
-from .c3 import CHAPTER_3_CHALLENGES as _ch3_challenges
+from .bundle import ChallengeBundle, ChallengeSummary
+from .models import Challenge, TestCase
 
-CHALLENGES = {
-    **_base_challenges,
-    **_ch1_challenges,
-    **_ch2_challenges,
-    **_ch3_challenges,
-}
+__all__ = ["CHALLENGES", "Challenge", "ChallengeSummary", "TestCase"]
 
-__all__ = ["CHALLENGES", "Challenge", "TestCase"]
+
+def __getattr__(name):
+    # Opened on first use so `python -m challenges.build` works without a bundle.
+    if name == "CHALLENGES":
+        global CHALLENGES
+        CHALLENGES = ChallengeBundle()
+        return CHALLENGES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,173 @@
+"""
+Compile ``content/*.toml`` into the challenge bundle read at runtime.
+
+    cd backend
+    python -m challenges.build            # validate and rewrite bundle/
+    python -m challenges.build --check    # exit 1 if bundle/ is stale
+
+Every challenge is validated against the pydantic models here, once, so
+the server can build them without validation when they are first used.
+Chapters are ordered by their ``number``; challenges keep file order.
+"""
+import argparse
+import json
+import sys
+import tomllib
+from pathlib import Path
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from .bundle import BUNDLE_DIR, FORMAT_VERSION
+from .models import Challenge
+
+
+CONTENT_DIR = Path(__file__).resolve().parent / "content"
+
+
+class BuildError(Exception):
+    pass
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_chapters(content_dir: Path = CONTENT_DIR) -> List[Dict[str, Any]]:
+    chapters = []
+    seen: Dict[str, str] = {}
+    for path in sorted(content_dir.glob("*.toml")):
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+        for key in ("number", "id", "title"):
+            if key not in data:
+                raise BuildError(f"{path.name}: missing chapter field '{key}'")
+
+        challenges = []
+        for position, raw in enumerate(data.get("challenges", []), start=1):
+            try:
+                challenge = Challenge.model_validate(raw)
+            except ValidationError as e:
+                raise BuildError(
+                    f"{path.name}: challenge #{position} "
+                    f"({raw.get('id', '?')}) is invalid:\n{e}"
+                ) from None
+            if not challenge.tests:
+                raise BuildError(f"{path.name}: challenge {challenge.id} has no tests")
+            if challenge.id in seen:
+                raise BuildError(
+                    f"{path.name}: duplicate challenge id {challenge.id} "
+                    f"(also in {seen[challenge.id]})"
+                )
+            seen[challenge.id] = path.name
+            challenges.append(challenge)
+
+        chapters.append({
+            "number": data["number"],
+            "id": data["id"],
+            "title": data["title"],
+            "title_es": data.get("title_es"),
+            "challenges": challenges,
+        })
+    if not chapters:
+        raise BuildError(f"No chapter files in {content_dir}")
+    chapters.sort(key=lambda chapter: chapter["number"])
+    return chapters
+
+
+def render_bundle(chapters: List[Dict[str, Any]]) -> Dict[str, bytes]:
+    """File name -> contents for the bundle directory."""
+    files = {}
+    index = []
+    for chapter in chapters:
+        files[f"{chapter['id']}.json"] = _dumps([
+            challenge.model_dump(exclude_none=True)
+            for challenge in chapter["challenges"]
+        ])
+        index.extend(
+            {
+                "id": challenge.id,
+                "chapter": chapter["id"],
+                "title": challenge.title,
+                "title_es": challenge.title_es,
+                "test_count": len(challenge.tests),
+            }
+            for challenge in chapter["challenges"]
+        )
+
+    files["index.json"] = _dumps({
+        "format": FORMAT_VERSION,
+        "chapters": [
+            {
+                "id": chapter["id"],
+                "number": chapter["number"],
+                "title": chapter["title"],
+                "title_es": chapter["title_es"],
+                "count": len(chapter["challenges"]),
+            }
+            for chapter in chapters
+        ],
+        "challenges": index,
+    })
+    return files
+
+
+def stale_files(files: Dict[str, bytes], output_dir: Path) -> List[str]:
+    """Names that are missing, different or left over in ``output_dir``."""
+    stale = [
+        name for name, content in files.items()
+        if not (output_dir / name).exists()
+        or (output_dir / name).read_bytes() != content
+    ]
+    if output_dir.is_dir():
+        stale.extend(
+            path.name for path in sorted(output_dir.glob("*.json"))
+            if path.name not in files
+        )
+    return stale
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the challenge bundle.")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR)
+    parser.add_argument("--output-dir", type=Path, default=BUNDLE_DIR)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write; fail if the bundle is missing or out of date.",
+    )
+    args = parser.parse_args()
+
+    try:
+        chapters = load_chapters(args.content_dir)
+    except BuildError as e:
+        sys.exit(f"error: {e}")
+    files = render_bundle(chapters)
+    total = sum(len(chapter["challenges"]) for chapter in chapters)
+    stale = stale_files(files, args.output_dir)
+
+    if args.check:
+        if stale:
+            sys.exit(
+                f"{args.output_dir} is out of date ({', '.join(stale)}); "
+                "run `python -m challenges.build`."
+            )
+        print(f"{args.output_dir} is up to date ({total} challenges).")
+        return
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        path = args.output_dir / name
+        if not path.exists() or path.read_bytes() != content:
+            path.write_bytes(content)
+    for name in stale:
+        if name not in files:
+            (args.output_dir / name).unlink()
+    print(
+        f"Wrote {total} challenges in {len(chapters)} chapters "
+        f"to {args.output_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Lazy reader for the compiled challenge bundle.
+
+``bundle/`` is produced by ``python -m challenges.build`` from
+``content/*.toml``.  ``bundle/index.json`` lists the chapters and, per
+challenge, its chapter, titles and test count; each chapter's full
+records live in ``bundle/<chapter>.json``.  Opening the bundle only reads
+the index, so listing challenges never touches descriptions, solutions or
+tests.  A chapter file is read the first time one of its challenges is
+used and kept in a small LRU cache (``CHALLENGE_CHAPTER_CACHE_SIZE``
+chapters).
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .models import Challenge, TestCase
+
+
+BUNDLE_DIR = Path(__file__).resolve().parent / "bundle"
+FORMAT_VERSION = 2
+
+CHALLENGE_CHAPTER_CACHE_SIZE = int(
+    os.environ.get("CHALLENGE_CHAPTER_CACHE_SIZE", "8")
+)
+
+
+class ChallengeSummary:
+    """Index entry: enough to list a challenge without loading it."""
+
+    __slots__ = ("id", "chapter", "title", "title_es", "test_count")
+
+    def __init__(
+        self,
+        id: str,
+        chapter: str,
+        title: str,
+        title_es: Optional[str],
+        test_count: int,
+    ):
+        self.id = id
+        self.chapter = chapter
+        self.title = title
+        self.title_es = title_es
+        self.test_count = test_count
+
+
+def challenge_from_record(record: Dict[str, Any]) -> Challenge:
+    """Build a Challenge from a record the build step already validated."""
+    fields = dict(record)
+    fields["tests"] = [TestCase.model_construct(**test) for test in record["tests"]]
+    return Challenge.model_construct(**fields)
+
+
+class ChallengeBundle(Mapping):
+    """Read-only ``id -> Challenge`` mapping backed by the bundle directory."""
+
+    def __init__(
+        self,
+        path: Path = BUNDLE_DIR,
+        cache_size: int = CHALLENGE_CHAPTER_CACHE_SIZE,
+    ):
+        self.path = Path(path)
+        self.cache_size = max(cache_size, 1)
+        try:
+            index = json.loads((self.path / "index.json").read_bytes())
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Challenge bundle {self.path} is missing; "
+                "build it with `python -m challenges.build`."
+            ) from None
+        if index.get("format") != FORMAT_VERSION:
+            raise RuntimeError(
+                f"Challenge bundle {self.path} has format "
+                f"{index.get('format')!r}, expected {FORMAT_VERSION}; "
+                "rebuild it with `python -m challenges.build`."
+            )
+        self.chapters: List[Dict[str, Any]] = index["chapters"]
+        self._summaries: Dict[str, ChallengeSummary] = {
+            entry["id"]: ChallengeSummary(
+                entry["id"],
+                entry["chapter"],
+                entry["title"],
+                entry.get("title_es"),
+                entry["test_count"],
+            )
+            for entry in index["challenges"]
+        }
+        self._cache: "OrderedDict[str, Dict[str, Challenge]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def chapter(self, chapter_id: str) -> Dict[str, Challenge]:
+        """All challenges of one chapter, loading the chapter if needed."""
+        with self._lock:
+            challenges = self._cache.get(chapter_id)
+            if challenges is not None:
+                self._cache.move_to_end(chapter_id)
+                return challenges
+
+        records = json.loads((self.path / f"{chapter_id}.json").read_bytes())
+        challenges = {
+            record["id"]: challenge_from_record(record) for record in records
+        }
+        with self._lock:
+            self._cache[chapter_id] = challenges
+            self._cache.move_to_end(chapter_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return challenges
+
+    def __getitem__(self, challenge_id: str) -> Challenge:
+        summary = self._summaries[challenge_id]
+        return self.chapter(summary.chapter)[challenge_id]
+
+    def __contains__(self, challenge_id: object) -> bool:
+        return challenge_id in self._summaries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._summaries)
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def summary(self, challenge_id: str) -> ChallengeSummary:
+        return self._summaries[challenge_id]
+
+    def summaries(self) -> List[ChallengeSummary]:
+        return list(self._summaries.values())
+
+    @property
+    def loaded_chapters(self) -> List[str]:
+        with self._lock:
+            return list(self._cache)
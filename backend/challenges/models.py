@@ -0,0 +1,23 @@
+"""Challenge models."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TestCase(BaseModel):
+    code: str
+    expected: str
+
+
+class Challenge(BaseModel):
+    id: str
+    title: str
+    description: str
+    solution: str  # Reference solution (hidden from user)
+    tests: List[TestCase]
+    starter_code: Optional[str] = ""
+    # Optional localized content (e.g. "es")
+    title_es: Optional[str] = None
+    description_es: Optional[str] = None
+    starter_code_es: Optional[str] = None
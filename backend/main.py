@@ -1,9 +1,13 @@
-import logging
 import os
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+import auth
+import metrics
+import structured_logging
+import tracing
+from request_recorder import RequestRecorderMiddleware
 from api.playground import cleanup_playground_sessions, router as playground_router
 from api.playground_v2 import cleanup_v2_workers, router as playground_v2_router
 
@@ -24,18 +28,36 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID"],
 )
 
-logging.basicConfig(level=logging.INFO)
+app.add_middleware(RequestRecorderMiddleware)
+app.add_middleware(tracing.TracingMiddleware)
+app.add_middleware(structured_logging.RequestIdMiddleware)
+
+structured_logging.configure()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Load the Cognito JWKS before the first authenticated request."""
+    await auth.start_jwks_refresh()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up playground GHCi sessions on shutdown."""
+    await auth.stop_jwks_refresh()
     cleanup_playground_sessions()
     cleanup_v2_workers()
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus scrape target. Not proxied by nginx; scrape it locally."""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 app.include_router(playground_router)
 app.include_router(playground_v2_router)
 
@@ -0,0 +1,250 @@
+"""
+In-process Prometheus-style metrics.
+
+A deliberately small implementation of counters, gauges and histograms that
+renders the Prometheus text exposition format, so the backend doesn't need
+an extra dependency for ``/metrics``.  All updates happen on the event loop
+thread; values are read back at scrape time.
+"""
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets (seconds): GHCi commands are usually sub-second, but the
+# startup and acquire timeouts go up to 30s.
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+_registry: List["_Metric"] = []
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"'
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, "
+                f"got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append(
+                f"{self.name}{suffix}{labels} {_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, optionally split by labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        if not name.endswith("_total"):
+            name += "_total"
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        if not self.labelnames:
+            self._values[()] = 0.0
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        for key, value in sorted(self._values.items()):
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Gauge(_Metric):
+    """
+    Point-in-time value.
+
+    Either set explicitly, or computed at scrape time by ``callback``,
+    which returns ``(label_values, value)`` pairs.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        callback: Optional[
+            Callable[[], Iterable[Tuple[LabelValues, float]]]
+        ] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str):
+        self._values[self._key(labels)] = value
+
+    def samples(self):
+        if self._callback is not None:
+            items = list(self._callback())
+        else:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values (seconds)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+        if not self.labelnames:
+            self._values[()] = [0.0] * (len(self.buckets) + 2)
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = [0.0] * (len(self.buckets) + 2)
+            self._values[key] = state
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str):
+        """Observe the wall-clock duration of the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def samples(self):
+        bucket_names = self.labelnames + ("le",)
+        for key, state in sorted(self._values.items()):
+            for bound, count in zip(self.buckets, state):
+                yield (
+                    "_bucket",
+                    _format_labels(bucket_names, key + (_format_value(bound),)),
+                    count,
+                )
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, state[-2]
+            yield "_count", labels, state[-1]
+
+
+def render() -> bytes:
+    """Render every registered metric in the Prometheus text format."""
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def process_tree_rss_bytes(pid: int) -> Optional[int]:
+    """
+    Resident set size of ``pid`` plus all of its descendants.
+
+    GHCi runs under ``timeout``, so the interesting memory belongs to a
+    child of the process we spawned.  Returns None when /proc is not
+    available or the process is gone.
+    """
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    stack = [pid]
+    seen = set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            if current == pid:
+                return None
+            continue
+        try:
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    stack.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            pass
+    return total
@@ -0,0 +1,205 @@
+"""
+Opt-in recorder of eval/submit traffic for realistic load replays.
+
+When ``REQUEST_RECORD_FILE`` is set, a sample of playground eval and submit
+requests is appended to that file as compact JSON lines (gzip-compressed if
+the name ends in ``.gz``).  Each record keeps only what a replay needs:
+
+    {"t": 1718000000.123, "api": "v2", "kind": "eval",
+     "session": "3f9c...", "challenge_id": null,
+     "history": ["x = 1"], "code": "x + 1",
+     "duration_ms": 41.2, "status": 200, "result": "ok"}
+
+Session ids are replaced by a salted hash that is stable within one server
+process (so a student's requests can be replayed in order) and can't be
+linked back to the original id.  No headers, tokens or client addresses
+are stored.  ``REQUEST_RECORD_SAMPLE_RATE`` (0..1, default 1) controls the
+share of requests kept.  Replay a recording with
+``tests/load/replay_trace.py``.
+"""
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from background import BatchingThread
+
+
+logger = logging.getLogger(__name__)
+
+REQUEST_RECORD_FILE = os.environ.get("REQUEST_RECORD_FILE", "").strip()
+REQUEST_RECORD_SAMPLE_RATE = float(
+    os.environ.get("REQUEST_RECORD_SAMPLE_RATE", "1")
+)
+
+# Bodies larger than this are not captured (the record keeps the rest).
+MAX_CAPTURED_BODY_BYTES = 256 * 1024
+
+RECORDED_PATH_RE = re.compile(
+    r"^/api/(?:(?P<v2>v2/)?playground)/"
+    r"(?:sessions/(?P<session>[^/]+)/(?P<eval>eval)"
+    r"|challenges/(?P<challenge>[^/]+)/(?P<submit>submit))$"
+)
+
+BUSY_ERROR = "Server busy, please try again later"
+
+
+def classify_result(status: int, body: Any) -> str:
+    """Summarise a response as ok / busy / history_failed / error."""
+    if status != 200 or not isinstance(body, dict):
+        return "error"
+    if body.get("error") == BUSY_ERROR:
+        return "busy"
+    if body.get("history_failed"):
+        return "history_failed"
+    if "error" in body:
+        return "error"
+    return "ok"
+
+
+class _Writer(BatchingThread):
+    """Appends records from a background thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        super().__init__("request-recorder")
+
+    def _open(self):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, "at", encoding="utf-8")
+        return open(self.path, "a", encoding="utf-8")
+
+    def handle(self, records: List[Dict[str, Any]]):
+        try:
+            with self._open() as f:
+                for record in records:
+                    f.write(
+                        json.dumps(
+                            record,
+                            ensure_ascii=False,
+                            separators=(",", ":"),
+                        ) + "\n"
+                    )
+        except OSError as e:
+            logger.warning("Could not record requests to %s: %s", self.path, e)
+
+
+class RequestRecorderMiddleware:
+    """ASGI middleware sampling eval/submit requests into a recording."""
+
+    def __init__(
+        self,
+        app,
+        path: str = REQUEST_RECORD_FILE,
+        sample_rate: float = REQUEST_RECORD_SAMPLE_RATE,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self._salt = os.urandom(16)
+        self._writer = _Writer(path) if path else None
+        if self._writer is not None:
+            atexit.register(self._writer.shutdown)
+
+    def _anonymize(self, session_id: Optional[str]) -> Optional[str]:
+        if session_id is None:
+            return None
+        digest = hashlib.blake2b(
+            session_id.encode("utf-8"), key=self._salt, digest_size=8,
+        )
+        return digest.hexdigest()
+
+    async def __call__(self, scope, receive, send):
+        if (
+            self._writer is None
+            or scope["type"] != "http"
+            or scope["method"] != "POST"
+        ):
+            await self.app(scope, receive, send)
+            return
+        match = RECORDED_PATH_RE.match(scope["path"])
+        if match is None or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        request_chunks = []
+        response_chunks = []
+        captured = {"request": 0, "response": 0, "status": 0}
+
+        async def recording_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                captured["request"] += len(body)
+                if captured["request"] <= MAX_CAPTURED_BODY_BYTES:
+                    request_chunks.append(body)
+            return message
+
+        async def recording_send(message):
+            if message["type"] == "http.response.start":
+                captured["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                captured["response"] += len(body)
+                if captured["response"] <= MAX_CAPTURED_BODY_BYTES:
+                    response_chunks.append(body)
+            await send(message)
+
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, recording_receive, recording_send)
+        finally:
+            duration = time.perf_counter() - start
+            self._writer.submit(
+                self._record(
+                    match,
+                    started_at,
+                    duration,
+                    captured,
+                    b"".join(request_chunks),
+                    b"".join(response_chunks),
+                )
+            )
+
+    def _record(
+        self,
+        match: "re.Match[str]",
+        started_at: float,
+        duration: float,
+        captured: Dict[str, int],
+        request_body: bytes,
+        response_body: bytes,
+    ) -> Dict[str, Any]:
+        request = _loads(request_body, captured["request"])
+        response = _loads(response_body, captured["response"])
+        if not isinstance(request, dict):
+            request = {}
+        return {
+            "t": round(started_at, 3),
+            "api": "v2" if match["v2"] else "v1",
+            "kind": "eval" if match["eval"] else "submit",
+            "session": self._anonymize(
+                match["session"] or request.get("session_id")
+            ),
+            "challenge_id": match["challenge"],
+            "history": request.get("history"),
+            "code": request.get("code"),
+            "duration_ms": round(duration * 1000, 3),
+            "status": captured["status"],
+            "result": classify_result(captured["status"], response),
+        }
+
+
+def _loads(body: bytes, total_bytes: int) -> Any:
+    if not body or total_bytes > MAX_CAPTURED_BODY_BYTES:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 # --- Pydantic models ---
@@ -9,6 +9,16 @@ class TestResult(BaseModel):
     expected: str
     actual: str
 
+    @staticmethod
+    def payload(passed: bool, test_code: str, expected: str, actual: str) -> Dict[str, Any]:
+        """Response dict with this model's fields, built without validation."""
+        return {
+            "passed": passed,
+            "test_code": test_code,
+            "expected": expected,
+            "actual": actual,
+        }
+
 
 class SubmitRequest(BaseModel):
     code: str
@@ -0,0 +1,174 @@
+"""
+Structured, request-scoped logging for the backend.
+
+``configure()`` installs a single stderr handler on the root logger.  With
+``LOG_FORMAT=json`` every record is one compact JSON object per line, e.g.:
+
+    {"ts": 1718000000.123, "level": "INFO", "logger": "api.playground",
+     "msg": "Load output", "request_id": "9f3c0a1b2d4e5f60",
+     "output": "Ok, one module loaded."}
+
+``RequestIdMiddleware`` gives each HTTP request an id (the incoming
+``X-Request-ID`` header, or a random one) that is attached to every record
+logged while serving it and echoed back in the response.
+
+Code and GHCi output are logged with ``log_payload()``, never with an
+f-string: payload records are only built for a sample of requests
+(``LOG_PAYLOAD_SAMPLE_RATE``, 0..1, default 0.01) and string fields are cut
+to ``LOG_PAYLOAD_MAX_CHARS`` when the record is formatted.
+"""
+import json
+import logging
+import os
+import random
+import re
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+import tracing
+
+
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text").strip().lower()
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+LOG_PAYLOAD_SAMPLE_RATE = float(os.environ.get("LOG_PAYLOAD_SAMPLE_RATE", "0.01"))
+LOG_PAYLOAD_MAX_CHARS = int(os.environ.get("LOG_PAYLOAD_MAX_CHARS", "512"))
+
+# Incoming ids are only trusted if they look like an id.
+REQUEST_ID_RE = re.compile(r"^[\w.-]{1,64}$")
+
+_request_id: ContextVar[str] = ContextVar("request_id", default="")
+_payload_sampled: ContextVar[Optional[bool]] = ContextVar(
+    "payload_sampled", default=None,
+)
+
+
+def request_id() -> str:
+    """Id of the request being served, or "" outside a request."""
+    return _request_id.get()
+
+
+def _sample() -> bool:
+    return random.random() < LOG_PAYLOAD_SAMPLE_RATE
+
+
+def payloads_enabled(logger: logging.Logger) -> bool:
+    """Whether payload records should be built for the current request."""
+    if not logger.isEnabledFor(logging.INFO):
+        return False
+    sampled = _payload_sampled.get()
+    return _sample() if sampled is None else sampled
+
+
+def log_payload(logger: logging.Logger, msg: str, *args: Any, **payload: Any):
+    """
+    Log ``msg`` at INFO with large fields (code, output) attached.
+
+    Nothing is formatted unless the current request was sampled; the
+    fields are truncated by the formatter, only when the record is written.
+    """
+    if payloads_enabled(logger):
+        logger.info(msg, *args, extra={"payload": payload})
+
+
+def truncate(value: Any, limit: int) -> Any:
+    if isinstance(value, str) and len(value) > limit:
+        return f"{value[:limit]}... [{len(value) - limit} more chars]"
+    return value
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the current request and trace ids."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        record.trace_id = tracing.current_trace_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One compact JSON object per record."""
+
+    def __init__(self, max_chars: Optional[int] = None):
+        super().__init__()
+        self.max_chars = LOG_PAYLOAD_MAX_CHARS if max_chars is None else max_chars
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in ("request_id", "trace_id"):
+            value = getattr(record, key, "")
+            if value:
+                entry[key] = value
+        for key, value in getattr(record, "payload", {}).items():
+            entry[key] = truncate(value, self.max_chars)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(
+            entry, ensure_ascii=False, separators=(",", ":"), default=str,
+        )
+
+
+class TextFormatter(logging.Formatter):
+    """The default ``LEVEL:logger:message`` layout, plus ids and payload."""
+
+    def __init__(self, max_chars: Optional[int] = None):
+        super().__init__("%(levelname)s:%(name)s:%(message)s")
+        self.max_chars = LOG_PAYLOAD_MAX_CHARS if max_chars is None else max_chars
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = []
+        if getattr(record, "request_id", ""):
+            extras.append(f"request_id={record.request_id}")
+        for key, value in getattr(record, "payload", {}).items():
+            extras.append(f"{key}={truncate(value, self.max_chars)!r}")
+        if not extras:
+            return line
+        first, newline, rest = line.partition("\n")
+        return f"{first} {' '.join(extras)}{newline}{rest}"
+
+
+def configure(log_format: str = LOG_FORMAT, level: str = LOG_LEVEL):
+    """Replace the root logger's handlers with one formatted stderr handler."""
+    handler = logging.StreamHandler()
+    handler.addFilter(RequestContextFilter())
+    handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+    logging.basicConfig(level=level, handlers=[handler], force=True)
+
+
+class RequestIdMiddleware:
+    """ASGI middleware binding a request id (and payload sampling) per request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = ""
+        for key, value in scope.get("headers", []):
+            if key == b"x-request-id":
+                rid = value.decode("latin-1")
+                break
+        if not REQUEST_ID_RE.match(rid):
+            rid = f"{random.getrandbits(64):016x}"
+        header = (b"x-request-id", rid.encode("latin-1"))
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        id_token = _request_id.set(rid)
+        sampled_token = _payload_sampled.set(_sample())
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            _payload_sampled.reset(sampled_token)
+            _request_id.reset(id_token)
@@ -0,0 +1,296 @@
+"""
+Lightweight request tracing with OpenTelemetry-compatible export.
+
+Spans follow the OpenTelemetry data model (128-bit trace ids, 64-bit span
+ids, parent links, attributes, status) and are exported as OTLP/JSON
+``ExportTraceServiceRequest`` documents, either appended to a JSONL file
+(readable by the collector's ``otlpjsonfile`` receiver) or POSTed to an
+OTLP/HTTP endpoint such as a local collector.
+
+Tracing is off unless one of these is set:
+
+    TRACE_EXPORT_FILE=/tmp/haskellito-spans.jsonl
+    TRACE_EXPORT_OTLP_ENDPOINT=http://127.0.0.1:4318/v1/traces
+
+Export happens on a background thread so the event loop never blocks on
+file or network I/O.
+"""
+import atexit
+import json
+import logging
+import os
+import random
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from background import BatchingThread
+
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = os.environ.get("TRACE_SERVICE_NAME", "haskellito-backend")
+TRACE_EXPORT_FILE = os.environ.get("TRACE_EXPORT_FILE", "").strip()
+TRACE_EXPORT_OTLP_ENDPOINT = os.environ.get(
+    "TRACE_EXPORT_OTLP_ENDPOINT", ""
+).strip()
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "current_span", default=None,
+)
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "kind",
+        "attributes", "start_ns", "end_ns", "status_code",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str = "",
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException):
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        data = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        return data
+
+
+class _NoopSpan:
+    """Stand-in yielded when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_error(self, exc: BaseException):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def export_request(spans: List[Span]) -> Dict[str, Any]:
+    """Wrap finished spans in an OTLP ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": [{
+                    "key": "service.name",
+                    "value": {"stringValue": SERVICE_NAME},
+                }],
+            },
+            "scopeSpans": [{
+                "scope": {"name": "haskellito"},
+                "spans": [s.to_otlp() for s in spans],
+            }],
+        }],
+    }
+
+
+class _Exporter(BatchingThread):
+    """Ships finished spans from a background thread."""
+
+    def __init__(self, file_path: str = "", endpoint: str = ""):
+        self.file_path = file_path
+        self.endpoint = endpoint
+        super().__init__("trace-exporter")
+
+    def handle(self, batch: List[Span]):
+        payload = json.dumps(
+            export_request(batch), separators=(",", ":"),
+        )
+        if self.file_path:
+            try:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(payload + "\n")
+            except OSError as e:
+                logger.warning("Could not write spans to %s: %s", self.file_path, e)
+        if self.endpoint:
+            request = urllib.request.Request(
+                self.endpoint,
+                data=payload.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    response.read()
+            except Exception as e:
+                logger.warning("Could not export spans to %s: %s", self.endpoint, e)
+
+
+_exporter: Optional[_Exporter] = None
+
+
+def configure(file_path: str = "", endpoint: str = ""):
+    """(Re)configure span export. Empty arguments disable tracing."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.shutdown()
+        _exporter = None
+    if file_path or endpoint:
+        _exporter = _Exporter(file_path=file_path, endpoint=endpoint)
+
+
+def enabled() -> bool:
+    return _exporter is not None
+
+
+def current_trace_id() -> str:
+    """Trace id of the innermost open span, or "" when there is none."""
+    current = _current_span.get()
+    return current.trace_id if current is not None else ""
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+@contextmanager
+def span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: int = SPAN_KIND_INTERNAL,
+    trace_id: str = "",
+    parent_span_id: str = "",
+):
+    """
+    Time the ``with`` block as a span, nested under the current span.
+
+    Yields the span so callers can attach attributes that are only known
+    once the work is done (output size, worker id, ...).
+    """
+    if _exporter is None:
+        yield _NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    if parent is not None and not trace_id:
+        trace_id = parent.trace_id
+        parent_span_id = parent.span_id
+    current = Span(
+        name,
+        trace_id=trace_id or _new_trace_id(),
+        parent_span_id=parent_span_id,
+        kind=kind,
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.record_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end_ns = time.time_ns()
+        exporter = _exporter
+        if exporter is not None:
+            exporter.submit(current)
+
+
+def _parse_traceparent(value: str) -> tuple[str, str]:
+    """Return (trace_id, parent_span_id) from a W3C traceparent header."""
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return "", ""
+    return parts[1], parts[2]
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a root server span for each HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        trace_id, parent_span_id = "", ""
+        for key, value in scope.get("headers", []):
+            if key == b"traceparent":
+                trace_id, parent_span_id = _parse_traceparent(
+                    value.decode("latin-1")
+                )
+                break
+
+        with span(
+            f"HTTP {scope['method']}",
+            {
+                "http.method": scope["method"],
+                "http.target": scope["path"],
+            },
+            kind=SPAN_KIND_SERVER,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        ) as root:
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    root.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            await self.app(scope, receive, send_with_status)
+
+
+configure(file_path=TRACE_EXPORT_FILE, endpoint=TRACE_EXPORT_OTLP_ENDPOINT)
+atexit.register(configure)
@@ -0,0 +1,24 @@
+import axios from 'axios'
+
+const API_BASE = '/api/v2/playground'
+
+/**
+ * One request per language for every challenge (list and details), shared by
+ * the challenge list and challenge pages. Failed requests are not cached.
+ */
+const catalogs = new Map()
+
+export function loadChallengeCatalog(lang) {
+  if (!catalogs.has(lang)) {
+    const request = axios
+      .get(`${API_BASE}/challenges/bundle`, { params: { lang } })
+      .then(({ data }) => ({
+        chapters: data.chapters,
+        challenges: data.challenges,
+        byId: Object.fromEntries(data.challenges.map(c => [c.id, c]))
+      }))
+    request.catch(() => catalogs.delete(lang))
+    catalogs.set(lang, request)
+  }
+  return catalogs.get(lang)
+}
@@ -94,7 +94,9 @@ npm ci
 npm run build
 cd "$ROOT"
 
-python3 serverless/frontend/export_challenges.py
+# CloudFront compresses the JSON at the edge, so the pre-compressed .gz/.br
+# copies (for local_edge.py and nginx gzip_static) are not built for S3.
+python3 serverless/frontend/export_challenges.py --compress ""
 
 SITE_BUCKET="$(stack_output SiteBucketName)"
 DISTRIBUTION_ID="$(stack_output SiteDistributionId)"
@@ -115,13 +117,33 @@ if [[ -d frontend/dist/assets ]]; then
     --cache-control "public,max-age=31536000,immutable"
 fi
 
+CHALLENGE_JSON_DIR="serverless/frontend/public/api/v2/playground/challenges"
+
+# Content-addressed challenge JSON never changes. Old hashes are kept (no
+# --delete) so clients holding a previous urls.json can still fetch them.
+aws s3 sync "${CHALLENGE_JSON_DIR}/assets" \
+  "s3://${SITE_BUCKET}/api/v2/playground/challenges/assets" \
+  "${PROFILE_ARGS[@]}" \
+  --region "$AWS_REGION" \
+  --content-type application/json \
+  --cache-control "public,max-age=31536000,immutable"
+
 aws s3 sync serverless/frontend/public/api "s3://${SITE_BUCKET}/api" \
   "${PROFILE_ARGS[@]}" \
   --region "$AWS_REGION" \
   --delete \
+  --exclude "v2/playground/challenges/assets/*" \
+  --exclude "v2/playground/challenges/urls.json" \
   --content-type application/json \
   --cache-control "public,max-age=300"
 
+aws s3 cp "${CHALLENGE_JSON_DIR}/urls.json" \
+  "s3://${SITE_BUCKET}/api/v2/playground/challenges/urls.json" \
+  "${PROFILE_ARGS[@]}" \
+  --region "$AWS_REGION" \
+  --content-type application/json \
+  --cache-control "public,max-age=60"
+
 aws cloudfront create-invalidation \
   "${PROFILE_ARGS[@]}" \
   --distribution-id "$DISTRIBUTION_ID" \
@@ -20,6 +20,14 @@ function handler(event) {
     return request;
   }
 
+  if (uri === prefix + "bundle" && request.querystring.chapter) {
+    var chapter = request.querystring.chapter.value;
+    if (/^[a-z0-9-]+$/.test(chapter)) {
+      request.uri = prefix + "bundle." + chapter + lang + ".json";
+      return request;
+    }
+  }
+
   if (uri.indexOf(prefix) === 0 && uri.indexOf("/submit") === -1) {
     if (uri.slice(-5) !== ".json") {
       request.uri = uri + lang + ".json";
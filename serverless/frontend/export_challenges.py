@@ -1,103 +1,261 @@
-"""Export public challenge metadata for static S3/CloudFront hosting."""
+"""Export public challenge metadata for static S3/CloudFront hosting.
+
+Files are minified JSON.  Each one also gets a pre-compressed ``.gz`` copy
+and, when the ``brotli`` package is installed, a ``.br`` copy.  Exports are
+incremental: ``manifest.json`` in the output directory records every
+file's sha256, and a file is written again only when its content changed.
+Files that are no longer produced are removed.  Writes run in parallel.
+
+Besides the stable names the CloudFront rewrite function maps API URLs to,
+every list and detail payload is also written under a content-addressed
+name, ``assets/<name>.<lang>.<hash>.json``, which never changes content and
+can be cached as immutable.  ``urls.json`` maps each language's index,
+bundles and each challenge to its current hashed URL; it is the only file
+that needs a short cache lifetime.
+
+``bundle.<lang>.json`` carries every challenge's detail payload for one
+language, and ``bundle.<chapter>.<lang>.json`` one chapter's, matching
+``GET /api/v2/playground/challenges/bundle?lang=<lang>[&chapter=<chapter>]``.
+"""
 
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
 ROOT = Path(__file__).resolve().parents[2]
 BACKEND_DIR = ROOT / "backend"
 DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / "public"
 LANGUAGES = ("en", "es")
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+API_DIR = "api/v2/playground/challenges"
+HASHED_DIR = f"{API_DIR}/assets"
+URL_INDEX = f"{API_DIR}/urls.json"
+HASH_LENGTH = 12
 
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+from api.catalog import (  # noqa: E402
+    challenge_bundle_payload,
+    challenge_detail_payload,
+    challenge_list_payload,
+)
 from challenges import CHALLENGES  # noqa: E402
 
 
-def localized_title(challenge: Any, lang: str) -> str:
-    if lang == "es" and challenge.title_es:
-        return challenge.title_es
-    return challenge.title
+def encode_json(payload: Any) -> bytes:
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
 
 
-def localized_description(challenge: Any, lang: str) -> str:
-    if lang == "es" and challenge.description_es:
-        return challenge.description_es
-    return challenge.description
+# --- Compression ---------------------------------------------------------------
 
+def gzip_compress(content: bytes) -> bytes:
+    # mtime=0 keeps the output (and so the manifest) reproducible.
+    return gzip.compress(content, compresslevel=9, mtime=0)
 
-def localized_starter_code(challenge: Any, lang: str) -> str:
-    if lang == "es" and challenge.starter_code_es:
-        return challenge.starter_code_es
-    return challenge.starter_code or ""
 
+def available_encoders(requested: list[str]) -> dict[str, Callable[[bytes], bytes]]:
+    """Suffix -> compressor for the requested encodings that can be produced."""
+    encoders: dict[str, Callable[[bytes], bytes]] = {}
+    for name in requested:
+        if name == "gzip":
+            encoders["gz"] = gzip_compress
+        elif name == "br":
+            try:
+                import brotli
+            except ImportError:
+                print(
+                    "brotli is not installed; skipping .br files "
+                    "(pip install brotli).",
+                    file=sys.stderr,
+                )
+                continue
+            encoders["br"] = lambda content: brotli.compress(content, quality=11)
+    return encoders
 
-def challenge_list_payload(lang: str) -> dict[str, list[dict[str, str]]]:
-    return {
-        "challenges": [
-            {
-                "id": challenge.id,
-                "title": localized_title(challenge, lang),
-            }
-            for challenge in CHALLENGES.values()
-        ]
-    }
 
+# --- Planning ------------------------------------------------------------------
+
+def hashed_path(name: str, lang: str, content: bytes) -> str:
+    return f"{HASHED_DIR}/{name}.{lang}.{sha256(content)[:HASH_LENGTH]}.json"
 
-def challenge_detail_payload(challenge_id: str, lang: str) -> dict[str, Any]:
-    challenge = CHALLENGES[challenge_id]
-    return {
-        "id": challenge.id,
-        "title": localized_title(challenge, lang),
-        "description": localized_description(challenge, lang),
-        "starter_code": localized_starter_code(challenge, lang),
-        "test_count": len(challenge.tests),
-    }
 
+def planned_files() -> dict[str, bytes]:
+    """Relative path -> minified JSON for every exported file.
 
-def write_json(path: Path, payload: dict[str, Any]) -> None:
+    Each payload is encoded once and shared by the ``api/`` layout (which
+    mirrors the API URLs, plus unsuffixed English defaults), its hashed
+    copy and the ``challenges/`` layout.
+    """
+    files: dict[str, bytes] = {}
+    urls: dict[str, Any] = {"index": {}, "bundles": {}, "challenges": {}}
+    bundles = [("bundle", None)] + [
+        (f"bundle.{chapter['id']}", chapter["id"]) for chapter in CHALLENGES.chapters
+    ]
+    for lang in LANGUAGES:
+        index = encode_json(challenge_list_payload(lang))
+        files[f"{API_DIR}/index.{lang}.json"] = index
+        files[f"challenges/index.{lang}.json"] = index
+        if lang == "en":
+            files[f"{API_DIR}/index.json"] = index
+        hashed = hashed_path("index", lang, index)
+        files[hashed] = index
+        urls["index"][lang] = f"/{hashed}"
+
+        for challenge_id in CHALLENGES:
+            detail = encode_json(
+                challenge_detail_payload(CHALLENGES[challenge_id], lang)
+            )
+            files[f"{API_DIR}/{challenge_id}.{lang}.json"] = detail
+            files[f"challenges/{challenge_id}.{lang}.json"] = detail
+            if lang == "en":
+                files[f"{API_DIR}/{challenge_id}.json"] = detail
+            hashed = hashed_path(challenge_id, lang, detail)
+            files[hashed] = detail
+            urls["challenges"].setdefault(challenge_id, {})[lang] = f"/{hashed}"
+
+        for name, chapter_id in bundles:
+            bundle = encode_json(challenge_bundle_payload(lang, chapter_id))
+            files[f"{API_DIR}/{name}.{lang}.json"] = bundle
+            if lang == "en":
+                files[f"{API_DIR}/{name}.json"] = bundle
+            hashed = hashed_path(name, lang, bundle)
+            files[hashed] = bundle
+            urls["bundles"].setdefault(chapter_id or "all", {})[lang] = f"/{hashed}"
+
+    files[URL_INDEX] = encode_json(urls)
+    return files
+
+
+# --- Writing -------------------------------------------------------------------
+
+def sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_manifest(output_dir: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text("utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def write_bytes(path: Path, content: bytes) -> None:
     if path.parent.exists() and not path.parent.is_dir():
         path.parent.unlink()
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_bytes(content)
+    os.replace(temporary, path)
+
+
+def is_current(output_dir: Path, relative: str, entry: dict[str, Any] | None,
+               digest: str, suffixes: list[str]) -> bool:
+    if not entry or entry.get("sha256") != digest:
+        return False
+    if sorted(entry.get("encodings", {})) != sorted(suffixes):
+        return False
+    path = output_dir / relative
+    try:
+        if path.stat().st_size != entry.get("bytes"):
+            return False
+    except OSError:
+        return False
+    return all(
+        path.with_name(f"{path.name}.{suffix}").is_file() for suffix in suffixes
     )
 
 
-def export_api_compatible_files(output_dir: Path) -> None:
-    api_dir = output_dir / "api" / "v2" / "playground" / "challenges"
-    write_json(api_dir / "index.json", challenge_list_payload("en"))
-    for challenge_id in CHALLENGES:
-        write_json(
-            api_dir / f"{challenge_id}.json",
-            challenge_detail_payload(challenge_id, "en"),
+def write_file(
+    output_dir: Path,
+    relative: str,
+    content: bytes,
+    encoders: dict[str, Callable[[bytes], bytes]],
+) -> dict[str, Any]:
+    path = output_dir / relative
+    write_bytes(path, content)
+    encodings = {}
+    for suffix, compress in encoders.items():
+        compressed = compress(content)
+        write_bytes(path.with_name(f"{path.name}.{suffix}"), compressed)
+        encodings[suffix] = len(compressed)
+    return {"sha256": sha256(content), "bytes": len(content), "encodings": encodings}
+
+
+def remove_file(output_dir: Path, relative: str, entry: dict[str, Any]) -> None:
+    path = output_dir / relative
+    for suffix in ["", *(f".{s}" for s in entry.get("encodings", {}))]:
+        path.with_name(f"{path.name}{suffix}").unlink(missing_ok=True)
+
+
+def export(
+    output_dir: Path,
+    encodings: list[str],
+    jobs: int,
+    force: bool = False,
+) -> dict[str, int]:
+    """Bring ``output_dir`` up to date; return counts of what was done."""
+    files = planned_files()
+    encoders = available_encoders(encodings)
+    previous = load_manifest(output_dir)
+    suffixes = list(encoders)
+
+    manifest: dict[str, Any] = {}
+    to_write: list[tuple[str, bytes]] = []
+    for relative, content in files.items():
+        digest = sha256(content)
+        entry = previous.get(relative)
+        if not force and is_current(output_dir, relative, entry, digest, suffixes):
+            manifest[relative] = entry
+        else:
+            to_write.append((relative, content))
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        written = executor.map(
+            lambda item: (item[0], write_file(output_dir, item[0], item[1], encoders)),
+            to_write,
         )
+        manifest.update(written)
 
-    for lang in LANGUAGES:
-        write_json(api_dir / f"index.{lang}.json", challenge_list_payload(lang))
-        for challenge_id in CHALLENGES:
-            write_json(
-                api_dir / f"{challenge_id}.{lang}.json",
-                challenge_detail_payload(challenge_id, lang),
-            )
+    for relative, _ in to_write:
+        for suffix in previous.get(relative, {}).get("encodings", {}):
+            if suffix not in encoders:
+                path = output_dir / relative
+                path.with_name(f"{path.name}.{suffix}").unlink(missing_ok=True)
 
+    removed = [relative for relative in previous if relative not in files]
+    for relative in removed:
+        remove_file(output_dir, relative, previous[relative])
 
-def export_localized_files(output_dir: Path) -> None:
-    challenges_dir = output_dir / "challenges"
-    for lang in LANGUAGES:
-        write_json(challenges_dir / f"index.{lang}.json", challenge_list_payload(lang))
-        for challenge_id in CHALLENGES:
-            write_json(
-                challenges_dir / f"{challenge_id}.{lang}.json",
-                challenge_detail_payload(challenge_id, lang),
-            )
+    write_bytes(
+        output_dir / MANIFEST_NAME,
+        (json.dumps(
+            {"version": MANIFEST_VERSION, "files": dict(sorted(manifest.items()))},
+            indent=2,
+        ) + "\n").encode("utf-8"),
+    )
+    return {
+        "files": len(files),
+        "written": len(to_write),
+        "unchanged": len(files) - len(to_write),
+        "removed": len(removed),
+    }
 
 
 def parse_args() -> argparse.Namespace:
@@ -110,15 +268,39 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_OUTPUT_DIR,
         help=f"Output directory. Defaults to {DEFAULT_OUTPUT_DIR}.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--compress",
+        default="gzip,br",
+        help="Comma-separated pre-compressed variants: gzip, br. Empty for none.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, (os.cpu_count() or 1) * 2),
+        help="Parallel file writers.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the manifest and rewrite every file.",
+    )
+    args = parser.parse_args()
+    args.compress = [name for name in args.compress.split(",") if name]
+    unknown = set(args.compress) - {"gzip", "br"}
+    if unknown:
+        parser.error(f"unknown --compress value(s): {', '.join(sorted(unknown))}")
+    return args
 
 
 def main() -> None:
     args = parse_args()
     output_dir = args.output_dir.resolve()
-    export_api_compatible_files(output_dir)
-    export_localized_files(output_dir)
-    print(f"Exported {len(CHALLENGES)} challenges to {output_dir}")
+    stats = export(output_dir, args.compress, args.jobs, args.force)
+    print(
+        f"Exported {len(CHALLENGES)} challenges to {output_dir}: "
+        f"{stats['written']} written, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed"
+    )
 
 
 if __name__ == "__main__":
@@ -1,14 +1,45 @@
-"""Local CloudFront/S3/API Gateway simulator for serverless development."""
+"""Local CloudFront/S3/API Gateway simulator for serverless development.
+
+The edge runs on one asyncio event loop, so a single process can hold
+thousands of concurrent client connections, long-lived streaming ones
+included.  Routing matches the deployed distribution: challenge JSON from
+``public/``, ``/api/`` to the API origin, everything else from
+``frontend/dist`` with the SPA fallback to ``index.html``.
+
+Static files are served from an in-memory cache keyed by path and mtime, with
+``ETag``/``Last-Modified`` validators, conditional GETs (304), single byte
+ranges (206/416) and the exporter's pre-compressed ``.br``/``.gz`` copies.
+Files above ``--sendfile-threshold`` are not held in memory; their bodies go
+from the page cache to the socket with ``os.sendfile``.
+
+``/api/`` requests are proxied over a pool of keep-alive connections to the
+origin.  Request and response bodies are streamed, not buffered, so chunked
+and long-lived streaming responses reach the client as they are produced.
+
+``/__edge/stats`` shows live concurrency and latency figures;
+``/__edge/stats.json`` returns the same numbers for scripts.
+"""
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import email.utils
+import html
+import http.client
+import io
+import json
 import mimetypes
-import urllib.error
+import os
+import re
+import stat
+import threading
+import time
 import urllib.parse
-import urllib.request
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import Counter, OrderedDict, deque
+from http import HTTPStatus
 from pathlib import Path
+from typing import AsyncIterator
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -16,46 +47,626 @@ FRONTEND_DIST = ROOT / "frontend" / "dist"
 PUBLIC_DIR = Path(__file__).resolve().parent / "public"
 DEFAULT_API_ORIGIN = "http://127.0.0.1:3000"
 CHALLENGES_PREFIX = "/api/v2/playground/challenges"
+HASHED_CHALLENGES_PREFIX = f"{CHALLENGES_PREFIX}/assets/"
+CHALLENGE_URL_INDEX = f"{CHALLENGES_PREFIX}/urls.json"
+CHALLENGE_BUNDLE = f"{CHALLENGES_PREFIX}/bundle"
+CHAPTER_ID_RE = re.compile(r"^[a-z0-9-]+$")
+STATS_PATH = "/__edge/stats"
+
+# Mirrors what CloudFront sees from S3 object metadata (see README.md).
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+URL_INDEX_CACHE_CONTROL = "public, max-age=60"
+DEFAULT_CACHE_CONTROL = "no-store"
+
+FILE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SENDFILE_MIN_BYTES = 256 * 1024
+# Preferred first; suffixes match export_challenges.py.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+# Per socket operation, not per request: streaming responses may run longer.
+PROXY_TIMEOUT = 300.0
+PROXY_MAX_IDLE = 32
+# Below uvicorn's default 5 s keep-alive, so the origin never closes first.
+PROXY_IDLE_SECONDS = 4.0
+PROXY_CHUNK_BYTES = 64 * 1024
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade",
+}
+
+# Client side.
+KEEPALIVE_TIMEOUT = 75.0
+MAX_HEADER_BYTES = 64 * 1024
+LISTEN_BACKLOG = 4096
+LATENCY_SAMPLES = 10_000
+
+# Everything that means "this connection is no longer usable".
+STREAM_ERRORS = (OSError, EOFError, ValueError, asyncio.LimitOverrunError)
+
+
+class CachedFile:
+    __slots__ = (
+        "path", "mtime_ns", "size", "content_type", "etag", "last_modified", "body",
+    )
+
+    def __init__(self, path: Path, st: os.stat_result, content_type: str,
+                 body: bytes | None) -> None:
+        self.path = path
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self.content_type = content_type
+        # Same shape as nginx: cheap to compute, changes whenever the file does.
+        self.etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        self.last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        self.body = body
+
+
+class FileCache:
+    """Static file metadata and bodies, revalidated with one ``stat`` per hit.
+
+    Bodies of files smaller than ``sendfile_min_bytes`` are kept, up to
+    ``max_bytes`` in total (least recently used evicted first).  Larger
+    files only have their metadata cached and are sent with ``os.sendfile``.
+    """
+
+    def __init__(self, max_bytes: int = FILE_CACHE_MAX_BYTES,
+                 sendfile_min_bytes: int = SENDFILE_MIN_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.sendfile_min_bytes = sendfile_min_bytes
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Path, CachedFile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, content_type: str | None = None) -> CachedFile | None:
+        """The current entry for ``path``, or None if it is not a regular file.
+
+        ``content_type`` overrides the guess from the name; pre-compressed
+        variants pass their original file's type.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if (entry is not None and entry.mtime_ns == st.st_mtime_ns
+                    and entry.size == st.st_size):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+        body = None
+        if st.st_size < self.sendfile_min_bytes:
+            try:
+                body = path.read_bytes()
+            except OSError:
+                return None
+        if content_type is None:
+            content_type = (
+                mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            )
+        entry = CachedFile(path, st, content_type, body)
+        if body is not None and len(body) != entry.size:
+            # Rewritten between stat() and read(); serve it, cache it next time.
+            return entry
+
+        with self._lock:
+            self.misses += 1
+            previous = self._entries.pop(path, None)
+            if previous is not None and previous.body is not None:
+                self.cached_bytes -= len(previous.body)
+            if body is not None:
+                self.cached_bytes += len(body)
+            self._entries[path] = entry
+            while self.cached_bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                if evicted.body is not None:
+                    self.cached_bytes -= len(evicted.body)
+        return entry
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    accepted = set()
+    for item in (header or "").split(","):
+        name, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if name.strip():
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in header.split(",")
+    )
+
+
+def is_not_modified(headers, entry: CachedFile) -> bool:
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, entry.etag)
+
+    if_modified_since = headers.get("If-Modified-Since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return entry.mtime_ns // 1_000_000_000 <= int(since.timestamp())
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """``(start, length)`` for a single ``bytes=`` range, None to send it all.
+
+    Malformed and multi-range headers are ignored, as RFC 9110 allows.
+    Raises ValueError when the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, dash, last = header[6:].strip().partition("-")
+    if not dash or not (first + last).isdigit():
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError(header)
+        start = max(size - suffix, 0)
+        return start, size - start
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    end = int(last) if last else size - 1
+    return start, min(end, size - 1) - start + 1
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str = "") -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def parse_headers(block: bytes) -> http.client.HTTPMessage:
+    return http.client.parse_headers(io.BytesIO(block))
+
+
+def response_head(status: int, headers: list[tuple[str, str]],
+                  reason: str | None = None) -> bytes:
+    if reason is None:
+        reason = HTTPStatus(status).phrase
+    lines = [f"HTTP/1.1 {status} {reason}"]
+    lines.extend(f"{key}: {value}" for key, value in headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def read_body(
+    reader: asyncio.StreamReader,
+    length: int | None,
+    chunked: bool,
+    timeout: float,
+) -> AsyncIterator[bytes]:
+    """Yield a message body as it arrives: chunked, sized, or until EOF."""
+
+    async def read(remaining: int) -> AsyncIterator[bytes]:
+        while remaining:
+            data = await asyncio.wait_for(
+                reader.read(min(remaining, PROXY_CHUNK_BYTES)), timeout,
+            )
+            if not data:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(data)
+            yield data
+
+    if chunked:
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            size = int(line.split(b";")[0].strip(), 16)
+            if size == 0:
+                break
+            async for data in read(size):
+                yield data
+            await asyncio.wait_for(reader.readexactly(2), timeout)
+        while await asyncio.wait_for(reader.readline(), timeout) not in (
+            b"\r\n", b"\n", b"",
+        ):
+            pass  # trailers
+    elif length is not None:
+        async for data in read(length):
+            yield data
+    else:
+        while data := await asyncio.wait_for(
+            reader.read(PROXY_CHUNK_BYTES), timeout,
+        ):
+            yield data
+
+
+class Request:
+    __slots__ = (
+        "method", "target", "version", "headers", "parsed", "chunked",
+        "content_length",
+    )
+
+    def __init__(self, method: str, target: str, version: str,
+                 headers: http.client.HTTPMessage) -> None:
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        self.parsed = urllib.parse.urlsplit(target)
+        self.chunked = "chunked" in headers.get("Transfer-Encoding", "").lower()
+        try:
+            self.content_length = int(headers.get("Content-Length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Bad Content-Length") from None
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("Connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return "keep-alive" in connection
+        return "close" not in connection
+
+    @property
+    def has_body(self) -> bool:
+        return self.chunked or self.content_length > 0
+
+
+async def read_request(reader: asyncio.StreamReader) -> Request | None:
+    """The next request on a connection, or None once the client has left."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if error.partial.strip():
+            raise HTTPError(400, "Incomplete request head") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431) from None
+
+    request_line, _, block = head.lstrip(b"\r\n").partition(b"\r\n")
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise HTTPError(400, "Bad request line")
+    return Request(parts[0], parts[1], parts[2], parse_headers(block))
+
+
+class Exchange:
+    """One request and its response on a client connection."""
+
+    __slots__ = (
+        "request", "reader", "writer", "keep_alive", "kind", "status",
+        "started", "first_byte",
+    )
+
+    def __init__(self, request: Request, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter) -> None:
+        self.request = request
+        self.reader = reader
+        self.writer = writer
+        # A GET/HEAD body is never read, so the connection can't be reused.
+        self.keep_alive = request.keep_alive and not (
+            request.method in ("GET", "HEAD") and request.has_body
+        )
+        self.kind = "frontend"
+        self.status = 0
+        self.started = time.perf_counter()
+        self.first_byte = self.started
+
+    def send_head(self, status: int, headers: list[tuple[str, str]],
+                  reason: str | None = None) -> None:
+        self.status = status
+        self.first_byte = time.perf_counter()
+        headers.append(("Date", email.utils.formatdate(usegmt=True)))
+        if not self.keep_alive:
+            headers.append(("Connection", "close"))
+        self.writer.write(response_head(status, headers, reason))
+
+
+class OriginPool:
+    """Idle keep-alive connections to one API origin."""
+
+    def __init__(self, origin: str, max_idle: int = PROXY_MAX_IDLE,
+                 timeout: float = PROXY_TIMEOUT) -> None:
+        parts = urllib.parse.urlsplit(origin)
+        self.ssl = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.netloc = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.opened = 0
+        self.reused = 0
+        self._idle: list[
+            tuple[float, asyncio.StreamReader, asyncio.StreamWriter]
+        ] = []
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    async def acquire(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """A connection and whether it was reused from the pool."""
+        while self._idle:
+            released_at, reader, writer = self._idle.pop()
+            # An idle connection only sees EOF if the origin closed it.
+            if (time.monotonic() - released_at < PROXY_IDLE_SECONDS
+                    and not reader.at_eof() and not writer.is_closing()):
+                self.reused += 1
+                return reader, writer, True
+            writer.close()
+        self.opened += 1
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl or None, limit=MAX_HEADER_BYTES,
+            ),
+            self.timeout,
+        )
+        return reader, writer, False
+
+    def release(self, reader: asyncio.StreamReader,
+                writer: asyncio.StreamWriter) -> None:
+        if len(self._idle) < self.max_idle and not reader.at_eof():
+            self._idle.append((time.monotonic(), reader, writer))
+        else:
+            writer.close()
+
+
+def percentiles(samples: deque[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def at(fraction: float) -> float:
+        index = min(int(fraction * len(ordered)), len(ordered) - 1)
+        return round(ordered[index] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": at(0.50),
+        "p95_ms": at(0.95),
+        "p99_ms": at(0.99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class EdgeStats:
+    """Counters for the stats page; latencies keep the last few thousand."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.connections = 0
+        self.peak_connections = 0
+        self.total_connections = 0
+        self.active_requests = 0
+        self.peak_active_requests = 0
+        self.streaming = 0
+        self.peak_streaming = 0
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self.first_byte: dict[str, deque[float]] = {}
+        self.duration: dict[str, deque[float]] = {}
+
+    def connection_opened(self) -> None:
+        self.connections += 1
+        self.total_connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+
+    def connection_closed(self) -> None:
+        self.connections -= 1
+
+    def request_started(self) -> None:
+        self.active_requests += 1
+        self.peak_active_requests = max(
+            self.peak_active_requests, self.active_requests,
+        )
+
+    def stream_started(self) -> None:
+        self.streaming += 1
+        self.peak_streaming = max(self.peak_streaming, self.streaming)
+
+    def request_finished(self, exchange: Exchange) -> None:
+        self.active_requests -= 1
+        self.requests[exchange.kind] += 1
+        self.statuses[exchange.status] += 1
+        finished = time.perf_counter()
+        for samples, elapsed in (
+            (self.first_byte, exchange.first_byte - exchange.started),
+            (self.duration, finished - exchange.started),
+        ):
+            samples.setdefault(
+                exchange.kind, deque(maxlen=LATENCY_SAMPLES),
+            ).append(elapsed)
+
+    def snapshot(self, pool: OriginPool, file_cache: FileCache) -> dict:
+        return {
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "connections": {
+                "open": self.connections,
+                "peak": self.peak_connections,
+                "total": self.total_connections,
+            },
+            "requests": {
+                "active": self.active_requests,
+                "peak_active": self.peak_active_requests,
+                "streaming": self.streaming,
+                "peak_streaming": self.peak_streaming,
+                "total": sum(self.requests.values()),
+                "by_kind": dict(self.requests),
+                "by_status": {
+                    str(status): count
+                    for status, count in sorted(self.statuses.items())
+                },
+            },
+            "first_byte": {
+                kind: percentiles(samples)
+                for kind, samples in sorted(self.first_byte.items())
+            },
+            "duration": {
+                kind: percentiles(samples)
+                for kind, samples in sorted(self.duration.items())
+            },
+            "origin_pool": {
+                "opened": pool.opened,
+                "reused": pool.reused,
+                "idle": pool.idle,
+            },
+            "file_cache": {
+                "hits": file_cache.hits,
+                "misses": file_cache.misses,
+                "cached_bytes": file_cache.cached_bytes,
+            },
+        }
 
 
-class LocalEdgeHandler(BaseHTTPRequestHandler):
-    frontend_dist: Path
-    public_dir: Path
-    api_origin: str
+def render_stats_html(snapshot: dict) -> bytes:
+    sections = []
+    for title, values in snapshot.items():
+        if not isinstance(values, dict):
+            sections.append(f"<p>{html.escape(title)}: {values}</p>")
+            continue
+        rows = "".join(
+            f"<tr><th>{html.escape(str(key))}</th>"
+            f"<td>{html.escape(json.dumps(value))}</td></tr>"
+            for key, value in values.items()
+        )
+        sections.append(f"<h2>{html.escape(title)}</h2><table>{rows}</table>")
+    return (
+        "<!doctype html><meta charset=utf-8>"
+        '<meta http-equiv="refresh" content="2">'
+        "<title>local edge stats</title>"
+        "<style>body{font-family:monospace}th{text-align:left;padding-right:2em}"
+        "</style><h1>local edge</h1>" + "".join(sections)
+    ).encode("utf-8")
 
-    def do_HEAD(self) -> None:
-        self.route_request(include_body=False)
 
-    def do_GET(self) -> None:
-        self.route_request(include_body=True)
+class LocalEdge:
+    def __init__(
+        self,
+        frontend_dist: Path,
+        public_dir: Path,
+        api_origin: str,
+        file_cache: FileCache | None = None,
+        proxy_timeout: float = PROXY_TIMEOUT,
+        access_log: bool = True,
+    ) -> None:
+        self.frontend_dist = frontend_dist
+        self.public_dir = public_dir
+        self.api_origin = api_origin
+        self.file_cache = file_cache or FileCache()
+        self.pool = OriginPool(api_origin, timeout=proxy_timeout)
+        self.access_log = access_log
+        self.stats = EdgeStats()
 
-    def do_OPTIONS(self) -> None:
-        self.proxy_request()
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(
+            self.handle_connection, host, port,
+            limit=MAX_HEADER_BYTES, backlog=LISTEN_BACKLOG,
+        )
 
-    def do_POST(self) -> None:
-        self.proxy_request()
+    async def serve_forever(self, host: str, port: int) -> None:
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
 
-    def do_PUT(self) -> None:
-        self.proxy_request()
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        self.stats.connection_opened()
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        read_request(reader), KEEPALIVE_TIMEOUT,
+                    )
+                except HTTPError as error:
+                    writer.write(response_head(
+                        error.status, [("Content-Length", "0"), ("Connection", "close")],
+                    ))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                if not await self.handle_request(request, reader, writer):
+                    break
+        except STREAM_ERRORS:
+            pass
+        finally:
+            self.stats.connection_closed()
+            writer.close()
 
-    def do_PATCH(self) -> None:
-        self.proxy_request()
+    async def handle_request(self, request: Request, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> bool:
+        """Serve one request; return whether the connection can be reused."""
+        exchange = Exchange(request, reader, writer)
+        self.stats.request_started()
+        try:
+            await self.route(exchange)
+            await writer.drain()
+        except HTTPError as error:
+            exchange.keep_alive = False
+            if not exchange.status:
+                await self.send_error(exchange, error.status, error.message)
+        finally:
+            self.stats.request_finished(exchange)
+            if self.access_log:
+                peer = writer.get_extra_info("peername") or ("-",)
+                print(
+                    f'{peer[0]} - "{request.method} {request.target} '
+                    f'{request.version}" {exchange.status}'
+                )
+        return exchange.keep_alive
 
-    def do_DELETE(self) -> None:
-        self.proxy_request()
+    async def route(self, exchange: Exchange) -> None:
+        request = exchange.request
+        parsed = request.parsed
+        if request.method not in ("GET", "HEAD"):
+            exchange.kind = "proxy"
+            await self.proxy_request(exchange)
+            return
+
+        if parsed.path in (STATS_PATH, f"{STATS_PATH}.json"):
+            exchange.kind = "stats"
+            self.serve_stats(exchange, as_json=parsed.path.endswith(".json"))
+            return
 
-    def route_request(self, include_body: bool) -> None:
-        parsed = urllib.parse.urlsplit(self.path)
         static_challenge = self.challenge_json_path(parsed)
         if static_challenge is not None:
-            self.serve_file(static_challenge, include_body)
+            exchange.kind = "static"
+            if not self.is_relative_to(static_challenge.resolve(), self.public_dir):
+                await self.send_error(exchange, 404)
+                return
+            await self.serve_file(
+                exchange,
+                static_challenge,
+                self.challenge_cache_control(parsed.path),
+            )
             return
 
         if parsed.path.startswith("/api/"):
-            self.proxy_request()
+            exchange.kind = "proxy"
+            await self.proxy_request(exchange)
             return
 
-        self.serve_frontend(parsed.path, include_body)
+        await self.serve_frontend(exchange, parsed.path)
 
     def challenge_json_path(
         self,
@@ -73,19 +684,32 @@ class LocalEdgeHandler(BaseHTTPRequestHandler):
         if values and values[0] in {"en", "es"}:
             lang = f".{values[0]}"
 
+        chapter = query.get("chapter", [""])[0]
         if path == CHALLENGES_PREFIX:
             object_path = f"{CHALLENGES_PREFIX}/index{lang}.json"
+        elif path == CHALLENGE_BUNDLE and CHAPTER_ID_RE.match(chapter):
+            object_path = f"{CHALLENGE_BUNDLE}.{chapter}{lang}.json"
+        elif path.endswith(".json"):
+            object_path = path
         else:
             object_path = f"{path}{lang}.json"
 
         return self.public_dir / object_path.lstrip("/")
 
-    def serve_frontend(self, request_path: str, include_body: bool) -> None:
+    @staticmethod
+    def challenge_cache_control(request_path: str) -> str:
+        if request_path.startswith(HASHED_CHALLENGES_PREFIX):
+            return IMMUTABLE_CACHE_CONTROL
+        if request_path == CHALLENGE_URL_INDEX:
+            return URL_INDEX_CACHE_CONTROL
+        return DEFAULT_CACHE_CONTROL
+
+    async def serve_frontend(self, exchange: Exchange, request_path: str) -> None:
         relative = request_path.lstrip("/") or "index.html"
         candidate = (self.frontend_dist / relative).resolve()
 
         if not self.is_relative_to(candidate, self.frontend_dist):
-            self.send_error(404)
+            await self.send_error(exchange, 404)
             return
 
         if candidate.is_dir():
@@ -94,75 +718,284 @@ class LocalEdgeHandler(BaseHTTPRequestHandler):
         if not candidate.exists():
             candidate = self.frontend_dist / "index.html"
 
-        self.serve_file(candidate, include_body)
+        # Vite fingerprints everything it emits under assets/.
+        cache_control = DEFAULT_CACHE_CONTROL
+        if candidate.parent == self.frontend_dist / "assets":
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        await self.serve_file(exchange, candidate, cache_control)
 
-    def serve_file(self, path: Path, include_body: bool) -> None:
-        if not path.exists() or not path.is_file():
-            self.send_error(404)
+    async def serve_file(
+        self,
+        exchange: Exchange,
+        path: Path,
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+    ) -> None:
+        entry = self.file_cache.get(path)
+        if entry is None:
+            await self.send_error(exchange, 404)
             return
 
-        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
-        body = path.read_bytes()
-
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(body)))
-        self.send_header("Cache-Control", "no-store")
-        self.end_headers()
-
-        if include_body:
-            self.wfile.write(body)
-
-    def proxy_request(self) -> None:
-        target = self.api_origin.rstrip("/") + self.path
-        body = self.read_request_body()
-        headers = {
-            key: value
-            for key, value in self.headers.items()
-            if key.lower() not in {"host", "content-length"}
-        }
+        headers = exchange.request.headers
+        encoding, served, varies = self.precompressed_variant(headers, path, entry)
+        validators = [
+            ("ETag", served.etag),
+            ("Last-Modified", served.last_modified),
+            ("Cache-Control", cache_control),
+        ]
+        if varies:
+            validators.append(("Vary", "Accept-Encoding"))
+
+        if is_not_modified(headers, served):
+            exchange.send_head(304, validators)
+            return
+
+        byte_range = None
+        if_range = headers.get("If-Range")
+        if if_range is None or if_range in (served.etag, served.last_modified):
+            try:
+                byte_range = parse_range(headers.get("Range"), served.size)
+            except ValueError:
+                exchange.send_head(416, [
+                    ("Content-Range", f"bytes */{served.size}"),
+                    ("Content-Length", "0"),
+                ])
+                return
+
+        start, length = byte_range or (0, served.size)
+        response_headers = [
+            ("Content-Type", served.content_type),
+            ("Content-Length", str(length)),
+        ]
+        if byte_range:
+            response_headers.append(
+                ("Content-Range", f"bytes {start}-{start + length - 1}/{served.size}"),
+            )
+        if encoding is not None:
+            response_headers.append(("Content-Encoding", encoding))
+        response_headers.append(("Accept-Ranges", "bytes"))
+        response_headers.extend(validators)
+        exchange.send_head(206 if byte_range else 200, response_headers)
 
-        request = urllib.request.Request(
-            target,
-            data=body,
-            headers=headers,
-            method=self.command,
+        if exchange.request.method == "HEAD" or not length:
+            return
+        if served.body is not None:
+            exchange.writer.write(memoryview(served.body)[start:start + length])
+            return
+        await exchange.writer.drain()
+        with open(served.path, "rb") as f:
+            await asyncio.get_running_loop().sendfile(
+                exchange.writer.transport, f, start, length,
+            )
+
+    def precompressed_variant(
+        self, headers, path: Path, entry: CachedFile,
+    ) -> tuple[str | None, CachedFile, bool]:
+        """``(Content-Encoding, file to send, whether any variant exists)``."""
+        accepted = accepted_encodings(headers.get("Accept-Encoding"))
+        chosen: tuple[str | None, CachedFile] = (None, entry)
+        varies = False
+        for encoding, suffix in PRECOMPRESSED:
+            variant = self.file_cache.get(
+                path.with_name(path.name + suffix), entry.content_type,
+            )
+            if variant is None:
+                continue
+            varies = True
+            if chosen[0] is None and encoding in accepted:
+                chosen = (encoding, variant)
+        return chosen[0], chosen[1], varies
+
+    def serve_stats(self, exchange: Exchange, as_json: bool) -> None:
+        snapshot = self.stats.snapshot(self.pool, self.file_cache)
+        if as_json:
+            body = json.dumps(snapshot, indent=2).encode("utf-8")
+            content_type = "application/json"
+        else:
+            body = render_stats_html(snapshot)
+            content_type = "text/html; charset=utf-8"
+        exchange.send_head(200, [
+            ("Content-Type", content_type),
+            ("Content-Length", str(len(body))),
+            ("Cache-Control", "no-store"),
+        ])
+        if exchange.request.method != "HEAD":
+            exchange.writer.write(body)
+
+    async def send_error(self, exchange: Exchange, status: int,
+                         message: str = "") -> None:
+        body = f"{status} {HTTPStatus(status).phrase}\n{message}".rstrip().encode()
+        exchange.send_head(status, [
+            ("Content-Type", "text/plain; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ])
+        if exchange.request.method != "HEAD":
+            exchange.writer.write(body)
+
+    # --- Proxy -------------------------------------------------------------------
+
+    def request_body(
+        self, exchange: Exchange,
+    ) -> tuple[int | None, AsyncIterator[bytes]] | None:
+        """``(Content-Length or None if chunked, chunks)`` for the client body."""
+        request = exchange.request
+        if not request.has_body:
+            return None
+        if request.headers.get("Expect", "").lower() == "100-continue":
+            exchange.writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        length = None if request.chunked else request.content_length
+        return length, read_body(
+            exchange.reader, length, request.chunked, KEEPALIVE_TIMEOUT,
         )
 
+    async def proxy_request(self, exchange: Exchange) -> None:
+        pool = self.pool
+        body = self.request_body(exchange)
+        while True:
+            writer = None
+            try:
+                reader, writer, reused = await pool.acquire()
+                await self.send_upstream_request(writer, exchange.request, body)
+                status, reason, headers = await asyncio.wait_for(
+                    self.read_response_head(reader), pool.timeout,
+                )
+            except STREAM_ERRORS as error:
+                if writer is not None:
+                    writer.close()
+                # An idle connection the origin already closed; safe to
+                # retry as long as no request body has been consumed.
+                if writer is not None and reused and body is None:
+                    continue
+                if body is not None:
+                    exchange.keep_alive = False
+                await self.send_error(
+                    exchange, 502,
+                    f"Could not reach API origin {self.api_origin}: {error!r}",
+                )
+                return
+            break
+
         try:
-            with urllib.request.urlopen(request, timeout=60) as response:
-                response_body = response.read()
-                self.send_response(response.status)
-                self.copy_response_headers(response.headers, len(response_body))
-                self.end_headers()
-                self.wfile.write(response_body)
-        except urllib.error.HTTPError as error:
-            error_body = error.read()
-            self.send_response(error.code)
-            self.copy_response_headers(error.headers, len(error_body))
-            self.end_headers()
-            self.wfile.write(error_body)
-        except urllib.error.URLError as error:
-            self.send_error(
-                502,
-                f"Could not reach API origin {self.api_origin}: {error.reason}",
+            reusable = await self.relay_response(
+                exchange, reader, status, reason, headers,
             )
+        except STREAM_ERRORS:
+            # The client or the origin went away mid-stream.
+            writer.close()
+            exchange.keep_alive = False
+            return
+        if reusable:
+            pool.release(reader, writer)
+        else:
+            writer.close()
 
-    def read_request_body(self) -> bytes | None:
-        length = int(self.headers.get("Content-Length", "0"))
-        if length <= 0:
-            return None
-        return self.rfile.read(length)
+    async def send_upstream_request(
+        self,
+        writer: asyncio.StreamWriter,
+        request: Request,
+        body: tuple[int | None, AsyncIterator[bytes]] | None,
+    ) -> None:
+        lines = [
+            f"{request.method} {self.pool.base_path}{request.target} HTTP/1.1",
+            f"Host: {self.pool.netloc}",
+        ]
+        skipped = HOP_BY_HOP_HEADERS | {"host", "content-length", "expect"}
+        lines.extend(
+            f"{key}: {value}" for key, value in request.headers.items()
+            if key.lower() not in skipped
+        )
+        if body is None:
+            if "Content-Length" in request.headers:
+                lines.append("Content-Length: 0")
+        elif body[0] is None:
+            lines.append("Transfer-Encoding: chunked")
+        else:
+            lines.append(f"Content-Length: {body[0]}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
 
-    def copy_response_headers(self, headers, content_length: int) -> None:
-        skipped = {"connection", "content-length", "transfer-encoding"}
-        for key, value in headers.items():
-            if key.lower() not in skipped:
-                self.send_header(key, value)
-        self.send_header("Content-Length", str(content_length))
+        if body is not None:
+            length, chunks = body
+            async for chunk in chunks:
+                if length is None:
+                    writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                else:
+                    writer.write(chunk)
+                await writer.drain()
+            if length is None:
+                writer.write(b"0\r\n\r\n")
+        await writer.drain()
 
-    def log_message(self, format: str, *args) -> None:
-        print(f"{self.address_string()} - {format % args}")
+    @staticmethod
+    async def read_response_head(
+        reader: asyncio.StreamReader,
+    ) -> tuple[int, str, http.client.HTTPMessage]:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line, _, block = head.partition(b"\r\n")
+            _, status, reason = (status_line.decode("latin-1").split(" ", 2) + [""])[:3]
+            # Interim responses (100 Continue, 103 Early Hints) are dropped.
+            if not 100 <= int(status) < 200:
+                return int(status), reason, parse_headers(block)
+
+    async def relay_response(
+        self,
+        exchange: Exchange,
+        reader: asyncio.StreamReader,
+        status: int,
+        reason: str,
+        headers: http.client.HTTPMessage,
+    ) -> bool:
+        """Stream the origin's response; return whether its connection is reusable."""
+        connection_tokens = {
+            token.strip().lower()
+            for token in headers.get("Connection", "").split(",")
+        }
+        skipped = HOP_BY_HOP_HEADERS | connection_tokens | {"content-length", "date"}
+        response_headers = [
+            (key, value) for key, value in headers.items()
+            if key.lower() not in skipped
+        ]
+
+        length = headers.get("Content-Length")
+        upstream_chunked = "chunked" in headers.get("Transfer-Encoding", "").lower()
+        has_body = exchange.request.method != "HEAD" and status not in (204, 304)
+        reusable = "close" not in connection_tokens
+        chunked = False
+        if length is not None and not upstream_chunked:
+            response_headers.append(("Content-Length", length))
+        elif not has_body:
+            pass
+        elif exchange.request.version == "HTTP/1.1":
+            response_headers.append(("Transfer-Encoding", "chunked"))
+            chunked = True
+        else:
+            exchange.keep_alive = False
+        exchange.send_head(status, response_headers, reason)
+        if not has_body:
+            return reusable
+
+        if length is None and not upstream_chunked:
+            reusable = False  # delimited by the origin closing
+        if chunked:
+            self.stats.stream_started()
+        try:
+            writer = exchange.writer
+            async for data in read_body(
+                reader,
+                None if upstream_chunked or length is None else int(length),
+                upstream_chunked,
+                self.pool.timeout,
+            ):
+                if chunked:
+                    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                else:
+                    writer.write(data)
+                await writer.drain()
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+        finally:
+            if chunked:
+                self.stats.streaming -= 1
+        return reusable
 
     @staticmethod
     def is_relative_to(path: Path, parent: Path) -> bool:
@@ -173,6 +1006,22 @@ class LocalEdgeHandler(BaseHTTPRequestHandler):
             return False
 
 
+def raise_open_file_limit() -> int | None:
+    """Lift the soft descriptor limit to the hard one; return the new limit."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard != resource.RLIM_INFINITY else max(soft, 65536)
+    if soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            return soft
+    return target
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run a local CloudFront/S3/API Gateway simulator."
@@ -182,6 +1031,29 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--api-origin", default=DEFAULT_API_ORIGIN)
     parser.add_argument("--frontend-dist", type=Path, default=FRONTEND_DIST)
     parser.add_argument("--public-dir", type=Path, default=PUBLIC_DIR)
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=FILE_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Memory for cached static file bodies.",
+    )
+    parser.add_argument(
+        "--sendfile-threshold",
+        type=int,
+        default=SENDFILE_MIN_BYTES,
+        help="Files of at least this many bytes are sent with os.sendfile.",
+    )
+    parser.add_argument(
+        "--proxy-timeout",
+        type=float,
+        default=PROXY_TIMEOUT,
+        help="Seconds an API origin socket may stay silent before giving up.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Don't print a line per request (use under load).",
+    )
     return parser.parse_args()
 
 
@@ -200,18 +1072,27 @@ def main() -> None:
             f"Missing {public_dir}; run `python3 serverless/frontend/export_challenges.py`."
         )
 
-    LocalEdgeHandler.frontend_dist = frontend_dist
-    LocalEdgeHandler.public_dir = public_dir
-    LocalEdgeHandler.api_origin = args.api_origin
-
-    server = ThreadingHTTPServer((args.host, args.port), LocalEdgeHandler)
+    edge = LocalEdge(
+        frontend_dist,
+        public_dir,
+        args.api_origin,
+        file_cache=FileCache(args.cache_mb * 1024 * 1024, args.sendfile_threshold),
+        proxy_timeout=args.proxy_timeout,
+        access_log=not args.quiet,
+    )
+    open_files = raise_open_file_limit()
     print(f"Local edge serving http://{args.host}:{args.port}")
     print(f"Static frontend: {frontend_dist}")
     print(f"Static challenge JSON: {public_dir}")
     print(f"Dynamic API origin: {args.api_origin}")
-    server.serve_forever()
+    print(f"Stats: http://{args.host}:{args.port}{STATS_PATH}")
+    if open_files is not None:
+        print(f"Open file limit: {open_files}")
+    try:
+        asyncio.run(edge.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
     main()
-
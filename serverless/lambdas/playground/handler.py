@@ -12,8 +12,13 @@ BACKEND_DIR = ROOT / "backend"
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+import auth  # noqa: E402
 from main import app  # noqa: E402
 
 
+# Lifespan is off, so load the JWKS during init rather than on the first
+# request.  Set COGNITO_JWKS_FILE to a bundled copy to skip the network.
+auth.prefetch_jwks()
+
 handler = Mangum(app, lifespan="off")
 
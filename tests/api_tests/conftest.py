@@ -0,0 +1,91 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+import auth
+from api import playground_v2
+
+
+class CognitoPool:
+    """A fake Cognito user pool: signing keys, their JWKS and access tokens."""
+
+    issuer = "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_TEST"
+
+    @staticmethod
+    def signing_key(kid):
+        return kid, rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @staticmethod
+    def jwks_document(*keys):
+        return {
+            "keys": [
+                {**RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True),
+                 "kid": kid, "alg": "RS256", "use": "sig"}
+                for kid, private_key in keys
+            ]
+        }
+
+    def install(self, *keys):
+        auth._jwks.install(self.issuer, self.jwks_document(*keys), "test")
+
+    def access_token(self, key, lifetime=3600, **claims):
+        kid, private_key = key
+        payload = {
+            "iss": self.issuer,
+            "sub": "user-1",
+            "token_use": "access",
+            "client_id": "test-client",
+            "exp": int(time.time()) + lifetime,
+            **claims,
+        }
+        return jwt.encode(
+            payload, private_key, algorithm="RS256", headers={"kid": kid},
+        )
+
+
+def fail_fetch(issuer):
+    raise OSError("network disabled in tests")
+
+
+@pytest.fixture
+def auth_env(monkeypatch):
+    """Enable Cognito auth against a fake pool whose JWKS can't be fetched."""
+    monkeypatch.setenv("COGNITO_USER_POOL_ID", "us-east-1_TEST")
+    monkeypatch.setenv("COGNITO_APP_CLIENT_ID", "test-client")
+    monkeypatch.setattr(auth, "_fetch_jwks", fail_fetch)
+    auth._jwks.clear()
+    auth._verified_tokens.clear()
+    yield CognitoPool()
+    auth._jwks.clear()
+    auth._verified_tokens.clear()
+
+
+class EchoWorker:
+    async def execute(self, history, code):
+        return code
+
+
+class PoolWithEchoWorker:
+    def __init__(self):
+        self.worker = EchoWorker()
+
+    async def acquire(self, timeout):
+        return self.worker
+
+    async def release(self, worker):
+        pass
+
+
+@pytest.fixture
+def echo_pool(monkeypatch):
+    """Serve v2 evals from a pool whose worker echoes the code back."""
+    pool = PoolWithEchoWorker()
+
+    async def get_echo_pool():
+        return pool
+
+    monkeypatch.setattr(playground_v2, "get_pool", get_echo_pool)
+    return pool
@@ -1,4 +1,7 @@
+import shlex
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from shutil import which
 from textwrap import dedent
 from uuid import UUID
@@ -7,12 +10,21 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from api import playground_v2
+from api import playground, playground_v2
 
 
+# Protocol cases (framing, history replay, reset, timeouts) run against
+# tests/fake_ghci.py everywhere and against the real GHCi when installed;
+# cases that depend on Haskell semantics need the real one.
+FAKE_GHCI = Path(__file__).resolve().parents[2] / "fake_ghci.py"
+FAKE_GHCI_COMMAND = f"{shlex.quote(sys.executable)} {shlex.quote(str(FAKE_GHCI))}"
+HAS_GHCI = which("ghci") is not None
+# An eval that never answers on its own.
+HANGING_CODE = {"fake": "fakeHang", "ghci": "length [1..]"}
+
 pytestmark = pytest.mark.skipif(
-    which("ghci") is None or which("timeout") is None,
-    reason="evaluate_v2 integration tests require ghci and timeout",
+    which("timeout") is None,
+    reason="evaluate_v2 integration tests require timeout",
 )
 
 
@@ -153,19 +165,30 @@ HASKELL_EVAL_CASES = [
 ]
 
 
+@pytest.fixture(scope="module", params=["fake", "ghci"])
+def backend(request):
+    if request.param == "ghci" and not HAS_GHCI:
+        pytest.skip("real GHCi cases require ghci")
+    return request.param
+
+
 @pytest.fixture(scope="module")
-def client():
+def client(backend):
     app = FastAPI()
     app.include_router(playground_v2.router)
 
-    playground_v2.cleanup_v2_workers()
-    playground_v2.pool = None
+    with pytest.MonkeyPatch.context() as patch:
+        if backend == "fake":
+            patch.setattr(playground, "GHCI_EXECUTABLE", FAKE_GHCI_COMMAND)
+        patch.setattr(playground_v2, "NUM_GHCI_SESSIONS", 1)
+        playground_v2.cleanup_v2_workers()
+        playground_v2.pool = None
 
-    with TestClient(app) as test_client:
-        yield test_client
+        with TestClient(app) as test_client:
+            yield test_client
 
-    playground_v2.cleanup_v2_workers()
-    playground_v2.pool = None
+        playground_v2.cleanup_v2_workers()
+        playground_v2.pool = None
 
 
 def start_session(client: TestClient) -> str:
@@ -190,6 +213,7 @@ def evaluate(client: TestClient, session_id: str, history: list[str], code: str)
     return response.json()
 
 
+@pytest.mark.parametrize("backend", ["ghci"], indirect=True, scope="module")
 @pytest.mark.parametrize(
     "case",
     HASKELL_EVAL_CASES,
@@ -258,3 +282,34 @@ def test_evaluate_v2_reports_dangerous_history_replay_failure(client):
         "error": "History command blocked (':load'): :load Secret.hs",
         "history_failed": True,
     }
+
+
+def test_evaluate_v2_replays_history_in_order(client):
+    session_id = start_session(client)
+
+    result = evaluate(
+        client=client,
+        session_id=session_id,
+        history=["x = 20", "a = 1\nb = 2", "y = x + 22"],
+        code="y + a + b",
+    )
+
+    assert result == {"output": "45"}
+
+
+def test_evaluate_v2_restarts_a_worker_after_a_timeout(client, backend, monkeypatch):
+    monkeypatch.setattr(playground_v2, "EVAL_CMD_TIMEOUT", 0.5)
+    session_id = start_session(client)
+    restarts = playground_v2.PROCESS_RESTARTS.value(reason="dead")
+
+    hung = evaluate(
+        client=client, session_id=session_id, history=[],
+        code=HANGING_CODE[backend],
+    )
+    recovered = evaluate(
+        client=client, session_id=session_id, history=[], code="6 * 7",
+    )
+
+    assert "timed out" in hung["error"]
+    assert recovered == {"output": "42"}
+    assert playground_v2.PROCESS_RESTARTS.value(reason="dead") == restarts + 1
@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import playground_v2
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(playground_v2.router)
+    return TestClient(app)
+
+
+def server_timing_names(header: str) -> list[str]:
+    return [entry.split(";")[0].strip() for entry in header.split(",")]
+
+
+def test_evaluate_v2_sends_server_timing_header(echo_pool):
+    with make_client() as client:
+        response = client.post(
+            "/api/v2/playground/sessions/test-session/eval",
+            json={"history": [], "code": "1 + 1"},
+        )
+
+    assert response.json() == {"output": "1 + 1"}
+    names = server_timing_names(response.headers["Server-Timing"])
+    assert names == ["queue", "total"]
+
+
+def test_evaluate_v2_returns_timings_when_requested(echo_pool):
+    with make_client() as client:
+        response = client.post(
+            "/api/v2/playground/sessions/test-session/eval?timings=true",
+            json={"history": [], "code": "1 + 1"},
+        )
+
+    body = response.json()
+    assert body["output"] == "1 + 1"
+    assert set(body["timings"]) == {"queue", "total"}
+    assert body["timings"]["total"] >= body["timings"]["queue"] >= 0
@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import auth
+
+
+def cache_hits():
+    return auth.TOKEN_CACHE_LOOKUPS.value(result="hit")
+
+
+def test_verified_claims_are_reused_until_near_expiry(auth_env):
+    key = auth_env.signing_key("k1")
+    auth_env.install(key)
+    token = auth_env.access_token(key)
+    expiring = auth_env.access_token(key, lifetime=auth.AUTH_TOKEN_CACHE_SKEW_SECONDS - 5)
+    hits = cache_hits()
+
+    first = auth.verify_cognito_access_token(token)
+    first["sub"] = "mutated"
+    second = auth.verify_cognito_access_token(token)
+    auth.verify_cognito_access_token(expiring)
+    auth.verify_cognito_access_token(expiring)
+
+    assert second["sub"] == "user-1"
+    assert cache_hits() - hits == 1
+    assert len(auth._verified_tokens) == 1
+
+
+def test_key_rotation_drops_cached_tokens(auth_env):
+    old, new = auth_env.signing_key("old"), auth_env.signing_key("new")
+    auth_env.install(old)
+    old_token = auth_env.access_token(old)
+    auth.verify_cognito_access_token(old_token)
+
+    auth_env.install(new)
+    auth.verify_cognito_access_token(auth_env.access_token(new))
+
+    assert len(auth._verified_tokens) == 1
+    with pytest.raises(auth.InvalidAuthToken):
+        auth.verify_cognito_access_token(old_token)
+
+
+def test_invalid_tokens_are_not_cached(auth_env):
+    key = auth_env.signing_key("k1")
+    auth_env.install(key)
+    token = auth_env.access_token(key, client_id="other-client")
+
+    for _ in range(2):
+        with pytest.raises(auth.InvalidAuthToken):
+            auth.verify_cognito_access_token(token)
+    assert len(auth._verified_tokens) == 0
+
+
+def test_signature_checks_run_off_the_loop_with_a_limit(auth_env, monkeypatch):
+    key = auth_env.signing_key("k1")
+    auth_env.install(key)
+    verify = auth._verify_signature
+    running, peak, threads = [0], [0], set()
+
+    def slow_verify(*args):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        running[0] -= 1
+        return verify(*args)
+
+    monkeypatch.setattr(auth, "_verify_signature", slow_verify)
+    monkeypatch.setattr(auth, "AUTH_VERIFY_WORKERS", 2)
+    monkeypatch.setattr(auth, "AUTH_VERIFY_CONCURRENCY", 2)
+    monkeypatch.setattr(auth, "_verify_slots", None)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        claims = await asyncio.gather(*(
+            auth.verify_access_token(auth_env.access_token(key, jti=str(i)))
+            for i in range(6)
+        ))
+        task.cancel()
+        return claims, ticks
+
+    claims, ticks = asyncio.run(main())
+
+    assert [c["sub"] for c in claims] == ["user-1"] * 6
+    assert peak[0] <= 2
+    assert all(name.startswith("auth-verify") for name in threads)
+    assert ticks >= 5
+
+
+def test_signature_checks_run_inline_by_default(auth_env, monkeypatch):
+    key = auth_env.signing_key("k1")
+    auth_env.install(key)
+    verify = auth._verify_signature
+    threads = []
+
+    def recording_verify(*args):
+        threads.append(threading.current_thread())
+        return verify(*args)
+
+    monkeypatch.setattr(auth, "_verify_signature", recording_verify)
+    monkeypatch.setattr(auth, "AUTH_VERIFY_WORKERS", 0)
+
+    claims = asyncio.run(auth.verify_access_token(auth_env.access_token(key)))
+
+    assert claims["sub"] == "user-1"
+    assert threads == [threading.main_thread()]
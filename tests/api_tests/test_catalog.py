@@ -0,0 +1,133 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import catalog, playground_v2
+from challenges import CHALLENGES
+
+
+def catalog_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(playground_v2.router)
+    return TestClient(app)
+
+
+def test_challenge_list_is_cacheable_and_revalidates():
+    client = catalog_client()
+
+    first = client.get(
+        "/api/v2/playground/challenges",
+        params={"lang": "es"},
+        headers={"Accept-Encoding": "identity"},
+    )
+    etag = first.headers["etag"]
+    second = client.get(
+        "/api/v2/playground/challenges",
+        params={"lang": "es"},
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+
+    assert first.status_code == 200
+    assert len(first.json()["challenges"]) == len(CHALLENGES)
+    assert "max-age" in first.headers["cache-control"]
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_gzip_copy_is_served_when_accepted():
+    client = catalog_client()
+
+    plain = client.get(
+        "/api/v2/playground/challenges",
+        headers={"Accept-Encoding": "identity"},
+    )
+    compressed = client.get(
+        "/api/v2/playground/challenges",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert compressed.json() == plain.json()
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("br, gzip;q=0.5", True),
+    ("GZIP; Q=1.0", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000, br", False),
+    ("*, gzip;q=0", False),
+    ("br;q=1, *;q=0", False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert catalog.accepts_gzip(header) is expected
+
+
+def test_gzip_refused_with_q_zero_gets_the_plain_body():
+    response = catalog_client().get(
+        "/api/v2/playground/challenges",
+        headers={"Accept-Encoding": "gzip;q=0, identity"},
+    )
+
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["challenges"]) == len(CHALLENGES)
+
+
+def test_challenge_detail_matches_v1_and_not_found_is_unchanged():
+    from api import playground
+
+    app = FastAPI()
+    app.include_router(playground.router)
+    app.include_router(playground_v2.router)
+    client = TestClient(app)
+    challenge_id = next(iter(CHALLENGES))
+
+    v1 = client.get(f"/api/playground/challenges/{challenge_id}")
+    v2 = client.get(f"/api/v2/playground/challenges/{challenge_id}")
+    missing = client.get("/api/v2/playground/challenges/no-such-challenge")
+
+    assert v1.json() == v2.json()
+    assert v1.json()["test_count"] == len(CHALLENGES[challenge_id].tests)
+    assert v1.headers["etag"] == v2.headers["etag"]
+    assert missing.json() == {"error": "Challenge not found"}
+    assert "etag" not in missing.headers
+
+
+def test_bundle_carries_every_challenge_detail():
+    client = catalog_client()
+
+    bundle = client.get(
+        "/api/v2/playground/challenges/bundle", params={"lang": "es"},
+    )
+    detail = client.get(
+        "/api/v2/playground/challenges/double", params={"lang": "es"},
+    )
+
+    body = bundle.json()
+    assert bundle.headers["content-encoding"] == "gzip"
+    assert "max-age" in bundle.headers["cache-control"]
+    assert len(body["challenges"]) == len(CHALLENGES)
+    assert body["challenges"][0] == detail.json()
+    assert sum(len(c["challenges"]) for c in body["chapters"]) == len(CHALLENGES)
+
+
+def test_bundle_can_be_split_by_chapter():
+    client = catalog_client()
+    chapter = CHALLENGES.chapters[1]
+
+    split = client.get(
+        "/api/v2/playground/challenges/bundle",
+        params={"chapter": chapter["id"]},
+    ).json()
+    missing = client.get(
+        "/api/v2/playground/challenges/bundle",
+        params={"chapter": "no-such-chapter"},
+    )
+
+    assert [c["id"] for c in split["chapters"]] == [chapter["id"]]
+    assert len(split["challenges"]) == chapter["count"]
+    assert missing.json() == {"error": "Chapter not found"}
@@ -0,0 +1,41 @@
+from challenges import ChallengeBundle, build
+from challenges.bundle import BUNDLE_DIR
+
+
+def test_committed_bundle_matches_content():
+    files = build.render_bundle(build.load_chapters())
+
+    assert build.stale_files(files, BUNDLE_DIR) == [], (
+        "backend/challenges/bundle/ is stale; "
+        "run `python -m challenges.build` from backend/"
+    )
+
+
+def test_bundle_loads_only_the_chapter_it_needs():
+    bundle = ChallengeBundle()
+    first_id = next(iter(bundle))
+
+    titles = [summary.title for summary in bundle.summaries()]
+    assert len(titles) == len(bundle)
+    assert first_id in bundle and "no-such-challenge" not in bundle
+    assert bundle.loaded_chapters == []
+
+    challenge = bundle[first_id]
+    summary = bundle.summary(first_id)
+    assert challenge.id == first_id
+    assert challenge.title == summary.title
+    assert len(challenge.tests) == summary.test_count
+    assert bundle[first_id] is challenge
+    assert bundle.loaded_chapters == [summary.chapter]
+
+
+def test_chapter_cache_is_bounded():
+    bundle = ChallengeBundle(cache_size=1)
+    first, second = (chapter["id"] for chapter in bundle.chapters[:2])
+
+    bundle.chapter(first)
+    bundle.chapter(second)
+
+    assert bundle.loaded_chapters == [second]
+    assert len(bundle.chapter(first)) == bundle.chapters[0]["count"]
+    assert bundle.loaded_chapters == [first]
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from api import playground
+from api.playground import DANGEROUS_COMMANDS, is_dangerous_command
+
+
+def line_by_line(code):
+    for line in code.split("\n"):
+        stripped = line.strip().lower()
+        for cmd in DANGEROUS_COMMANDS:
+            if stripped.startswith(cmd.lower()):
+                return True, cmd
+    return False, ""
+
+
+@pytest.mark.parametrize("code, expected", [
+    (":load Secret.hs", (True, ":load")),
+    ("  :RELOAD", (True, ":reload")),
+    (":run main", (True, ":r")),
+    ("1 + 1\n\t:! ls", (True, ":!")),
+    (":l Foo", (True, ":l ")),
+    (":l   ", (False, "")),
+    (":type map", (False, "")),
+    ("let xs = 1 : [2]\nxs", (False, "")),
+    ("x :: Int\nx = 3 -- :load", (False, "")),
+])
+def test_known_commands(code, expected):
+    assert is_dangerous_command(code) == expected
+
+
+def test_matches_a_line_by_line_check():
+    pieces = list(" \t\r\n\x0b:!{}eErRlLsSmMoadhcipt") + DANGEROUS_COMMANDS
+    rng = random.Random(45)
+    for _ in range(20000):
+        code = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 10)))
+        assert is_dangerous_command(code) == line_by_line(code), repr(code)
+
+
+def test_long_texts_are_scanned_but_not_cached(monkeypatch):
+    monkeypatch.setattr(playground, "DANGEROUS_VERDICT_MAX_CHARS", 64)
+    playground._cached_verdict.cache_clear()
+    history = ["let double x = x * 2", "double 21"]
+    long_code = "\n".join(["x = 1"] * 20 + [":shell"])
+
+    for _ in range(3):
+        for cmd in history:
+            assert is_dangerous_command(cmd) == (False, "")
+    assert is_dangerous_command(long_code) == (True, ":shell")
+
+    info = playground._cached_verdict.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
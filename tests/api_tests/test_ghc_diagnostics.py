@@ -0,0 +1,40 @@
+from api.playground import has_errors, parse_ghc_diagnostics
+
+
+STDERR = """
+<interactive>:1:1: error: [GHC-88464]
+    Variable not in scope: foo
+      Suggested fix: Perhaps use `for'
+
+<interactive>:3:5: warning: [GHC-40910] [-Wunused-local-binds]
+    Defined but not used: `x'
+Main.hs:(2,1)-(3,4): error: parse error on input `='
+*** Exception: boom
+"""
+
+
+def test_diagnostics_are_split_with_location_and_code():
+    diagnostics = parse_ghc_diagnostics(STDERR)
+
+    assert [
+        (d["severity"], d["file"], d["line"], d["column"], d["code"])
+        for d in diagnostics
+    ] == [
+        ("error", "<interactive>", 1, 1, "GHC-88464"),
+        ("warning", "<interactive>", 3, 5, "GHC-40910"),
+        ("error", "Main.hs", 2, 1, None),
+        ("error", None, None, None, None),
+    ]
+    assert diagnostics[0]["message"] == (
+        "Variable not in scope: foo\n  Suggested fix: Perhaps use `for'"
+    )
+    assert diagnostics[2]["message"] == "parse error on input `='"
+    assert diagnostics[3]["message"] == "*** Exception: boom"
+
+
+def test_only_errors_fail_a_load():
+    warning = "<interactive>:1:1: warning: [-Wtype-defaults]\n    Defaulting to Integer\n"
+
+    assert parse_ghc_diagnostics("") == []
+    assert not has_errors(parse_ghc_diagnostics(warning))
+    assert has_errors(parse_ghc_diagnostics("*** Exception: oops"))
@@ -0,0 +1,108 @@
+import asyncio
+import http.client
+import json
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+import auth
+
+
+def whoami_client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami(user=Depends(auth.require_current_user)):
+        return {"sub": user["sub"]}
+
+    return TestClient(app)
+
+
+def bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_prefetch_reads_the_jwks_file_without_network(auth_env, monkeypatch, tmp_path):
+    key = auth_env.signing_key("k1")
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps(auth_env.jwks_document(key)))
+    monkeypatch.setenv("COGNITO_JWKS_FILE", str(path))
+
+    assert auth.prefetch_jwks()
+    assert auth.verify_cognito_access_token(auth_env.access_token(key))["sub"] == "user-1"
+
+
+def test_unknown_kid_refreshes_once_off_the_event_loop(auth_env, monkeypatch):
+    old, new = auth_env.signing_key("old"), auth_env.signing_key("new")
+    other = auth_env.signing_key("other")
+    auth_env.install(old)
+    fetches = []
+
+    def fetch(issuer):
+        fetches.append(issuer)
+        return auth_env.jwks_document(old, new)
+
+    monkeypatch.setattr(auth, "_fetch_jwks", fetch)
+    client = whoami_client()
+
+    rotated = client.get("/whoami", headers=bearer(auth_env.access_token(new)))
+    unknown = client.get("/whoami", headers=bearer(auth_env.access_token(other)))
+
+    assert rotated.json() == {"sub": "user-1"}
+    assert unknown.status_code == 401
+    assert fetches == [auth_env.issuer]
+
+
+def test_failed_refresh_keeps_the_current_keys(auth_env):
+    key = auth_env.signing_key("k1")
+    auth_env.install(key)
+
+    assert asyncio.run(auth.refresh_jwks()) is False
+    assert auth.verify_cognito_access_token(auth_env.access_token(key))["sub"] == "user-1"
+
+
+def test_failed_prefetch_does_not_rate_limit_loading_keys(auth_env, monkeypatch):
+    key = auth_env.signing_key("k1")
+    assert not auth.prefetch_jwks()
+    monkeypatch.setattr(auth, "_fetch_jwks", lambda issuer: auth_env.jwks_document(key))
+
+    response = whoami_client().get("/whoami", headers=bearer(auth_env.access_token(key)))
+
+    assert response.json() == {"sub": "user-1"}
+
+
+def test_no_signing_keys_is_unavailable_not_unauthorized(auth_env):
+    key = auth_env.signing_key("k1")
+
+    response = whoami_client().get("/whoami", headers=bearer(auth_env.access_token(key)))
+
+    assert response.status_code == 503
+
+
+def test_periodic_refresh_survives_a_failed_refresh(auth_env, monkeypatch):
+    key = auth_env.signing_key("k1")
+    monkeypatch.setattr(auth, "AUTH_JWKS_REFRESH_SECONDS", 0.01)
+    monkeypatch.setattr(auth, "AUTH_JWKS_MIN_REFRESH_SECONDS", 0.01)
+    fetches = []
+
+    def fetch(issuer):
+        fetches.append(issuer)
+        if len(fetches) == 1:
+            raise http.client.IncompleteRead(b"{")
+        return auth_env.jwks_document(key)
+
+    monkeypatch.setattr(auth, "_fetch_jwks", fetch)
+
+    async def main():
+        task = asyncio.create_task(auth._refresh_jwks_periodically())
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if auth._jwks.has_keys(auth_env.issuer):
+                break
+        running = not task.done()
+        task.cancel()
+        return running
+
+    assert asyncio.run(main())
+    assert len(fetches) >= 2
+    assert auth._jwks.has_keys(auth_env.issuer)
@@ -0,0 +1,63 @@
+import asyncio
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+import metrics
+from api import playground_v2
+
+
+class BusyPool:
+    size = 2
+    idle_count = 0
+    _workers = []
+
+    async def acquire(self, timeout):
+        raise asyncio.TimeoutError
+
+
+def test_histogram_renders_cumulative_buckets(monkeypatch):
+    # Register on a throwaway list so later /metrics scrapes don't show it.
+    monkeypatch.setattr(metrics, "_registry", [])
+    histogram = metrics.Histogram(
+        "test_histogram_seconds",
+        "Test histogram.",
+        buckets=(0.1, 1.0),
+    )
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+
+    lines = histogram.render()
+
+    assert 'test_histogram_seconds_bucket{le="0.1"} 1' in lines
+    assert 'test_histogram_seconds_bucket{le="1"} 2' in lines
+    assert 'test_histogram_seconds_bucket{le="+Inf"} 2' in lines
+    assert "test_histogram_seconds_count 2" in lines
+
+
+def test_busy_rejection_is_counted_and_exposed(monkeypatch):
+    async def get_busy_pool():
+        return BusyPool()
+
+    monkeypatch.setattr(playground_v2, "get_pool", get_busy_pool)
+    monkeypatch.setattr(playground_v2, "pool", BusyPool())
+
+    app = FastAPI()
+    app.include_router(playground_v2.router)
+
+    @app.get("/metrics")
+    async def metrics_endpoint():
+        return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+    before = playground_v2.BUSY_REJECTIONS.value(endpoint="eval")
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v2/playground/sessions/test-session/eval",
+            json={"history": [], "code": "1 + 1"},
+        )
+        scrape = client.get("/metrics")
+
+    assert response.json() == {"error": "Server busy, please try again later"}
+    assert playground_v2.BUSY_REJECTIONS.value(endpoint="eval") == before + 1
+    assert 'haskellito_workers{state="busy"} 2' in scrape.text
+    assert scrape.headers["content-type"].startswith("text/plain")
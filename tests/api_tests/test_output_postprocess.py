@@ -0,0 +1,59 @@
+import random
+import re
+import time
+
+import pytest
+
+from api.playground import strip_ghci_continuation_prompts
+
+
+def previous_strip(output):
+    for prompt in ("Prelude Empty| ", "ghci| ", "Prelude| "):
+        output = output.replace(prompt, "")
+    output = re.sub(r"\b[\w.]+(?:\s+[\w.]+)*\|\s*", "", output)
+    return " ".join(output.split()).strip()
+
+
+@pytest.mark.parametrize("output, expected", [
+    ("ghci| ghci| 42\n", "42"),
+    ("Prelude Empty| Prelude| [1,2,3]", "[1,2,3]"),
+    ("Main Data.List| ghci| True\n", "True"),
+    ("[x | x <- xs]\n", "[x | x <- xs]"),
+    ("  a\n\n  b  ", "a b"),
+])
+def test_prompts_are_removed_and_whitespace_collapsed(output, expected):
+    assert strip_ghci_continuation_prompts(output) == expected
+
+
+def test_matches_the_previous_implementation():
+    pieces = [
+        "ghci| ", "Prelude| ", "Prelude Empty| ", "Main", "x", "a.b", "1",
+        " ", "\n", "\t", "|", ",", "[", "]", ".", "=", "é", "_",
+    ]
+    rng = random.Random(46)
+    for _ in range(20000):
+        output = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 10)))
+        assert (
+            strip_ghci_continuation_prompts(output) == previous_strip(output)
+        ), repr(output)
+
+
+def test_preserve_newlines_keeps_lines_and_indentation():
+    output = "ghci| ghci| first line\n  second   line  \nMain| third\n\n"
+
+    assert strip_ghci_continuation_prompts(output, preserve_newlines=True) == (
+        "first line\n  second   line\nthird"
+    )
+    assert strip_ghci_continuation_prompts(
+        "done\nghci| x", preserve_newlines=True,
+    ) == "done\nx"
+
+
+def test_long_runs_of_words_are_linear():
+    output = "ghci| ghci| \"" + " ".join(["lorem"] * 100_000) + "\"\n"
+
+    start = time.perf_counter()
+    cleaned = strip_ghci_continuation_prompts(output)
+
+    assert cleaned == output[12:].strip()
+    assert time.perf_counter() - start < 1.0
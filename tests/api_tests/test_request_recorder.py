@@ -0,0 +1,36 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import playground_v2
+from request_recorder import RequestRecorderMiddleware
+
+
+def test_recorder_writes_anonymized_eval_records(echo_pool, tmp_path):
+    recording = tmp_path / "trace.jsonl"
+
+    app = FastAPI()
+    app.include_router(playground_v2.router)
+    recorder = RequestRecorderMiddleware(app, path=str(recording))
+
+    with TestClient(recorder) as client:
+        client.post(
+            "/api/v2/playground/sessions/secret-session/eval",
+            json={"history": ["x = 1"], "code": "x + 1"},
+        )
+        client.get("/api/v2/playground/challenges")
+
+    recorder._writer.shutdown()
+
+    records = [json.loads(line) for line in recording.read_text().splitlines()]
+    assert len(records) == 1
+    record = records[0]
+    assert record["api"] == "v2"
+    assert record["kind"] == "eval"
+    assert record["history"] == ["x = 1"]
+    assert record["code"] == "x + 1"
+    assert record["result"] == "ok"
+    assert record["status"] == 200
+    assert "secret-session" not in recording.read_text()
+    assert len(record["session"]) == 16
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from api import responses
+from api.responses import FastJSONResponse
+from schemas import playground as schemas
+
+
+PAYLOAD = {
+    "results": [
+        schemas.TestResult.payload(True, "double 21", "42", "42"),
+        schemas.TestResult.payload(False, 'greet "é"', '"hola é"', "Error: < >\n"),
+    ],
+    "passed": 1,
+    "total": 2,
+    "all_passed": False,
+    "diagnostics": [{"line": None, "column": 3, "ratio": 0.5}],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_body_decodes_to_the_same_payload(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    elif responses.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    response = FastJSONResponse(PAYLOAD, headers={"Server-Timing": "total;dur=1"})
+
+    assert json.loads(response.body) == json.loads(JSONResponse(PAYLOAD).body)
+    assert response.media_type == "application/json"
+    assert response.headers["server-timing"] == "total;dur=1"
+
+
+def test_fallback_matches_starlette_encoding(monkeypatch):
+    monkeypatch.setattr(responses, "orjson", None)
+
+    assert FastJSONResponse(PAYLOAD).body == JSONResponse(PAYLOAD).body
+
+
+def test_test_result_payload_matches_the_model():
+    payload = schemas.TestResult.payload(True, "double 21", "42", "42")
+
+    assert payload == schemas.TestResult(**payload).model_dump()
@@ -0,0 +1,95 @@
+import io
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import structured_logging
+from structured_logging import log_payload
+
+
+class Unprintable:
+    def __str__(self):
+        raise AssertionError("payload was formatted")
+
+
+def capture(monkeypatch, formatter):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(structured_logging.RequestContextFilter())
+    handler.setFormatter(formatter)
+    logger = logging.getLogger("test_structured_logging")
+    monkeypatch.setattr(logger, "handlers", [handler])
+    monkeypatch.setattr(logger, "propagate", False)
+    logger.setLevel(logging.INFO)
+    return logger, stream
+
+
+def app_logging(logger):
+    app = FastAPI()
+
+    @app.get("/eval")
+    async def evaluate():
+        logger.info("Evaluating for %s", "someone")
+        log_payload(logger, "Output", output="x" * 100, lines=3)
+        return {}
+
+    app.add_middleware(structured_logging.RequestIdMiddleware)
+    return TestClient(app)
+
+
+def test_json_records_carry_request_id_and_truncated_payload(monkeypatch):
+    monkeypatch.setattr(structured_logging, "LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+    logger, stream = capture(
+        monkeypatch, structured_logging.JsonFormatter(max_chars=10),
+    )
+
+    response = app_logging(logger).get("/eval", headers={"X-Request-ID": "abc-123"})
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert response.headers["x-request-id"] == "abc-123"
+    assert [r["msg"] for r in records] == ["Evaluating for someone", "Output"]
+    assert {r["request_id"] for r in records} == {"abc-123"}
+    assert records[1]["output"] == "x" * 10 + "... [90 more chars]"
+    assert records[1]["lines"] == 3
+
+
+def test_requests_without_a_usable_id_get_a_fresh_one(monkeypatch):
+    logger, stream = capture(monkeypatch, structured_logging.JsonFormatter())
+    client = app_logging(logger)
+
+    ids = [
+        client.get("/eval", headers=headers).headers["x-request-id"]
+        for headers in ({}, {}, {"X-Request-ID": "no spaces allowed"})
+    ]
+
+    assert len(set(ids)) == 3
+    assert all(len(rid) == 16 for rid in ids)
+
+
+def test_unsampled_payloads_are_never_formatted(monkeypatch):
+    monkeypatch.setattr(structured_logging, "LOG_PAYLOAD_SAMPLE_RATE", 0.0)
+    logger, stream = capture(monkeypatch, structured_logging.TextFormatter())
+
+    log_payload(logger, "Output", output=Unprintable())
+    logger.info("Plain message")
+
+    assert stream.getvalue() == "INFO:test_structured_logging:Plain message\n"
+
+
+def test_text_format_appends_ids_and_payload(monkeypatch):
+    monkeypatch.setattr(structured_logging, "LOG_PAYLOAD_SAMPLE_RATE", 1.0)
+    logger, stream = capture(
+        monkeypatch, structured_logging.TextFormatter(max_chars=4),
+    )
+    token = structured_logging._request_id.set("r1")
+    try:
+        log_payload(logger, "Test %d output", 2, output="long output")
+    finally:
+        structured_logging._request_id.reset(token)
+
+    assert stream.getvalue() == (
+        "INFO:test_structured_logging:Test 2 output "
+        "request_id=r1 output='long... [7 more chars]'\n"
+    )
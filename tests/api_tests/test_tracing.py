@@ -0,0 +1,46 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import tracing
+from api import playground_v2
+
+
+def read_spans(path):
+    spans = []
+    for line in path.read_text().splitlines():
+        for resource_spans in json.loads(line)["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.extend(scope_spans["spans"])
+    return {span["name"]: span for span in spans}
+
+
+def test_evaluate_v2_exports_nested_phase_spans(echo_pool, tmp_path):
+    span_file = tmp_path / "spans.jsonl"
+
+    app = FastAPI()
+    app.add_middleware(tracing.TracingMiddleware)
+    app.include_router(playground_v2.router)
+
+    tracing.configure(file_path=str(span_file))
+    try:
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v2/playground/sessions/test-session/eval",
+                json={"history": ["x = 1", "y = 2"], "code": "x + y"},
+            )
+    finally:
+        tracing.configure()
+
+    assert response.json() == {"output": "x + y"}
+    spans = read_spans(span_file)
+    root = spans["HTTP POST"]
+    endpoint = spans["evaluate_v2"]
+    assert endpoint["parentSpanId"] == root["spanId"]
+    assert spans["pool.acquire"]["parentSpanId"] == endpoint["spanId"]
+    assert spans["response.serialize"]["parentSpanId"] == endpoint["spanId"]
+    assert {"key": "history.length", "value": {"intValue": "2"}} in (
+        endpoint["attributes"]
+    )
+    assert len({span["traceId"] for span in spans.values()}) == 1
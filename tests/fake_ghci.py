@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Fake GHCi speaking the same prompt protocol as the real interpreter.
+
+Lets the worker pool, the pipe reader and the timeouts be exercised (and
+benchmarked) on machines without GHC.  Select it for the backend with:
+
+    GHCI_EXECUTABLE="python3 tests/fake_ghci.py"
+
+Protocol: prints a banner and the default ``ghci> `` prompt, honours
+``:set prompt`` / ``:set prompt-cont``, echoes the continuation prompt for
+each line of a ``:{ ... :}`` block, answers ``:load`` by clearing all
+bindings, and writes errors to stderr like GHCi does.
+
+Evaluation is intentionally tiny: integer/float arithmetic, string and
+list literals, ``name = expr`` bindings and single-clause functions with
+variable parameters (``double n = n * 2``; ``double 21``).  Unknown bare
+identifiers produce GHCi's "Variable not in scope" error; anything else
+is echoed back verbatim.
+
+Behaviour knobs (environment):
+
+    FAKE_GHCI_STARTUP_DELAY   seconds to sleep before the first prompt
+    FAKE_GHCI_LATENCY         seconds to sleep before answering a command
+    FAKE_GHCI_OUTPUT_BYTES    pad every result with trailing spaces to this size
+    FAKE_GHCI_CRASH_AFTER     exit(1) when the Nth command arrives
+    FAKE_GHCI_HANG_AFTER      stop answering from the Nth command on
+
+and per command, evaluating one of these expressions:
+
+    fakeCrash                 exit(1) immediately
+    fakeHang                  never answer
+    fakeSleep <seconds>       sleep, then print ()
+    fakeOutput <bytes>        print that many bytes
+    fakeError                 print a compile error on stderr
+    fakeGetLine               read the next line of stdin and print it
+    fakeForgePrompt           read the next line of stdin and, if it sets
+                              the prompt, print that prompt
+"""
+import ast
+import os
+import re
+import sys
+import time
+
+
+STARTUP_DELAY = float(os.environ.get("FAKE_GHCI_STARTUP_DELAY", "0"))
+LATENCY = float(os.environ.get("FAKE_GHCI_LATENCY", "0"))
+OUTPUT_BYTES = int(os.environ.get("FAKE_GHCI_OUTPUT_BYTES", "0"))
+CRASH_AFTER = int(os.environ.get("FAKE_GHCI_CRASH_AFTER", "0"))
+HANG_AFTER = int(os.environ.get("FAKE_GHCI_HANG_AFTER", "0"))
+
+DEFINITION_RE = re.compile(
+    r"^(?P<name>[a-z_][\w']*)(?P<params>(?:\s+[a-z_][\w']*)*)\s*=(?!=)\s*(?P<body>.+)$"
+)
+IDENTIFIER_RE = re.compile(r"^[a-z_][\w']*$")
+IGNORED_PREFIXES = (
+    "import ", "data ", "type ", "newtype ", "class ", "instance ",
+    "deriving ", "--",
+)
+MAX_DEPTH = 50
+
+
+class NotInScope(Exception):
+    pass
+
+
+class Unsupported(Exception):
+    pass
+
+
+class FakeGhci:
+    def __init__(self):
+        self.prompt = "ghci> "
+        self.prompt_cont = "ghci| "
+        self.bindings = {}
+        self.commands_seen = 0
+
+    # --- I/O -------------------------------------------------------------
+
+    @staticmethod
+    def out(text: str):
+        sys.stdout.write(text)
+
+    @staticmethod
+    def err(text: str):
+        sys.stdout.flush()
+        sys.stderr.write(text)
+        sys.stderr.flush()
+
+    def show_prompt(self, prompt: str):
+        self.out(prompt)
+        sys.stdout.flush()
+
+    # --- Main loop -------------------------------------------------------
+
+    def run(self):
+        if STARTUP_DELAY:
+            time.sleep(STARTUP_DELAY)
+        self.out("GHCi, version 9.4.7 (fake): https://www.haskell.org/ghc/"
+                 "  :? for help\n")
+        self.show_prompt(self.prompt)
+
+        block = None
+        for raw in sys.stdin:
+            line = raw.rstrip("\n")
+            if block is not None:
+                if line.strip() == ":}":
+                    self.handle("\n".join(block))
+                    block = None
+                    self.show_prompt(self.prompt)
+                else:
+                    block.append(line)
+                    self.show_prompt(self.prompt_cont)
+                continue
+            if line.strip() == ":{":
+                block = []
+                self.show_prompt(self.prompt_cont)
+                continue
+            self.handle(line)
+            self.show_prompt(self.prompt)
+
+    def handle(self, source: str):
+        self.commands_seen += 1
+        if CRASH_AFTER and self.commands_seen >= CRASH_AFTER:
+            sys.exit(1)
+        if HANG_AFTER and self.commands_seen >= HANG_AFTER:
+            hang()
+        if LATENCY:
+            time.sleep(LATENCY)
+
+        stripped = source.strip()
+        if not stripped:
+            return
+        if stripped.startswith(":"):
+            self.handle_command(stripped)
+            return
+        if "\n" in stripped or DEFINITION_RE.match(stripped) or " :: " in stripped:
+            self.handle_declarations(source)
+            return
+        self.handle_expression(stripped)
+
+    def handle_command(self, command: str):
+        name, _, argument = command.partition(" ")
+        if name == ":set" and argument.startswith("prompt-cont "):
+            self.prompt_cont = parse_prompt(argument[len("prompt-cont "):])
+        elif name == ":set" and argument.startswith("prompt "):
+            self.prompt = parse_prompt(argument[len("prompt "):])
+        elif name in (":load", ":l"):
+            self.bindings.clear()
+            module = os.path.splitext(os.path.basename(argument.strip()))[0]
+            self.out(f"[1 of 1] Compiling {module or 'Main'}"
+                     f" ( {argument.strip()}, interpreted )\n")
+            self.out("Ok, one module loaded.\n")
+        elif name in (":t", ":type"):
+            self.out(f"{argument} :: a\n")
+        else:
+            self.err(f"unknown command '{name}'\n")
+
+    def handle_declarations(self, source: str):
+        for line in source.split("\n"):
+            if not line.strip() or line[:1].isspace():
+                continue
+            stripped = line.strip()
+            if stripped.startswith(IGNORED_PREFIXES) or " :: " in stripped:
+                continue
+            if "fakeError" in stripped:
+                self.compile_error("fakeError")
+                return
+            match = DEFINITION_RE.match(stripped)
+            if match:
+                self.bindings[match["name"]] = (
+                    match["params"].split(),
+                    match["body"],
+                )
+
+    def handle_expression(self, expression: str):
+        words = expression.split()
+        directive = words[0]
+        if directive == "fakeCrash":
+            sys.exit(1)
+        if directive == "fakeHang":
+            hang()
+        if directive == "fakeError":
+            self.compile_error("fakeError")
+            return
+        if directive == "fakeSleep" and len(words) == 2:
+            time.sleep(float(words[1]))
+            self.out("()\n")
+            return
+        if directive == "fakeGetLine":
+            self.out(show(sys.stdin.readline().rstrip("\n")) + "\n")
+            return
+        if directive == "fakeForgePrompt":
+            line = sys.stdin.readline().strip()
+            if line.startswith(":set prompt "):
+                self.out(parse_prompt(line[len(":set prompt "):]))
+            return
+        if directive == "fakeOutput" and len(words) == 2:
+            self.out("x" * int(words[1]) + "\n")
+            return
+
+        try:
+            result = show(self.evaluate(expression, {}, 0))
+        except NotInScope as e:
+            self.compile_error(f"Variable not in scope: {e}")
+            return
+        except Unsupported:
+            result = expression
+        if OUTPUT_BYTES and len(result) < OUTPUT_BYTES:
+            result = result + " " * (OUTPUT_BYTES - len(result))
+        self.out(result + "\n")
+
+    def compile_error(self, message: str):
+        self.err(f"\n<interactive>:1:1: error: [GHC-88464]\n    {message}\n")
+
+    # --- Evaluation ------------------------------------------------------
+
+    def evaluate(self, expression: str, scope: dict, depth: int):
+        if depth > MAX_DEPTH:
+            raise Unsupported(expression)
+        expression = expression.strip()
+        words = split_atoms(expression)
+        if len(words) > 1 and self.bindings.get(words[0], ((),))[0]:
+            params, body = self.bindings[words[0]]
+            args = words[1:]
+            if len(params) != len(args):
+                raise Unsupported(expression)
+            local = {
+                name: self.evaluate(arg, scope, depth + 1)
+                for name, arg in zip(params, args)
+            }
+            return self.evaluate(body, local, depth + 1)
+        if IDENTIFIER_RE.match(expression):
+            return self.lookup(expression, scope, depth)
+        try:
+            tree = ast.parse(expression.replace("^", "**"), mode="eval")
+        except SyntaxError:
+            raise Unsupported(expression)
+        return self.evaluate_node(tree.body, scope, depth)
+
+    def lookup(self, name: str, scope: dict, depth: int):
+        if name in scope:
+            return scope[name]
+        if name in self.bindings:
+            params, body = self.bindings[name]
+            if params:
+                raise Unsupported(name)
+            return self.evaluate(body, {}, depth + 1)
+        raise NotInScope(name)
+
+    def evaluate_node(self, node, scope: dict, depth: int):
+        if isinstance(node, ast.Constant) and isinstance(
+            node.value, (int, float, str)
+        ):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.lookup(node.id, scope, depth)
+        if isinstance(node, ast.List):
+            return [self.evaluate_node(e, scope, depth) for e in node.elts]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -self.evaluate_node(node.operand, scope, depth)
+        if isinstance(node, ast.BinOp):
+            left = self.evaluate_node(node.left, scope, depth)
+            right = self.evaluate_node(node.right, scope, depth)
+            try:
+                if isinstance(node.op, ast.Add):
+                    return left + right
+                if isinstance(node.op, ast.Sub):
+                    return left - right
+                if isinstance(node.op, ast.Mult):
+                    return left * right
+                if isinstance(node.op, ast.Div):
+                    return left / right
+                if isinstance(node.op, ast.Pow):
+                    return left ** right
+            except (TypeError, ZeroDivisionError, OverflowError):
+                raise Unsupported(ast.dump(node))
+        raise Unsupported(ast.dump(node))
+
+
+def parse_prompt(argument: str) -> str:
+    argument = argument.strip()
+    if len(argument) >= 2 and argument[0] == argument[-1] == '"':
+        return ast.literal_eval(argument)
+    return argument
+
+
+def split_atoms(expression: str) -> list:
+    """Split on top-level whitespace, keeping (...), [...] and "..." whole."""
+    atoms, current, depth, quoted = [], [], 0, False
+    for char in expression:
+        if quoted:
+            current.append(char)
+            if char == '"':
+                quoted = False
+            continue
+        if char == '"':
+            quoted = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char.isspace() and depth == 0:
+            if current:
+                atoms.append("".join(current))
+                current = []
+            continue
+        current.append(char)
+    if current:
+        atoms.append("".join(current))
+    return atoms
+
+
+def show(value) -> str:
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if isinstance(value, list):
+        return "[" + ",".join(show(v) for v in value) + "]"
+    return repr(value)
+
+
+def hang():
+    sys.stdout.flush()
+    while True:
+        time.sleep(3600)
+
+
+if __name__ == "__main__":
+    try:
+        FakeGhci().run()
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
@@ -0,0 +1,193 @@
+import asyncio
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import playground, playground_v2
+
+
+FAKE_GHCI = Path(__file__).resolve().parents[2] / "fake_ghci.py"
+FAKE_GHCI_COMMAND = f"{shlex.quote(sys.executable)} {shlex.quote(str(FAKE_GHCI))}"
+
+
+@pytest.fixture
+def fake_ghci(monkeypatch):
+    monkeypatch.setattr(playground, "GHCI_EXECUTABLE", FAKE_GHCI_COMMAND)
+    monkeypatch.setattr(playground_v2, "NUM_GHCI_SESSIONS", 2)
+    playground_v2.cleanup_v2_workers()
+    playground_v2.pool = None
+    yield monkeypatch
+    playground_v2.cleanup_v2_workers()
+    playground_v2.pool = None
+
+
+@pytest.fixture
+def client(fake_ghci):
+    app = FastAPI()
+    app.include_router(playground_v2.router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def evaluate(client, history, code):
+    response = client.post(
+        "/api/v2/playground/sessions/test-session/eval",
+        json={"history": history, "code": code},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_fake_ghci_evaluates_with_history(client):
+    assert evaluate(client, [], "1 + 2") == {"output": "3"}
+    assert evaluate(
+        client,
+        ["double :: Int -> Int\ndouble n = n * 2"],
+        "double 21",
+    ) == {"output": "42"}
+
+
+def test_fake_ghci_state_is_reset_between_requests(client):
+    assert evaluate(client, ["temporaryValue = 99"], "temporaryValue") == {
+        "output": "99",
+    }
+    second = evaluate(client, [], "temporaryValue")
+    assert "Variable not in scope: temporaryValue" in second["output"]
+
+
+def test_worker_restarts_after_ghci_crash(client):
+    restarts = playground_v2.PROCESS_RESTARTS.value(reason="dead")
+
+    crashed = evaluate(client, [], "fakeCrash")
+    assert "GHCi process terminated unexpectedly" in crashed["error"]
+
+    for _ in range(playground_v2.NUM_GHCI_SESSIONS):
+        assert evaluate(client, [], "2 + 3") == {"output": "5"}
+    assert playground_v2.PROCESS_RESTARTS.value(reason="dead") == restarts + 1
+
+
+def test_hung_eval_times_out_and_worker_recovers(client, fake_ghci):
+    fake_ghci.setattr(playground_v2, "EVAL_CMD_TIMEOUT", 0.3)
+    timeouts = playground.GHCI_READ_TIMEOUTS.value()
+
+    hung = evaluate(client, [], "fakeHang")
+    assert "timed out" in hung["error"]
+    assert playground.GHCI_READ_TIMEOUTS.value() == timeouts + 1
+
+    for _ in range(playground_v2.NUM_GHCI_SESSIONS):
+        assert evaluate(client, [], "6 * 7") == {"output": "42"}
+
+
+def test_pool_serves_more_concurrent_requests_than_workers(fake_ghci):
+    async def run():
+        pool = playground_v2.WorkerPool(size=2)
+        await pool.start()
+        try:
+            async def one(n):
+                worker = await pool.acquire(timeout=10)
+                try:
+                    return await worker.execute([f"x = {n}"], "x * 2")
+                finally:
+                    await pool.release(worker)
+
+            return await asyncio.gather(*(one(n) for n in range(20)))
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(run()) == [str(n * 2) for n in range(20)]
+
+
+def test_compile_errors_are_reported_as_diagnostics(client):
+    result = evaluate(client, [], "missingName")
+
+    assert "Variable not in scope: missingName" in result["output"]
+    assert [
+        (d["severity"], d["line"], d["code"]) for d in result["diagnostics"]
+    ] == [("error", 1, "GHC-88464")]
+    assert "diagnostics" not in evaluate(client, [], "1 + 1")
+
+
+def test_submission_load_failure_is_detected_on_stderr(client):
+    def submit(code):
+        response = client.post(
+            "/api/v2/playground/challenges/double/submit", json={"code": code},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    failed = submit("double n = n * 2\nfakeError")
+    loaded = submit("errorCount = 0\ndouble n = n * 2")
+
+    assert failed["error"].startswith("Failed to load your code")
+    assert failed["diagnostics"][0]["severity"] == "error"
+    assert "error" not in loaded
+    assert loaded["total"] > 0
+
+
+def test_v1_submission_runs_tests_over_the_framed_channel(fake_ghci):
+    app = FastAPI()
+    app.include_router(playground.router)
+    with TestClient(app) as client:
+        def submit(code):
+            response = client.post(
+                "/api/playground/challenges/double/submit", json={"code": code},
+            )
+            assert response.status_code == 200
+            return response.json()
+
+        failed = submit("double n = n * 2\nfakeError")
+        loaded = submit("double n = n * 2")
+
+    assert failed["error"].startswith("Failed to load your code")
+    assert "error" not in loaded
+    assert loaded["all_passed"]
+    assert loaded["total"] > 0
+
+
+def test_v1_session_is_dropped_when_its_command_fails(fake_ghci):
+    fake_ghci.setattr(playground, "GHCI_MAX_OUTPUT_BYTES", 10000)
+    app = FastAPI()
+    app.include_router(playground.router)
+    with TestClient(app) as client:
+        session_id = client.post("/api/playground/sessions/").json()["session_id"]
+        process = playground.sessions[session_id]["process"]
+
+        runaway = client.post(
+            f"/api/playground/sessions/{session_id}/eval",
+            json={"code": "fakeOutput 50000"},
+        ).json()
+        again = client.post(
+            f"/api/playground/sessions/{session_id}/eval",
+            json={"code": "1 + 1"},
+        ).json()
+
+    assert "exceeded 10000 bytes" in runaway["error"]
+    assert session_id not in playground.sessions
+    assert process.wait(timeout=5) is not None
+    assert again == {"error": "Session not found"}
+
+
+def test_hung_history_replay_restarts_the_worker(client, fake_ghci):
+    fake_ghci.setattr(playground_v2, "HISTORY_CMD_TIMEOUT", 0.3)
+    fake_ghci.setattr(playground_v2, "NUM_GHCI_SESSIONS", 1)
+    playground_v2.cleanup_v2_workers()
+    playground_v2.pool = None
+    restarts = playground_v2.PROCESS_RESTARTS.value(reason="dead")
+
+    hung = evaluate(client, ["fakeHang"], "1 + 1")
+
+    assert hung["history_failed"]
+    assert evaluate(client, [], "6 * 7") == {"output": "42"}
+    assert playground_v2.PROCESS_RESTARTS.value(reason="dead") == restarts + 1
+
+
+def test_eval_reading_stdin_restarts_the_worker(client):
+    swallowed = evaluate(client, [], "fakeGetLine")
+
+    assert "GHCi process terminated unexpectedly" in swallowed["error"]
+    for _ in range(playground_v2.NUM_GHCI_SESSIONS):
+        assert evaluate(client, [], "6 * 7") == {"output": "42"}
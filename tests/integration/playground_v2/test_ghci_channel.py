@@ -0,0 +1,120 @@
+import asyncio
+import sys
+from pathlib import Path
+from subprocess import PIPE, Popen
+
+import pytest
+
+from api import playground
+from api.playground import GhciChannel
+
+
+FAKE_GHCI = Path(__file__).resolve().parents[2] / "fake_ghci.py"
+
+
+@pytest.fixture
+def channel():
+    process = Popen(
+        [sys.executable, str(FAKE_GHCI)],
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        text=True,
+        bufsize=1,
+    )
+    yield GhciChannel(process)
+    process.kill()
+    process.wait()
+
+
+def run(channel, *steps):
+    async def main():
+        await channel.start(timeout=10)
+        results = []
+        for command, timeout in steps:
+            channel.send(command)
+            try:
+                results.append(await channel.receive(timeout=timeout))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    return asyncio.run(main())
+
+
+def test_responses_are_framed_by_their_own_prompt(channel):
+    results = run(
+        channel,
+        ('"ghci> "\n', 5),
+        (":{\nx = 20\ny = 22\n:}\n", 5),
+        ("x + y", 5),
+        ("fakeOutput 200000", 5),
+    )
+
+    assert [r.stdout for r in results[:3]] == [
+        '"ghci> "', "ghci| ghci| ghci|", "42",
+    ]
+    assert results[3].stdout == "x" * 200000
+    assert not any(r.stderr for r in results)
+
+
+def test_errors_arrive_on_their_own_stream(channel):
+    missing, answer = run(channel, ("missingName", 5), ("1 + 1", 5))
+
+    assert missing.stdout == ""
+    assert "Variable not in scope: missingName" in missing.stderr
+    assert missing.text == missing.stderr
+    assert (answer.stdout, answer.stderr) == ("2", "")
+
+
+def test_a_timed_out_command_retires_the_channel(channel):
+    timeouts = playground.GHCI_READ_TIMEOUTS.value()
+
+    (late,) = run(channel, ("fakeSleep 0.3", 0.05))
+
+    assert "timed out" in str(late)
+    assert channel.process.wait(timeout=5) is not None
+    with pytest.raises(Exception, match="timed out"):
+        channel.send("6 * 7")
+    assert playground.GHCI_READ_TIMEOUTS.value() == timeouts + 1
+
+
+def test_every_command_gets_a_fresh_prompt(channel):
+    prompts = []
+    for _ in range(3):
+        channel.send("1 + 1")
+        prompts.append(channel._prompt)
+
+    assert len(set(prompts)) == 3
+
+
+def test_user_code_reading_stdin_retires_the_channel(channel):
+    # The swallowed ":set prompt" line is printed back (shown, so quoted):
+    # the new prompt turns up, but not after the old one.
+    (swallowed,) = run(channel, ("fakeGetLine", 5))
+
+    assert isinstance(swallowed, Exception)
+    assert channel.process.wait(timeout=5) is not None
+    with pytest.raises(Exception):
+        channel.send("1 + 1")
+
+
+def test_a_forged_prompt_does_not_end_the_response(channel):
+    (forged,) = run(channel, ("fakeForgePrompt", 5))
+
+    assert "not framed by its prompt" in str(forged)
+    assert channel.process.wait(timeout=5) is not None
+
+
+def test_runaway_output_kills_the_process(channel):
+    channel.max_output_bytes = 100000
+    kills = playground.GHCI_OUTPUT_LIMIT_KILLS.value()
+
+    (runaway,) = run(channel, ("fakeOutput 5000000", 5))
+
+    assert "exceeded 100000 bytes" in str(runaway)
+    assert channel.process.wait(timeout=5) is not None
+    assert len(channel._stdout) == 0
+    assert playground.GHCI_OUTPUT_LIMIT_KILLS.value() == kills + 1
+    with pytest.raises(Exception, match="exceeded"):
+        channel.send("1 + 1")
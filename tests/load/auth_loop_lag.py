@@ -0,0 +1,231 @@
+"""
+Measure event-loop lag while authenticated evals run concurrently.
+
+Runs the backend app in this process, over httpx's ASGI transport and with
+the fake GHCi, with Cognito auth enabled against a locally generated signing
+key (loaded through ``COGNITO_JWKS_FILE``, so no network is needed).  While
+the evals run, a timer that should fire every few milliseconds records how
+late it actually fires: that delay is time the loop spent unable to serve
+anyone else.
+
+Each mode runs in turn against the same worker pool:
+
+    inline   tokens verified on the event loop (the default)
+    offload  tokens verified on auth's bounded thread pool, as with
+             AUTH_VERIFY_WORKERS=--verify-workers
+    cached   inline, with every user's token already in the verified-token cache
+
+In ``inline`` and ``offload`` every request carries a token that has not
+been seen before, so each one pays for a full RS256 check.
+
+    python3 tests/load/auth_loop_lag.py --concurrency 64 --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from playground_load import (
+    BACKEND_DIR,
+    FAKE_GHCI,
+    TokenMinter,
+    git_revision,
+    latency_summary,
+)
+
+
+MODES = ("inline", "offload", "cached")
+ISSUER_POOL = "us-east-1_LAGBENCH"
+CLIENT_ID = "lag-bench"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000, help="Evals per mode.")
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument(
+        "--probe-interval-ms", type=float, default=5.0,
+        help="How often the lag probe expects to wake up.",
+    )
+    parser.add_argument("--mode", action="append", choices=MODES)
+    parser.add_argument(
+        "--verify-workers", type=int, default=2,
+        help="AUTH_VERIFY_WORKERS for the offload mode.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    args = parser.parse_args()
+    args.mode = args.mode or list(MODES)
+    return args
+
+
+def configure_environment(args: argparse.Namespace, jwks_file: Path) -> None:
+    os.environ.update({
+        "COGNITO_AUTH_ENABLED": "true",
+        "COGNITO_USER_POOL_ID": ISSUER_POOL,
+        "COGNITO_APP_CLIENT_ID": CLIENT_ID,
+        "COGNITO_JWKS_FILE": str(jwks_file),
+        "NUM_GHCI_SESSIONS": str(args.pool_size),
+        "GHCI_EXECUTABLE": f"{sys.executable} {FAKE_GHCI}",
+    })
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+
+
+async def probe_lag(stop: asyncio.Event, interval: float, samples: list[float]):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(time.perf_counter() - start - interval, 0.0))
+
+
+async def run_mode(
+    mode: str,
+    client: Any,
+    minter: TokenMinter,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    import auth
+
+    workers = auth.AUTH_VERIFY_WORKERS
+    auth.AUTH_VERIFY_WORKERS = args.verify_workers if mode == "offload" else 0
+    auth._verified_tokens.clear()
+    auth._verified_tokens.maxsize = 0 if mode != "cached" else auth.AUTH_TOKEN_CACHE_SIZE
+
+    users = [f"user-{i}" for i in range(args.concurrency)]
+    if mode == "cached":
+        user_tokens = {user: minter.token(user) for user in users}
+        for token in user_tokens.values():
+            auth.verify_cognito_access_token(token)
+        tokens = [user_tokens[users[i % len(users)]] for i in range(args.requests)]
+    else:
+        tokens = [minter.token(users[i % len(users)]) for i in range(args.requests)]
+
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for token in tokens:
+        queue.put_nowait(token)
+    latencies: list[float] = []
+    errors = 0
+
+    async def virtual_user() -> None:
+        nonlocal errors
+        session_id = str(uuid.uuid4())
+        while True:
+            try:
+                token = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            response = await client.post(
+                f"/api/v2/playground/sessions/{session_id}/eval",
+                json={"code": "1 + 1", "history": []},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200 or "error" in response.json():
+                errors += 1
+
+    lag: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(
+        probe_lag(stop, args.probe_interval_ms / 1000, lag)
+    )
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    auth.AUTH_VERIFY_WORKERS = workers
+    auth._verified_tokens.maxsize = auth.AUTH_TOKEN_CACHE_SIZE
+    return {
+        "mode": mode,
+        "requests": len(tokens),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(tokens) / elapsed, 1),
+        "request_ms": latency_summary(latencies),
+        "loop_lag_ms": latency_summary(lag),
+    }
+
+
+async def run(args: argparse.Namespace, minter: TokenMinter) -> list[dict[str, Any]]:
+    import httpx
+
+    import auth
+    from api import playground_v2
+    from main import app
+
+    if not auth.prefetch_jwks():
+        raise SystemExit("Could not load the generated JWKS file.")
+    await playground_v2.get_pool()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        warm = await client.post(
+            "/api/v2/playground/sessions/x/eval",
+            json={"code": "1 + 1", "history": []},
+            headers={"Authorization": f"Bearer {minter.token('warm-up')}"},
+        )
+        if warm.status_code != 200:
+            raise SystemExit(f"Warm-up eval failed: {warm.status_code} {warm.text}")
+        return [await run_mode(mode, client, minter, args) for mode in args.mode]
+
+
+def print_table(results: list[dict[str, Any]]) -> None:
+    print(
+        f"{'mode':<8} {'rps':>8} {'req p50':>9} {'req p99':>9} "
+        f"{'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'errors':>7}"
+    )
+    for result in results:
+        request, lag = result["request_ms"], result["loop_lag_ms"]
+        print(
+            f"{result['mode']:<8} {result['throughput_rps']:>8} "
+            f"{request['p50']:>9} {request['p99']:>9} "
+            f"{lag['p50']:>9} {lag['p99']:>9} {lag['max']:>9} "
+            f"{result['errors']:>7}"
+        )
+    print("(milliseconds)")
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jwks_file = Path(tmp) / "jwks.json"
+        configure_environment(args, jwks_file)
+        issuer = f"https://cognito-idp.us-east-1.amazonaws.com/{ISSUER_POOL}"
+        minter = TokenMinter(issuer, CLIENT_ID, "lag-bench")
+        jwks_file.write_text(json.dumps(minter.jwks))
+
+        try:
+            results = asyncio.run(run(args, minter))
+        finally:
+            from api import playground_v2
+
+            playground_v2.cleanup_v2_workers()
+
+    print_table(results)
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "concurrency": args.concurrency,
+            "pool_size": args.pool_size,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
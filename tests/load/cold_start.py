@@ -0,0 +1,447 @@
+"""
+Measure backend import time and cold start, and enforce a budget.
+
+Every measurement runs in a fresh interpreter, ``--repeat`` times; the
+report keeps the median and the max of each.
+
+- ``import``: wall time of ``import main``, the cumulative
+  ``-X importtime`` cost of selected modules (``--module`` to change them)
+  and, under ``lazy_modules_ms``, of modules ``main`` defers to first use
+  (``jwt``, with ``cryptography``, on the first token check), imported
+  after ``main``.
+- ``uvicorn``: a spawned ``uvicorn main:app``, timing process start to the
+  first accepted connection (``ready_ms``), the first challenge list and
+  detail requests, the first ``POST /sessions/`` that starts the v2 worker
+  pool (``warm_pool_ms``) and the first eval on the warm pool.
+- ``lambda``: the same sequence through the Mangum ``handler`` of
+  ``serverless/lambdas/playground`` with API Gateway HTTP API events,
+  timing ``import handler`` instead of ``ready_ms``.  Skipped (and not
+  budgeted) when Mangum is not installed.
+
+Both servers run with Cognito auth enabled, as in production, against a
+locally generated signing key: ``COGNITO_JWKS_FILE`` points at its JWKS, so
+the prefetch (in ``ready_ms`` and ``import_handler_ms``) reads no network,
+and ``warm_pool_ms`` includes the first RS256 check.  ``--no-auth`` runs
+them with auth disabled instead.
+
+Without GHC, pass ``--fake-ghci`` so the pool runs ``tests/fake_ghci.py``:
+
+    python3 tests/load/cold_start.py --fake-ghci --output cold-start.json
+
+The run exits with status 1 when a median exceeds the matching value in
+``--budget`` (default ``tests/load/cold_start_budget.json``, same shape as
+the report).  ``--budget-scale 2`` doubles every limit for slow machines.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from playground_load import (  # noqa: E402
+    BACKEND_DIR,
+    FAKE_GHCI,
+    ROOT,
+    ApiClient,
+    TokenMinter,
+    free_port,
+    git_revision,
+)
+
+
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "cold_start_budget.json"
+DEFAULT_MODULES = (
+    "main",
+    "api.playground",
+    "api.playground_v2",
+    "api.catalog",
+    "challenges",
+    "auth",
+    "fastapi",
+    "pydantic",
+)
+# Imported on first use rather than by ``import main``; each is measured in
+# a fresh interpreter right after ``main``, so only its own cost counts.
+LAZY_MODULES = ("jwt",)
+USER_POOL_ID = "us-east-1_COLDSTART"
+CLIENT_ID = "cold-start"
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+LAMBDA_PROBE = r"""
+import json, sys, time
+from pathlib import Path
+
+def event(method, path, body=None):
+    headers = {"content-type": "application/json", "host": "localhost"}
+    if sys.argv[3]:
+        headers["authorization"] = f"Bearer {sys.argv[3]}"
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": headers,
+        "requestContext": {
+            "accountId": "000000000000",
+            "apiId": "cold-start",
+            "domainName": "localhost",
+            "http": {
+                "method": method,
+                "path": path,
+                "protocol": "HTTP/1.1",
+                "sourceIp": "127.0.0.1",
+                "userAgent": "cold-start",
+            },
+            "requestId": "cold-start",
+            "routeKey": "$default",
+            "stage": "$default",
+            "time": "01/Jan/2024:00:00:00 +0000",
+            "timeEpoch": 0,
+        },
+        "body": json.dumps(body) if body is not None else None,
+        "isBase64Encoded": False,
+    }
+
+def timed(name, call):
+    start = time.perf_counter()
+    response = call()
+    result[name] = (time.perf_counter() - start) * 1000
+    if response is not None and response.get("statusCode") != 200:
+        raise SystemExit(f"{name}: HTTP {response.get('statusCode')}")
+
+result = {}
+sys.path.insert(0, sys.argv[1])
+try:
+    import mangum  # noqa: F401
+except ImportError:
+    print(json.dumps({"skipped": "mangum is not installed"}))
+    raise SystemExit(0)
+
+start = time.perf_counter()
+import handler
+result["import_handler_ms"] = (time.perf_counter() - start) * 1000
+prefix = "/api/v2/playground"
+timed("first_list_ms", lambda: handler.handler(event("GET", f"{prefix}/challenges"), None))
+timed("first_detail_ms", lambda: handler.handler(event("GET", f"{prefix}/challenges/{sys.argv[2]}"), None))
+timed("warm_pool_ms", lambda: handler.handler(event("POST", f"{prefix}/sessions/"), None))
+timed("first_eval_ms", lambda: handler.handler(
+    event("POST", f"{prefix}/sessions/cold-start/eval", {"history": [], "code": "1 + 1"}), None,
+))
+print(json.dumps(result))
+"""
+
+
+def backend_env(args: argparse.Namespace, jwks_file: Path | None) -> dict[str, str]:
+    env = dict(os.environ)
+    if jwks_file is None:
+        env["COGNITO_AUTH_ENABLED"] = "false"
+    else:
+        env.update({
+            "COGNITO_AUTH_ENABLED": "true",
+            "COGNITO_USER_POOL_ID": USER_POOL_ID,
+            "COGNITO_APP_CLIENT_ID": CLIENT_ID,
+            "COGNITO_JWKS_FILE": str(jwks_file),
+        })
+    env["NUM_GHCI_SESSIONS"] = str(args.pool_size)
+    if args.fake_ghci:
+        env["GHCI_EXECUTABLE"] = f"{sys.executable} {FAKE_GHCI}"
+    return env
+
+
+def summarize(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    return {
+        "median": round(statistics.median(values), 3),
+        "max": round(max(values), 3),
+        "runs": len(values),
+    }
+
+
+def collect(runs: list[dict[str, float]]) -> dict[str, Any]:
+    names = []
+    for run in runs:
+        names.extend(name for name in run if name not in names)
+    return {
+        name: summarize([run[name] for run in runs if run.get(name) is not None])
+        for name in names
+    }
+
+
+# --- Imports -----------------------------------------------------------------
+
+def measure_import_main(env: dict[str, str]) -> float:
+    code = (
+        "import time; start = time.perf_counter(); import main; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def measure_module_imports(
+    env: dict[str, str], modules: list[str], code: str = "import main",
+) -> dict[str, float | None]:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    cumulative: dict[str, float] = {}
+    for line in out.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            cumulative[match[3].strip()] = int(match[2]) / 1000
+    return {module: cumulative.get(module) for module in modules}
+
+
+# --- uvicorn -----------------------------------------------------------------
+
+def wait_for_port(port: int, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(
+                "uvicorn exited during startup; rerun with --server-output."
+            )
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.005)
+    process.kill()
+    raise SystemExit(f"uvicorn did not accept connections within {timeout}s")
+
+
+def timed_request(
+    client: ApiClient, method: str, path: str, payload: Any = None,
+) -> float:
+    start = time.perf_counter()
+    status, body = client.request(method, path, payload)
+    elapsed = (time.perf_counter() - start) * 1000
+    if status != 200 or (isinstance(body, dict) and "error" in body):
+        raise SystemExit(f"{method} {path}: HTTP {status} {body}")
+    return elapsed
+
+
+def measure_lazy_imports(env: dict[str, str]) -> dict[str, float | None]:
+    result: dict[str, float | None] = {}
+    for module in LAZY_MODULES:
+        result.update(measure_module_imports(env, [module], f"import main; import {module}"))
+    return result
+
+
+def measure_uvicorn(
+    args: argparse.Namespace, env: dict[str, str], token: str | None,
+) -> dict[str, float]:
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=None if args.server_output else subprocess.DEVNULL,
+        stderr=None if args.server_output else subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, process, args.timeout)
+        result = {"ready_ms": (time.perf_counter() - start) * 1000}
+        client = ApiClient(f"http://127.0.0.1:{port}", token, args.timeout)
+        prefix = "/api/v2/playground"
+        result["first_list_ms"] = timed_request(client, "GET", f"{prefix}/challenges")
+        result["first_detail_ms"] = timed_request(
+            client, "GET", f"{prefix}/challenges/{args.challenge_id}",
+        )
+        result["warm_pool_ms"] = timed_request(client, "POST", f"{prefix}/sessions/")
+        result["first_eval_ms"] = timed_request(
+            client, "POST", f"{prefix}/sessions/cold-start/eval",
+            {"history": [], "code": "1 + 1"},
+        )
+        client.close()
+        return result
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# --- Lambda ------------------------------------------------------------------
+
+def measure_lambda(
+    args: argparse.Namespace, env: dict[str, str], token: str | None,
+) -> dict[str, Any]:
+    handler_dir = ROOT / "serverless" / "lambdas" / "playground"
+    out = subprocess.run(
+        [
+            sys.executable, "-c", LAMBDA_PROBE,
+            str(handler_dir), args.challenge_id, token or "",
+        ],
+        cwd=handler_dir, env=env, capture_output=True, text=True,
+        timeout=args.timeout * 4,
+    )
+    if out.returncode != 0:
+        raise SystemExit(f"Lambda probe failed:\n{out.stderr}{out.stdout}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+# --- Budget ------------------------------------------------------------------
+
+def check_budget(
+    report: dict[str, Any], budget: dict[str, Any], scale: float, path: str = "",
+) -> tuple[list[str], list[str]]:
+    """Return (violations, unmeasured) for every numeric leaf of the budget."""
+    violations, unmeasured = [], []
+    for key, limit in budget.items():
+        name = f"{path}.{key}" if path else key
+        value = report.get(key) if isinstance(report, dict) else None
+        if isinstance(limit, dict):
+            if isinstance(value, dict) and "skipped" in value:
+                unmeasured.append(f"{name} ({value['skipped']})")
+                continue
+            more = check_budget(value or {}, limit, scale, name)
+            violations.extend(more[0])
+            unmeasured.extend(more[1])
+            continue
+        if isinstance(value, dict):
+            value = value.get("median")
+        if value is None:
+            unmeasured.append(name)
+        elif value > limit * scale:
+            violations.append(f"{name}: {value} ms > budget {round(limit * scale, 3)} ms")
+    return violations, unmeasured
+
+
+def print_table(report: dict[str, Any]):
+    def rows(section: dict[str, Any], prefix: str):
+        for name, value in section.items():
+            if isinstance(value, dict) and "median" not in value:
+                yield from rows(value, f"{prefix}{name}.")
+            elif value is not None:
+                yield f"{prefix}{name}", value
+
+    print(f"{'measurement':<40} {'median ms':>10} {'max ms':>10}")
+    for section in ("import", "uvicorn", "lambda"):
+        data = report.get(section)
+        if not data:
+            continue
+        if "skipped" in data:
+            print(f"{section:<40} skipped: {data['skipped']}")
+            continue
+        for name, value in rows(data, f"{section}."):
+            if isinstance(value, dict):
+                print(f"{name:<40} {value['median']:>10} {value['max']:>10}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure backend import time and cold start against a budget."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per measurement.")
+    parser.add_argument("--module", action="append", help="Repeatable. Module whose import cost to report.")
+    parser.add_argument("--skip", action="append", default=[], choices=("import", "uvicorn", "lambda"))
+    parser.add_argument("--fake-ghci", action="store_true", help="Use tests/fake_ghci.py for the worker pool.")
+    parser.add_argument("--pool-size", type=int, default=1, help="NUM_GHCI_SESSIONS (Lambda uses 1).")
+    parser.add_argument("--challenge-id", default="double")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--server-output", action="store_true", help="Show uvicorn's logs.")
+    parser.add_argument(
+        "--no-auth", action="store_true",
+        help="Run the servers with Cognito auth disabled.",
+    )
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget limit.")
+    parser.add_argument("--no-budget", action="store_true", help="Report only.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        jwks_file = token = None
+        if not args.no_auth:
+            issuer = f"https://cognito-idp.us-east-1.amazonaws.com/{USER_POOL_ID}"
+            minter = TokenMinter(issuer, CLIENT_ID, "cold-start")
+            jwks_file = Path(tmp) / "jwks.json"
+            jwks_file.write_text(json.dumps(minter.jwks))
+            token = minter.token("cold-start")
+        report = measure(args, backend_env(args, jwks_file), token)
+
+    print_table(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.no_budget:
+        return
+    budget = json.loads(args.budget.read_text())
+    violations, unmeasured = check_budget(report, budget, args.budget_scale)
+    for name in unmeasured:
+        print(f"not measured: {name}", file=sys.stderr)
+    if violations:
+        print("Cold-start budget exceeded:", file=sys.stderr)
+        for violation in violations:
+            print(f"  {violation}", file=sys.stderr)
+        raise SystemExit(1)
+    print(f"Within budget ({args.budget}).", file=sys.stderr)
+
+
+def measure(
+    args: argparse.Namespace, env: dict[str, str], token: str | None,
+) -> dict[str, Any]:
+    modules = args.module or list(DEFAULT_MODULES)
+    report: dict[str, Any] = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "fake_ghci": args.fake_ghci,
+            "pool_size": args.pool_size,
+            "auth": not args.no_auth,
+        },
+    }
+
+    if "import" not in args.skip:
+        print("Measuring imports", file=sys.stderr)
+        main_runs = [measure_import_main(env) for _ in range(args.repeat)]
+        module_runs = [measure_module_imports(env, modules) for _ in range(args.repeat)]
+        lazy_runs = [measure_lazy_imports(env) for _ in range(args.repeat)]
+        report["import"] = {
+            "main_ms": summarize(main_runs),
+            "modules_ms": collect(module_runs),
+            "lazy_modules_ms": collect(lazy_runs),
+        }
+    if "uvicorn" not in args.skip:
+        print("Measuring uvicorn cold starts", file=sys.stderr)
+        report["uvicorn"] = collect(
+            [measure_uvicorn(args, env, token) for _ in range(args.repeat)]
+        )
+    if "lambda" not in args.skip:
+        print("Measuring Lambda handler cold starts", file=sys.stderr)
+        runs = [measure_lambda(args, env, token) for _ in range(args.repeat)]
+        report["lambda"] = runs[0] if "skipped" in runs[0] else collect(runs)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark GHCi output post-processing on large outputs.
+
+Times ``strip_ghci_continuation_prompts`` from ``backend/api/playground.py``,
+both collapsed and with ``preserve_newlines``, against the implementation it
+replaced (three ``str.replace`` passes and an uncompiled, backtracking regex),
+on synthetic outputs of a few shapes:
+
+    list     show of a long list: one line, no prompts
+    lines    a :{ ... :} block echoing continuation prompts, then many lines
+    words    a :{ ... :} block, then one long line of space-separated words
+    records  derived Show of many records, one per line
+
+The old implementation is quadratic in the length of a run of words once the
+output contains a ``|``, so it is only timed up to ``--reference-max-kib``.
+
+    python3 tests/load/output_postprocess.py --kib 16 --kib 256 --kib 1024
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from playground_load import BACKEND_DIR, git_revision  # noqa: E402
+
+
+SHAPES = ("list", "lines", "words", "records")
+PROMPTS = "ghci| " * 4
+
+
+def previous_strip(output: str) -> str:
+    for prompt in ("Prelude Empty| ", "ghci| ", "Prelude| "):
+        output = output.replace(prompt, "")
+    output = re.sub(r'\b[\w.]+(?:\s+[\w.]+)*\|\s*', '', output)
+    return ' '.join(output.split()).strip()
+
+
+def make_output(shape: str, size: int) -> str:
+    if shape == "list":
+        items, length, i = [], 1, 0
+        while length < size:
+            items.append(str(i))
+            length += len(items[-1]) + 1
+            i += 1
+        return "[" + ",".join(items) + "]\n"
+    if shape == "lines":
+        lines, length, i = [], len(PROMPTS), 0
+        while length < size:
+            lines.append(f"line {i}: total = {i * 7}   ")
+            length += len(lines[-1]) + 1
+            i += 1
+        return PROMPTS + "\n".join(lines) + "\n"
+    if shape == "words":
+        count = max((size - len(PROMPTS)) // 6, 1)
+        return PROMPTS + '"' + " ".join(["lorem"] * count) + '"\n'
+    if shape == "records":
+        lines, length, i = [], 0, 0
+        while length < size:
+            lines.append(f'Point {{x = {i}, y = {-i}, label = "p{i}"}}')
+            length += len(lines[-1]) + 1
+            i += 1
+        return "\n".join(lines) + "\n"
+    raise ValueError(shape)
+
+
+def time_call(function: Callable[[str], str], text: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text)
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--kib", type=int, action="append", help="Output sizes.")
+    parser.add_argument("--shape", action="append", choices=SHAPES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--reference-max-kib", type=int, default=32,
+        help="Largest output the old implementation is timed on.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    args = parser.parse_args()
+    args.kib = args.kib or [16, 256, 1024]
+    args.shape = args.shape or list(SHAPES)
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(BACKEND_DIR))
+    from api.playground import strip_ghci_continuation_prompts
+
+    results: list[dict[str, Any]] = []
+    for shape in args.shape:
+        for kib in args.kib:
+            text = make_output(shape, kib * 1024)
+            collapsed = strip_ghci_continuation_prompts(text)
+            result = {
+                "shape": shape,
+                "kib": kib,
+                "collapsed_ms": time_call(
+                    strip_ghci_continuation_prompts, text, args.repeat,
+                ),
+                "preserve_newlines_ms": time_call(
+                    lambda t: strip_ghci_continuation_prompts(
+                        t, preserve_newlines=True,
+                    ),
+                    text, args.repeat,
+                ),
+                "previous_ms": None,
+            }
+            if kib <= args.reference_max_kib:
+                if previous_strip(text) != collapsed:
+                    raise SystemExit(f"{shape}/{kib} KiB: output differs")
+                result["previous_ms"] = time_call(previous_strip, text, 1)
+            results.append(result)
+
+    print(f"{'shape':<8} {'KiB':>6} {'collapsed':>10} {'newlines':>10} {'previous':>10}")
+    for r in results:
+        previous = "-" if r["previous_ms"] is None else r["previous_ms"]
+        print(
+            f"{r['shape']:<8} {r['kib']:>6} {r['collapsed_ms']:>10} "
+            f"{r['preserve_newlines_ms']:>10} {previous:>10}"
+        )
+    print("(milliseconds, median)")
+    if args.output:
+        report = {"revision": git_revision(), "results": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
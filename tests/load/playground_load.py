@@ -0,0 +1,525 @@
+"""
+Load-test the v1 and v2 playground APIs and write a JSON report.
+
+Drives ``/api/playground`` (one GHCi per session) and ``/api/v2/playground``
+(shared worker pool) with a configurable number of concurrent virtual users,
+history length and share of challenge submissions, then reports throughput,
+latency percentiles, "Server busy" rejections and server memory.
+
+Against a backend this script starts itself, using the fake GHCi so no GHC
+is needed:
+
+    python3 tests/load/playground_load.py --spawn --fake-ghci \\
+        --api v1 --api v2 --concurrency 1 --concurrency 8 --concurrency 32 \\
+        --pool-size 3 --history-length 5 --output load-report.json
+
+Against an already running backend (memory is sampled if --server-pid is
+given):
+
+    python3 tests/load/playground_load.py --base-url http://127.0.0.1:8000
+
+Pass ``--baseline old-report.json`` to exit non-zero when throughput drops
+or p95 latency grows by more than ``--tolerance`` for any matching scenario.
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT / "backend"
+FAKE_GHCI = ROOT / "tests" / "fake_ghci.py"
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from metrics import process_tree_rss_bytes  # noqa: E402
+
+
+API_PREFIXES = {
+    "v1": "/api/playground",
+    "v2": "/api/v2/playground",
+}
+BUSY_ERROR = "Server busy, please try again later"
+
+
+@dataclass
+class Scenario:
+    api: str
+    concurrency: int
+    requests: int
+    history_length: int
+    submit_ratio: float
+
+
+@dataclass
+class Sample:
+    kind: str
+    seconds: float
+    status: str
+
+
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    samples: list[Sample] = field(default_factory=list)
+    duration: float = 0.0
+    rss_samples: list[int] = field(default_factory=list)
+
+    def report(self) -> dict[str, Any]:
+        completed = len(self.samples)
+        busy = sum(1 for s in self.samples if s.status == "busy")
+        errors = sum(1 for s in self.samples if s.status == "error")
+        latency = {
+            kind: latency_summary(
+                [s.seconds for s in self.samples if s.kind == kind]
+            )
+            for kind in sorted({s.kind for s in self.samples})
+        }
+        latency["all"] = latency_summary([s.seconds for s in self.samples])
+        return {
+            "api": self.scenario.api,
+            "concurrency": self.scenario.concurrency,
+            "history_length": self.scenario.history_length,
+            "submit_ratio": self.scenario.submit_ratio,
+            "requests": completed,
+            "duration_s": round(self.duration, 3),
+            "throughput_rps": round(completed / self.duration, 2)
+            if self.duration else 0.0,
+            "latency_ms": latency,
+            "busy_rejections": busy,
+            "busy_rate": round(busy / completed, 4) if completed else 0.0,
+            "errors": errors,
+            "memory": {
+                "peak_rss_bytes": max(self.rss_samples, default=None),
+                "mean_rss_bytes": int(statistics.mean(self.rss_samples))
+                if self.rss_samples else None,
+            },
+        }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def latency_summary(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.mean(ordered) * 1000, 3),
+        "p50": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99": round(percentile(ordered, 0.99) * 1000, 3),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+class ApiClient:
+    """Keep-alive JSON client; one per virtual user thread."""
+
+    def __init__(self, base_url: str, token: str | None, timeout: float):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.connection: http.client.HTTPConnection | None = None
+
+    def request(self, method: str, path: str, payload: Any = None) -> tuple[int, Any]:
+        body = json.dumps(payload) if payload is not None else None
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout,
+                )
+            try:
+                self.connection.request(method, path, body=body, headers=self.headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                return response.status, json.loads(data) if data else None
+            except (http.client.HTTPException, ConnectionError, socket.timeout):
+                self.close()
+                if attempt:
+                    raise
+        raise RuntimeError("unreachable")
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class TokenMinter:
+    """A locally generated Cognito signing key, its JWKS and access tokens."""
+
+    def __init__(self, issuer: str, client_id: str, kid: str = "load-test"):
+        import jwt
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        from jwt.algorithms import RSAAlgorithm
+
+        self.jwt = jwt
+        self.issuer = issuer
+        self.client_id = client_id
+        self.kid = kid
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048,
+        )
+        self.jwks = {"keys": [{
+            **RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True),
+            "kid": kid, "alg": "RS256", "use": "sig",
+        }]}
+
+    def token(self, subject: str) -> str:
+        payload = {
+            "iss": self.issuer,
+            "sub": subject,
+            "token_use": "access",
+            "client_id": self.client_id,
+            "exp": int(time.time()) + 3600,
+            "jti": uuid.uuid4().hex,
+        }
+        return self.jwt.encode(
+            payload, self.private_key, algorithm="RS256",
+            headers={"kid": self.kid},
+        )
+
+
+class VirtualUser:
+    """Replays the frontend's request pattern for one API version."""
+
+    def __init__(self, client: ApiClient, args: argparse.Namespace, scenario: Scenario):
+        self.client = client
+        self.args = args
+        self.scenario = scenario
+        self.prefix = API_PREFIXES[scenario.api]
+        self.session_id: str | None = None
+        self.history = [
+            f"value{i} = {i}" for i in range(scenario.history_length)
+        ]
+        self.expression = (
+            " + ".join(f"value{i}" for i in range(scenario.history_length))
+            or "1 + 1"
+        )
+
+    def start(self):
+        _, body = self.client.request("POST", f"{self.prefix}/sessions/")
+        self.session_id = body["session_id"]
+        if self.scenario.api == "v1":
+            # v1 keeps state in the session's own GHCi process.
+            for command in self.history:
+                self.client.request(
+                    "POST",
+                    f"{self.prefix}/sessions/{self.session_id}/eval",
+                    {"code": command},
+                )
+
+    def stop(self):
+        if self.session_id is not None:
+            try:
+                self.client.request(
+                    "POST", f"{self.prefix}/sessions/{self.session_id}/close",
+                )
+            except Exception:
+                pass
+        self.client.close()
+
+    def one_request(self, rng: random.Random) -> Sample:
+        if rng.random() < self.scenario.submit_ratio:
+            kind = "submit"
+            path = f"{self.prefix}/challenges/{self.args.challenge_id}/submit"
+            payload: dict[str, Any] = {"code": self.args.submit_code}
+        else:
+            kind = "eval"
+            path = f"{self.prefix}/sessions/{self.session_id}/eval"
+            payload = {"code": self.expression}
+            if self.scenario.api == "v2":
+                payload["history"] = self.history
+
+        start = time.perf_counter()
+        try:
+            status, body = self.client.request("POST", path, payload)
+        except Exception:
+            return Sample(kind, time.perf_counter() - start, "error")
+        elapsed = time.perf_counter() - start
+
+        if status != 200 or not isinstance(body, dict):
+            return Sample(kind, elapsed, "error")
+        if body.get("error") == BUSY_ERROR:
+            return Sample(kind, elapsed, "busy")
+        if "error" in body:
+            return Sample(kind, elapsed, "error")
+        return Sample(kind, elapsed, "ok")
+
+
+class MemorySampler(threading.Thread):
+    def __init__(self, pid: int | None, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples: list[int] = []
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while self.pid is not None and not self._stop_event.is_set():
+            rss = process_tree_rss_bytes(self.pid)
+            if rss is not None:
+                self.samples.append(rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> list[int]:
+        self._stop_event.set()
+        self.join(timeout=5)
+        return self.samples
+
+
+def run_scenario(
+    args: argparse.Namespace,
+    scenario: Scenario,
+    base_url: str,
+    server_pid: int | None,
+) -> ScenarioResult:
+    users = [
+        VirtualUser(ApiClient(base_url, args.token, args.timeout), args, scenario)
+        for _ in range(scenario.concurrency)
+    ]
+    with ThreadPoolExecutor(max_workers=scenario.concurrency) as executor:
+        list(executor.map(lambda user: user.start(), users))
+
+    result = ScenarioResult(scenario)
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def drive(index: int):
+        user = users[index]
+        rng = random.Random(args.seed + index)
+        while next(counter) < scenario.requests:
+            sample = user.one_request(rng)
+            with lock:
+                result.samples.append(sample)
+
+    sampler = MemorySampler(server_pid)
+    sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=scenario.concurrency) as executor:
+        list(executor.map(drive, range(scenario.concurrency)))
+    result.duration = time.perf_counter() - start
+    result.rss_samples = sampler.stop()
+
+    for user in users:
+        user.stop()
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = dict(os.environ)
+    env["COGNITO_AUTH_ENABLED"] = "false"
+    env["NUM_GHCI_SESSIONS"] = str(args.pool_size)
+    if args.fake_ghci:
+        env["GHCI_EXECUTABLE"] = f"{sys.executable} {FAKE_GHCI}"
+        if args.fake_latency:
+            env["FAKE_GHCI_LATENCY"] = str(args.fake_latency)
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    client = ApiClient(base_url, None, timeout=5)
+    deadline = time.time() + 30
+    while True:
+        try:
+            status, _ = client.request("GET", "/api/v2/playground/challenges")
+            if status == 200:
+                break
+        except OSError:
+            pass
+        if process.poll() is not None or time.time() > deadline:
+            process.kill()
+            raise SystemExit("Backend did not start; see its output above.")
+        time.sleep(0.2)
+    # Start the v2 pool before measuring anything.
+    client.request("POST", "/api/v2/playground/sessions/")
+    client.close()
+    return process, base_url
+
+
+def compare(report: dict[str, Any], baseline_path: Path, tolerance: float) -> list[str]:
+    baseline = json.loads(baseline_path.read_text())
+
+    def key(entry):
+        return (
+            entry["api"], entry["concurrency"],
+            entry["history_length"], entry["submit_ratio"],
+        )
+
+    previous = {key(entry): entry for entry in baseline["scenarios"]}
+    regressions = []
+    for entry in report["scenarios"]:
+        old = previous.get(key(entry))
+        if old is None:
+            continue
+        label = "{} c={} h={} s={}".format(*key(entry))
+        if entry["throughput_rps"] < old["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{label}: throughput {old['throughput_rps']} -> "
+                f"{entry['throughput_rps']} rps"
+            )
+        new_p95 = entry["latency_ms"]["all"].get("p95", 0)
+        old_p95 = old["latency_ms"]["all"].get("p95", 0)
+        if old_p95 and new_p95 > old_p95 * (1 + tolerance):
+            regressions.append(f"{label}: p95 {old_p95} -> {new_p95} ms")
+    return regressions
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(report: dict[str, Any]):
+    print(
+        f"{'api':<4} {'conc':>5} {'hist':>5} {'sub':>5} {'reqs':>6} "
+        f"{'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'busy%':>7} "
+        f"{'err':>5} {'peakRSS':>10}"
+    )
+    for entry in report["scenarios"]:
+        latency = entry["latency_ms"]["all"]
+        peak = entry["memory"]["peak_rss_bytes"]
+        print(
+            f"{entry['api']:<4} {entry['concurrency']:>5} "
+            f"{entry['history_length']:>5} {entry['submit_ratio']:>5} "
+            f"{entry['requests']:>6} {entry['throughput_rps']:>9} "
+            f"{latency.get('p50', 0):>9} {latency.get('p95', 0):>9} "
+            f"{latency.get('p99', 0):>9} {entry['busy_rate'] * 100:>6.1f}% "
+            f"{entry['errors']:>5} "
+            f"{(f'{peak / 2**20:.0f}MiB' if peak else '-'):>10}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load-test the v1 and v2 playground APIs."
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Backend to test, e.g. http://127.0.0.1:8000.")
+    target.add_argument("--spawn", action="store_true", help="Start a local uvicorn backend.")
+    parser.add_argument("--server-pid", type=int, help="Sample this process tree's RSS.")
+    parser.add_argument("--fake-ghci", action="store_true", help="With --spawn, use tests/fake_ghci.py.")
+    parser.add_argument("--fake-latency", type=float, default=0.0, help="FAKE_GHCI_LATENCY for --fake-ghci.")
+    parser.add_argument("--pool-size", type=int, default=3, help="NUM_GHCI_SESSIONS for --spawn.")
+    parser.add_argument("--api", action="append", choices=sorted(API_PREFIXES), help="Repeatable. Default: v2.")
+    parser.add_argument("--concurrency", type=int, action="append", help="Repeatable. Default: 8.")
+    parser.add_argument("--history-length", type=int, action="append", help="Repeatable. Default: 3.")
+    parser.add_argument("--submit-ratio", type=float, action="append", help="Repeatable. Default: 0.1.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario.")
+    parser.add_argument("--challenge-id", default="double")
+    parser.add_argument("--submit-code", default="double x = x * 2")
+    parser.add_argument("--token", help="Bearer token when the backend requires auth.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request client timeout.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument("--baseline", type=Path, help="Previous report to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    server = None
+    server_pid = args.server_pid
+    if args.spawn or not args.base_url:
+        server, base_url = spawn_server(args)
+        server_pid = server.pid
+    else:
+        base_url = args.base_url
+
+    scenarios = [
+        Scenario(api, concurrency, args.requests, history_length, submit_ratio)
+        for api in args.api or ["v2"]
+        for concurrency in args.concurrency or [8]
+        for history_length in args.history_length or [3]
+        for submit_ratio in args.submit_ratio or [0.1]
+    ]
+
+    results = []
+    try:
+        for scenario in scenarios:
+            print(f"Running {scenario}", file=sys.stderr)
+            results.append(run_scenario(args, scenario, base_url, server_pid).report())
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    report = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "base_url": None if server else base_url,
+            "spawned": server is not None,
+            "fake_ghci": bool(server and args.fake_ghci),
+            "pool_size": args.pool_size if server else None,
+            "requests_per_scenario": args.requests,
+        },
+        "scenarios": results,
+    }
+    print_table(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        regressions = compare(report, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Replay a recorded production trace against a local backend.
+
+Recordings come from ``backend/request_recorder.py`` (set
+``REQUEST_RECORD_FILE`` on the production backend).  Requests are re-issued
+with their original inter-arrival gaps divided by ``--speed``; ``--speed max``
+sends each request as soon as a client thread is free.  Requests from the
+same recorded session stay in order, like a student waiting for each answer.
+
+    python3 tests/load/replay_trace.py trace.jsonl.gz --spawn --fake-ghci --speed 10
+    python3 tests/load/replay_trace.py trace.jsonl --base-url http://127.0.0.1:8000 --speed 1
+
+The report compares replayed results with the recorded ones and shows how
+far behind schedule the replay fell (``lag``), which tells whether the
+backend or the replayer was the bottleneck.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from playground_load import (  # noqa: E402
+    API_PREFIXES,
+    ApiClient,
+    MemorySampler,
+    latency_summary,
+    spawn_server,
+)
+from request_recorder import classify_result  # noqa: E402
+
+
+def load_trace(path: Path) -> list[dict[str, Any]]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    records.sort(key=lambda record: record["t"])
+    return records
+
+
+class Replayer:
+    def __init__(self, args: argparse.Namespace, base_url: str):
+        self.args = args
+        self.base_url = base_url
+        self.local = threading.local()
+        self.session_locks: dict[Any, threading.Lock] = defaultdict(threading.Lock)
+        self.session_ids: dict[tuple[str, Any], str] = {}
+        self.registry_lock = threading.Lock()
+        self.results: list[dict[str, Any]] = []
+        self.results_lock = threading.Lock()
+
+    def client(self) -> ApiClient:
+        if not hasattr(self.local, "client"):
+            self.local.client = ApiClient(self.base_url, self.args.token, self.args.timeout)
+        return self.local.client
+
+    def session_for(self, record: dict[str, Any]) -> str:
+        key = (record["api"], record.get("session"))
+        with self.registry_lock:
+            session_id = self.session_ids.get(key)
+        if session_id is None:
+            prefix = API_PREFIXES[record["api"]]
+            _, body = self.client().request("POST", f"{prefix}/sessions/")
+            session_id = body["session_id"]
+            with self.registry_lock:
+                self.session_ids[key] = session_id
+        return session_id
+
+    def replay(self, record: dict[str, Any], scheduled: float):
+        with self.session_locks[(record["api"], record.get("session"))]:
+            prefix = API_PREFIXES[record["api"]]
+            if record["kind"] == "submit":
+                path = f"{prefix}/challenges/{record['challenge_id']}/submit"
+                payload: dict[str, Any] = {"code": record.get("code") or ""}
+            else:
+                path = f"{prefix}/sessions/{self.session_for(record)}/eval"
+                payload = {"code": record.get("code") or ""}
+                if record["api"] == "v2":
+                    payload["history"] = record.get("history") or []
+
+            started = time.perf_counter()
+            try:
+                status, body = self.client().request("POST", path, payload)
+                result = classify_result(status, body)
+            except Exception:
+                result = "error"
+            elapsed = time.perf_counter() - started
+
+        with self.results_lock:
+            self.results.append({
+                "kind": record["kind"],
+                "seconds": elapsed,
+                "lag": max(started - scheduled, 0.0),
+                "result": result,
+                "recorded_result": record.get("result"),
+                "recorded_ms": record.get("duration_ms"),
+            })
+
+    def close_sessions(self):
+        for (api, _), session_id in self.session_ids.items():
+            try:
+                self.client().request(
+                    "POST", f"{API_PREFIXES[api]}/sessions/{session_id}/close",
+                )
+            except Exception:
+                pass
+
+
+def run(args: argparse.Namespace, records: list[dict[str, Any]], base_url: str, server_pid):
+    replayer = Replayer(args, base_url)
+    speed = None if args.speed == "max" else float(args.speed)
+    first = records[0]["t"]
+    sampler = MemorySampler(server_pid)
+    sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.max_in_flight) as executor:
+        for record in records:
+            scheduled = start
+            if speed is not None:
+                scheduled = start + (record["t"] - first) / speed
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            executor.submit(replayer.replay, record, scheduled)
+    duration = time.perf_counter() - start
+    rss = sampler.stop()
+    replayer.close_sessions()
+    return replayer.results, duration, rss
+
+
+def report(results, duration: float, rss: list[int], args, trace_span: float) -> dict[str, Any]:
+    outcomes = Counter(r["result"] for r in results)
+    matched = sum(1 for r in results if r["result"] == r["recorded_result"])
+    by_kind = {
+        kind: latency_summary([r["seconds"] for r in results if r["kind"] == kind])
+        for kind in sorted({r["kind"] for r in results})
+    }
+    by_kind["all"] = latency_summary([r["seconds"] for r in results])
+    recorded = [r["recorded_ms"] / 1000 for r in results if r["recorded_ms"] is not None]
+    return {
+        "trace": str(args.trace),
+        "speed": args.speed,
+        "requests": len(results),
+        "trace_span_s": round(trace_span, 3),
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(results) / duration, 2) if duration else 0.0,
+        "latency_ms": by_kind,
+        "recorded_latency_ms": latency_summary(recorded),
+        "lag_ms": latency_summary([r["lag"] for r in results]),
+        "results": dict(outcomes),
+        "result_match_rate": round(matched / len(results), 4) if results else 0.0,
+        "memory": {"peak_rss_bytes": max(rss, default=None)},
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a recorded request trace.")
+    parser.add_argument("trace", type=Path, help="JSONL (optionally .gz) recording.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", help="Backend to replay against.")
+    target.add_argument("--spawn", action="store_true", help="Start a local uvicorn backend.")
+    parser.add_argument("--server-pid", type=int, help="Sample this process tree's RSS.")
+    parser.add_argument("--fake-ghci", action="store_true", help="With --spawn, use tests/fake_ghci.py.")
+    parser.add_argument("--fake-latency", type=float, default=0.0)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--speed", default="1", help="Time compression: 1, 10, ... or 'max'.")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="Client threads.")
+    parser.add_argument("--limit", type=int, help="Only replay the first N records.")
+    parser.add_argument("--token", help="Bearer token when the backend requires auth.")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    args = parser.parse_args()
+    if args.speed != "max" and float(args.speed) <= 0:
+        parser.error("--speed must be positive or 'max'")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    records = load_trace(args.trace)
+    if args.limit:
+        records = records[:args.limit]
+    if not records:
+        raise SystemExit(f"No records in {args.trace}")
+
+    server = None
+    server_pid = args.server_pid
+    if args.spawn or not args.base_url:
+        server, base_url = spawn_server(args)
+        server_pid = server.pid
+    else:
+        base_url = args.base_url
+
+    try:
+        results, duration, rss = run(args, records, base_url, server_pid)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    summary = report(results, duration, rss, args, records[-1]["t"] - records[0]["t"])
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(summary, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
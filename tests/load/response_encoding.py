@@ -0,0 +1,162 @@
+"""
+Benchmark response encoding for playground eval and submit payloads.
+
+Times building and encoding a response body the way each path does it:
+
+    v1-before  TestResult models, model_dump(), a plain dict returned to
+               FastAPI (jsonable_encoder) and JSONResponse
+    v2-before  TestResult models, model_dump() and JSONResponse
+    json       TestResult.payload() dicts and FastJSONResponse on the
+               stdlib json fallback
+    fast       TestResult.payload() dicts and FastJSONResponse (orjson when
+               installed)
+
+on two payload shapes:
+
+    output  an eval response whose output is ``--kib`` KiB of GHCi text
+    suite   a submission response with ``--tests`` test results
+
+    python3 tests/load/response_encoding.py --kib 16 --kib 1024 --tests 5 --tests 1000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from playground_load import BACKEND_DIR, git_revision  # noqa: E402
+
+
+VARIANTS = ("v1-before", "v2-before", "json", "fast")
+
+
+def make_output(size: int) -> str:
+    lines, length, i = [], 0, 0
+    while length < size:
+        lines.append(f'Point {{x = {i}, y = {-i}, label = "p{i} é"}}')
+        length += len(lines[-1]) + 1
+        i += 1
+    return "\n".join(lines)
+
+
+def make_tests(count: int) -> list[tuple[bool, str, str, str]]:
+    return [
+        (i % 3 != 0, f"double {i}", str(i * 2), str(i * 2 if i % 3 else i))
+        for i in range(count)
+    ]
+
+
+def time_call(function: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--kib", type=int, action="append", help="Eval output sizes.")
+    parser.add_argument("--tests", type=int, action="append", help="Test suite sizes.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    args = parser.parse_args()
+    args.kib = args.kib or [16, 256, 1024]
+    args.tests = args.tests or [5, 100, 1000]
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    sys.path.insert(0, str(BACKEND_DIR))
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from api import responses
+    from api.responses import FastJSONResponse
+    from schemas.playground import TestResult
+
+    def fast_json(payload):
+        return FastJSONResponse(payload)
+
+    def stdlib_json(payload):
+        orjson, responses.orjson = responses.orjson, None
+        try:
+            return FastJSONResponse(payload)
+        finally:
+            responses.orjson = orjson
+
+    def suite_payload(results):
+        passed = sum(1 for r in results if r["passed"])
+        return {
+            "results": results,
+            "passed": passed,
+            "total": len(results),
+            "all_passed": passed == len(results),
+        }
+
+    def model_results(tests):
+        return [
+            TestResult(passed=p, test_code=c, expected=e, actual=a).model_dump()
+            for p, c, e, a in tests
+        ]
+
+    def dict_results(tests):
+        return [TestResult.payload(*test) for test in tests]
+
+    cases: list[tuple[str, int, dict[str, Callable[[], Any]]]] = []
+    for kib in args.kib:
+        payload = {"output": make_output(kib * 1024)}
+        cases.append(("output", kib, {
+            "v1-before": lambda p=payload: JSONResponse(jsonable_encoder(p)),
+            "v2-before": lambda p=payload: JSONResponse(p),
+            "json": lambda p=payload: stdlib_json(p),
+            "fast": lambda p=payload: fast_json(p),
+        }))
+    for count in args.tests:
+        tests = make_tests(count)
+        cases.append(("suite", count, {
+            "v1-before": lambda t=tests: JSONResponse(
+                jsonable_encoder(suite_payload(model_results(t)))
+            ),
+            "v2-before": lambda t=tests: JSONResponse(
+                suite_payload(model_results(t))
+            ),
+            "json": lambda t=tests: stdlib_json(suite_payload(dict_results(t))),
+            "fast": lambda t=tests: fast_json(suite_payload(dict_results(t))),
+        }))
+
+    results: list[dict[str, Any]] = []
+    for shape, size, variants in cases:
+        bodies = {name: json.loads(fn().body) for name, fn in variants.items()}
+        if any(body != bodies["v2-before"] for body in bodies.values()):
+            raise SystemExit(f"{shape}/{size}: bodies differ")
+        result: dict[str, Any] = {"shape": shape, "size": size}
+        for name, fn in variants.items():
+            result[f"{name}_ms"] = time_call(fn, args.repeat)
+        results.append(result)
+
+    encoder = "orjson" if responses.orjson is not None else "json (orjson missing)"
+    print(f"fast encoder: {encoder}")
+    print(f"{'shape':<7} {'size':>6}" + "".join(f" {v:>10}" for v in VARIANTS))
+    for r in results:
+        print(
+            f"{r['shape']:<7} {r['size']:>6}"
+            + "".join(f" {r[f'{v}_ms']:>10}" for v in VARIANTS)
+        )
+    print("(milliseconds, median; output size in KiB, suite size in tests)")
+    if args.output:
+        report = {"revision": git_revision(), "encoder": encoder, "results": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
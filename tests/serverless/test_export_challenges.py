@@ -0,0 +1,80 @@
+import gzip
+import importlib.util
+import json
+from pathlib import Path
+
+
+EXPORTER = (
+    Path(__file__).resolve().parents[2]
+    / "serverless" / "frontend" / "export_challenges.py"
+)
+spec = importlib.util.spec_from_file_location("export_challenges", EXPORTER)
+export_challenges = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(export_challenges)
+
+
+def test_export_is_minified_compressed_and_incremental(tmp_path):
+    first = export_challenges.export(tmp_path, ["gzip"], jobs=4)
+    index = tmp_path / "api/v2/playground/challenges/index.es.json"
+
+    assert first["written"] == first["files"]
+    assert b"\n" not in index.read_bytes()
+    assert gzip.decompress(
+        index.with_name("index.es.json.gz").read_bytes()
+    ) == index.read_bytes()
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["files"]["challenges/index.es.json"]["encodings"] == {
+        "gz": index.with_name("index.es.json.gz").stat().st_size,
+    }
+
+    index.write_bytes(b"{}")
+    stale = tmp_path / "challenges/retired.en.json"
+    stale.write_bytes(b"{}")
+    manifest["files"]["challenges/retired.en.json"] = {
+        "sha256": "0", "bytes": 2, "encodings": {},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+    second = export_challenges.export(tmp_path, ["gzip"], jobs=4)
+
+    assert second["written"] == 1
+    assert second["unchanged"] == second["files"] - 1
+    assert second["removed"] == 1 and not stale.exists()
+    assert json.loads(index.read_bytes())["challenges"]
+
+    forced = export_challenges.export(tmp_path, ["gzip"], jobs=4, force=True)
+    assert forced["written"] == forced["files"]
+
+
+def test_url_index_points_at_content_addressed_copies(tmp_path):
+    export_challenges.export(tmp_path, [], jobs=2)
+    urls = json.loads(
+        (tmp_path / "api/v2/playground/challenges/urls.json").read_bytes()
+    )
+
+    hashed = tmp_path / urls["challenges"]["double"]["es"].lstrip("/")
+    stable = tmp_path / "api/v2/playground/challenges/double.es.json"
+    assert hashed.parent.name == "assets"
+    assert hashed.read_bytes() == stable.read_bytes()
+    digest = export_challenges.sha256(hashed.read_bytes())
+    assert hashed.name == f"double.es.{digest[:export_challenges.HASH_LENGTH]}.json"
+    assert (tmp_path / urls["index"]["en"].lstrip("/")).is_file()
+
+
+def test_bundles_match_the_api_payload(tmp_path):
+    from api import catalog
+
+    export_challenges.export(tmp_path, [], jobs=2)
+    api_dir = tmp_path / "api/v2/playground/challenges"
+    chapter = export_challenges.CHALLENGES.chapters[0]["id"]
+
+    assert json.loads((api_dir / "bundle.es.json").read_bytes()) == (
+        catalog.challenge_bundle_payload("es")
+    )
+    assert json.loads((api_dir / f"bundle.{chapter}.json").read_bytes()) == (
+        catalog.challenge_bundle_payload("en", chapter)
+    )
+    urls = json.loads((api_dir / "urls.json").read_bytes())
+    assert set(urls["bundles"]) == {"all", *(
+        c["id"] for c in export_challenges.CHALLENGES.chapters
+    )}
@@ -0,0 +1,302 @@
+import asyncio
+import gzip
+import http.client
+import importlib.util
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+
+LOCAL_EDGE = (
+    Path(__file__).resolve().parents[2]
+    / "serverless" / "frontend" / "local_edge.py"
+)
+spec = importlib.util.spec_from_file_location("local_edge", LOCAL_EDGE)
+local_edge = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(local_edge)
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = []
+    release_stream = threading.Event()
+
+    def setup(self):
+        super().setup()
+        self.connections.append(self.client_address)
+
+    def do_GET(self):
+        if self.path == "/api/stream":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            self.wfile.write(b"5\r\nfirst\r\n")
+            self.release_stream.wait(5)
+            self.wfile.write(b"4\r\nlast\r\n0\r\n\r\n")
+            return
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if "chunked" in self.headers.get("Transfer-Encoding", ""):
+            body = b""
+            while size := int(self.rfile.readline(), 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin():
+    handler = type("Origin", (OriginHandler,), {
+        "connections": [], "release_stream": threading.Event(),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}"
+    handler.release_stream.set()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def file_cache():
+    return local_edge.FileCache(sendfile_min_bytes=1024)
+
+
+@pytest.fixture
+def edge(tmp_path, file_cache, origin):
+    public = tmp_path / "public"
+    challenges = public / "api/v2/playground/challenges"
+    (challenges / "assets").mkdir(parents=True)
+    (challenges / "index.json").write_text('{"challenges":[]}')
+    (challenges / "double.es.json").write_text('{"id":"double"}')
+    (challenges / "urls.json").write_text('{"index":{}}')
+    (challenges / "bundle.es.json").write_text('{"lang":"es"}')
+    (challenges / "bundle.chapter1.es.json").write_text('{"chapters":["chapter1"]}')
+    (challenges / "assets/double.es.0123456789ab.json").write_text('{"id":"double"}')
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "index.html").write_text("<html></html>")
+    (dist / "assets/app-1a2b3c.js").write_text("console.log(1)")
+
+    app = local_edge.LocalEdge(
+        dist.resolve(), public.resolve(), origin[1],
+        file_cache=file_cache, access_log=False,
+    )
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(app.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(cancel_connections())
+    loop.close()
+
+
+async def cancel_connections():
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def get(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.headers["Cache-Control"], response.read()
+
+
+def test_cache_headers_follow_object_kind(edge):
+    prefix = f"{edge}/api/v2/playground/challenges"
+
+    assert get(f"{prefix}/assets/double.es.0123456789ab.json") == (
+        local_edge.IMMUTABLE_CACHE_CONTROL, b'{"id":"double"}',
+    )
+    assert get(f"{prefix}/urls.json")[0] == local_edge.URL_INDEX_CACHE_CONTROL
+    assert get(f"{prefix}/double?lang=es") == ("no-store", b'{"id":"double"}')
+    assert get(f"{prefix}")[0] == "no-store"
+    assert get(f"{prefix}/bundle?lang=es")[1] == b'{"lang":"es"}'
+    assert get(f"{prefix}/bundle?lang=es&chapter=chapter1")[1] == (
+        b'{"chapters":["chapter1"]}'
+    )
+    assert get(f"{edge}/assets/app-1a2b3c.js")[0] == local_edge.IMMUTABLE_CACHE_CONTROL
+    assert get(f"{edge}/challenge/double")[0] == "no-store"
+
+
+def test_challenge_paths_cannot_escape_public_dir(edge, tmp_path):
+    (tmp_path / "secret.json").write_text("{}")
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        get(f"{edge}/api/v2/playground/challenges/../../../../../secret.json")
+    assert error.value.code == 404
+
+
+def fetch(url, **headers):
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers, error.read()
+
+
+def test_conditional_get_and_mtime_invalidation(edge, file_cache, tmp_path):
+    url = f"{edge}/api/v2/playground/challenges/double?lang=es"
+    status, headers, _ = fetch(url)
+    etag, last_modified = headers["ETag"], headers["Last-Modified"]
+
+    assert status == 200
+    assert fetch(url, **{"If-None-Match": etag})[0] == 304
+    assert fetch(url, **{"If-Modified-Since": last_modified})[0] == 304
+    assert fetch(url, **{"If-None-Match": '"other"'})[0] == 200
+    assert file_cache.hits >= 3
+
+    path = tmp_path / "public/api/v2/playground/challenges/double.es.json"
+    path.write_text('{"id":"double","v":2}')
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+    status, headers, body = fetch(url, **{"If-None-Match": etag})
+    assert (status, body) == (200, b'{"id":"double","v":2}')
+    assert headers["ETag"] != etag
+
+
+def test_range_requests(edge):
+    url = f"{edge}/assets/app-1a2b3c.js"
+
+    status, headers, body = fetch(url, Range="bytes=0-6")
+    assert (status, body) == (206, b"console")
+    assert headers["Content-Range"] == "bytes 0-6/14"
+    assert fetch(url, Range="bytes=-3")[2] == b"(1)"
+    assert fetch(url, Range="bytes=8-")[2] == b"log(1)"
+    assert fetch(url, Range="bytes=0-1,4-5")[0] == 200
+    assert fetch(url, Range="bytes=0-6", **{"If-Range": '"stale"'})[0] == 200
+
+    status, headers, _ = fetch(url, Range="bytes=99-")
+    assert (status, headers["Content-Range"]) == (416, "bytes */14")
+
+
+def test_large_files_are_not_held_in_memory(edge, file_cache, tmp_path):
+    content = bytes(range(256)) * 64
+    (tmp_path / "dist/assets/vendor-9f8e7d.js").write_bytes(content)
+    url = f"{edge}/assets/vendor-9f8e7d.js"
+
+    assert fetch(url)[2] == content
+    assert fetch(url, Range="bytes=1000-5999")[2] == content[1000:6000]
+    entry = file_cache.get((tmp_path / "dist/assets/vendor-9f8e7d.js").resolve())
+    assert entry.body is None
+    assert file_cache.cached_bytes < len(content)
+
+
+def test_precompressed_copy_is_served_when_accepted(edge, tmp_path):
+    path = tmp_path / "public/api/v2/playground/challenges/bundle.es.json"
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(path.read_bytes()))
+    url = f"{edge}/api/v2/playground/challenges/bundle?lang=es"
+
+    status, headers, body = fetch(url, **{"Accept-Encoding": "gzip"})
+    plain = fetch(url, **{"Accept-Encoding": "identity"})
+
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Type"] == "application/json"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == plain[2] == b'{"lang":"es"}'
+    assert plain[1]["Vary"] == "Accept-Encoding"
+    assert headers["ETag"] != plain[1]["ETag"]
+
+
+def edge_connection(edge):
+    return http.client.HTTPConnection(edge.removeprefix("http://"), timeout=5)
+
+
+def test_proxy_reuses_origin_connections(edge, origin):
+    client = edge_connection(edge)
+    for path in ("/api/one", "/api/two", "/api/three"):
+        client.request("GET", path)
+        response = client.getresponse()
+        assert response.read() == path.encode()
+
+    client.request("POST", "/api/echo", body=b"x" * 200_000)
+    response = client.getresponse()
+
+    assert (response.status, len(response.read())) == (201, 200_000)
+    assert len(origin[0].connections) == 1
+
+
+def test_proxy_streams_chunked_bodies(edge, origin):
+    client = edge_connection(edge)
+    client.request("GET", "/api/stream")
+    response = client.getresponse()
+
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    assert response.read1(64) == b"first"
+    origin[0].release_stream.set()
+    assert response.read() == b"last"
+
+    client.request(
+        "POST", "/api/echo", body=iter([b"abc", b"def"]), encode_chunked=True,
+    )
+    assert client.getresponse().read() == b"abcdef"
+
+
+async def hold_connections(port, count, path):
+    """Open ``count`` connections first, then request ``path`` on each."""
+    connections = [
+        await asyncio.open_connection("127.0.0.1", port) for _ in range(count)
+    ]
+    for _, writer in connections:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: edge\r\n\r\n".encode())
+    statuses = []
+    for reader, writer in connections:
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        statuses.append(int(head.split()[1]))
+        writer.close()
+    return statuses
+
+
+def test_many_connections_alongside_a_stream(edge, origin):
+    port = int(edge.rsplit(":", 1)[1])
+    stream = edge_connection(edge)
+    stream.request("GET", "/api/stream")
+    response = stream.getresponse()
+    assert response.read1(64) == b"first"
+
+    statuses = asyncio.run(hold_connections(
+        port, 1000, "/api/v2/playground/challenges/bundle?lang=es",
+    ))
+    origin[0].release_stream.set()
+    assert response.read() == b"last"
+
+    stats = json.loads(fetch(f"{edge}/__edge/stats.json")[2])
+    assert statuses == [200] * 1000
+    assert stats["connections"]["peak"] >= 1001
+    assert stats["requests"]["peak_streaming"] == 1
+    assert stats["requests"]["by_kind"]["static"] == 1000
+    assert stats["first_byte"]["static"]["count"] == 1000
+    assert stats["duration"]["proxy"]["max_ms"] > 0
+
+    status, headers, page = fetch(f"{edge}/__edge/stats")
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/html")
+    assert b"peak_streaming" in page